@@ -0,0 +1,114 @@
+"""
+Measure the cost of creating component instances, as done by the `{% component %}` tag
+for each rendered component, on a page with 10k components.
+
+"Eager" replicates the work that `Component.__init__` used to do for each instance - re-binding
+the render methods to the instance, and creating the outer `Context` and the component ID upfront.
+
+Usage:
+
+```sh
+python benchmarks/component_instantiation.py [--runs 10] [--components 10000]
+```
+"""
+
+import argparse
+import statistics
+import types
+from time import perf_counter
+from typing import List
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django_components"],
+    TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "DIRS": []}],
+    COMPONENTS={"autodiscover": False},
+)
+django.setup()
+
+from django.template import Context, Template  # noqa: E402
+
+from django_components import Component, registry  # noqa: E402
+from django_components.util.misc import gen_id  # noqa: E402
+
+
+class Item(Component):
+    template = "<li>{{ value }}</li>"
+
+    def get_context_data(self, value):
+        return {"value": value}
+
+
+class EagerItem(Item):
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        for method_name in (
+            "render_to_response",
+            "render",
+            "render_to_stream",
+            "arender",
+            "arender_to_response",
+            "render_to_stream_response",
+            "as_view",
+        ):
+            setattr(self, method_name, types.MethodType(getattr(type(self), method_name).__func__, self))
+        self.outer_context  # noqa: B018
+        self.component_id  # noqa: B018
+
+
+def time_instantiation(comp_cls: type, count: int, from_template: bool) -> float:
+    # Components created by the `{% component %}` tag receive the outer context and the ID
+    context = Context()
+    node_ids = [gen_id() for _ in range(count)]
+
+    start = perf_counter()
+    if from_template:
+        for node_id in node_ids:
+            comp_cls(registered_name="item", outer_context=context, component_id=node_id, registry=registry)
+    else:
+        for _ in node_ids:
+            comp_cls()
+    return perf_counter() - start
+
+
+def time_render(template: Template, count: int) -> float:
+    context = Context({"items": range(count)})
+    start = perf_counter()
+    template.render(context)
+    return perf_counter() - start
+
+
+def report(label: str, timings: List[float]) -> None:
+    print(
+        f"{label:<45} median {statistics.median(timings) * 1000:8.2f} ms"
+        f" | min {min(timings) * 1000:8.2f} ms | max {max(timings) * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per scenario")
+    parser.add_argument("--components", type=int, default=10_000, help="Number of components on the page")
+    args = parser.parse_args()
+    count = args.components
+
+    print(f"Component instantiation ({count} components, {args.runs} runs)\n")
+    report("Eager - {% component %} tag", [time_instantiation(EagerItem, count, True) for _ in range(args.runs)])
+    report("Lazy - {% component %} tag", [time_instantiation(Item, count, True) for _ in range(args.runs)])
+    report("Eager - Component()", [time_instantiation(EagerItem, count, False) for _ in range(args.runs)])
+    report("Lazy - Component()", [time_instantiation(Item, count, False) for _ in range(args.runs)])
+
+    template_str = "{% load component_tags %}{% for value in items %}{% component 'item' value=value / %}{% endfor %}"
+    print()
+    for name, comp_cls in [("Eager", EagerItem), ("Lazy", Item)]:
+        registry.register("item", comp_cls)
+        template = Template(template_str)
+        template.render(Context({"items": range(10)}))
+        report(f"{name} - render page", [time_render(template, count) for _ in range(args.runs)])
+        registry.unregister("item")
+
+
+if __name__ == "__main__":
+    main()
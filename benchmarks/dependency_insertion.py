@@ -0,0 +1,97 @@
+"""
+Measure inserting the JS and CSS into `<head>` and `<body>` of a rendered page, as done by
+`render_dependencies()` when the page doesn't use `{% component_js_dependencies %}`
+and `{% component_css_dependencies %}`.
+
+"BeautifulSoup" replicates how the dependencies used to be inserted - by parsing the whole page
+with `SoupNode` (`util/html.py`), appending the tags and serializing the page back.
+
+Usage:
+
+```sh
+python benchmarks/dependency_insertion.py [--runs 10] [--size 1000000]
+```
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+from typing import Callable, List, Optional
+
+from django_components.dependencies import _insert_js_css_to_default_locations
+from django_components.util.html import SoupNode
+
+CSS = '<link href="style.css" media="all" rel="stylesheet"><style>.xyz { color: red; }</style>'
+JS = '<script src="script.js"></script><script>console.log("xyz");</script>'
+
+ROW = """
+    <tr class="row" data-id="{i}">
+        <!-- Row {i} -->
+        <td><a href="/items/{i}/">Item {i}</a></td>
+        <td><input type="checkbox" name="item-{i}" checked></td>
+    </tr>
+"""
+
+
+def make_page(size: int) -> str:
+    rows: List[str] = []
+    rows_size = 0
+    i = 0
+    while rows_size < size:
+        row = ROW.format(i=i)
+        rows.append(row)
+        rows_size += len(row)
+        i += 1
+    return (
+        "<!DOCTYPE html><html><head><title>Items</title><script>const x = '</body>';</script></head>"
+        f"<body><table>{''.join(rows)}</table></body></html>"
+    )
+
+
+def insert_with_soup(html: str, js: str, css: str) -> Optional[str]:
+    elems = SoupNode.from_fragment(html)
+    for elem in elems:
+        if not elem.is_element():
+            continue
+        head = elem.find_tag("head")
+        if head:
+            head.append_children(SoupNode.from_fragment(css))
+        body = elem.find_tag("body")
+        if body:
+            body.append_children(SoupNode.from_fragment(js))
+    return SoupNode.to_html_multiroot(elems)
+
+
+def insert_with_scanner(html: str, js: str, css: str) -> Optional[str]:
+    # `render_dependencies()` works with bytes, so encoding is part of the cost
+    result = _insert_js_css_to_default_locations(html.encode(), js_content=js.encode(), css_content=css.encode())
+    return result.decode() if result is not None else None
+
+
+def time_insertion(insert: Callable[[str, str, str], Optional[str]], html: str) -> float:
+    start = perf_counter()
+    insert(html, JS, CSS)
+    return perf_counter() - start
+
+
+def report(label: str, timings: List[float]) -> None:
+    print(
+        f"{label:<20} median {statistics.median(timings) * 1000:9.2f} ms"
+        f" | min {min(timings) * 1000:9.2f} ms | max {max(timings) * 1000:9.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per scenario")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Approximate size of the page in bytes")
+    args = parser.parse_args()
+
+    html = make_page(args.size)
+    print(f"Insert JS and CSS to default locations ({len(html)} bytes, {args.runs} runs)\n")
+    report("BeautifulSoup", [time_insertion(insert_with_soup, html) for _ in range(args.runs)])
+    report("Scanner", [time_insertion(insert_with_scanner, html) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
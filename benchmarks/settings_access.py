@@ -0,0 +1,113 @@
+"""
+Measure the overhead of reading the `COMPONENTS` settings, which are read several times
+for each `{% component %}` tag that is rendered.
+
+"Uncached" resolves the settings anew on each access, same as before the settings were cached.
+
+Usage:
+
+```sh
+python benchmarks/settings_access.py [--runs 10] [--nodes 1000]
+```
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+from typing import Callable, List
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django_components"],
+    TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "DIRS": []}],
+    COMPONENTS={"autodiscover": False, "context_behavior": "django"},
+)
+django.setup()
+
+from django.template import Context, Template  # noqa: E402
+
+from django_components import Component, registry  # noqa: E402
+from django_components.app_settings import app_settings  # noqa: E402
+
+ACCESSES = 10_000
+
+
+class Item(Component):
+    template = "<li>{{ value }}</li>"
+
+    def get_context_data(self, value):
+        return {"value": value}
+
+
+def time_accesses(fn: Callable[[], object], uncached: bool) -> float:
+    start = perf_counter()
+    for _ in range(ACCESSES):
+        if uncached:
+            app_settings.reset()
+        fn()
+    return (perf_counter() - start) / ACCESSES
+
+
+def time_render(template: Template, nodes: int, uncached: bool) -> float:
+    context = Context({"items": range(nodes)})
+    if uncached:
+        # Resolve the settings anew each time they are read
+        original_get_resolved = type(app_settings)._get_resolved
+
+        def get_resolved(self):  # type: ignore[no-untyped-def]
+            self.reset()
+            return original_get_resolved(self)
+
+        type(app_settings)._get_resolved = get_resolved  # type: ignore[method-assign]
+    try:
+        start = perf_counter()
+        template.render(context)
+        return (perf_counter() - start) / nodes
+    finally:
+        if uncached:
+            type(app_settings)._get_resolved = original_get_resolved  # type: ignore[method-assign]
+            app_settings.reset()
+
+
+def report(label: str, timings: List[float]) -> None:
+    print(
+        f"{label:<50} median {statistics.median(timings) * 1e6:8.2f} us"
+        f" | min {min(timings) * 1e6:8.2f} us | max {max(timings) * 1e6:8.2f} us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per scenario")
+    parser.add_argument("--nodes", type=int, default=1000, help="Number of `{% component %}` tags to render")
+    args = parser.parse_args()
+
+    registry.register("item", Item)
+    template = Template(
+        "{% load component_tags %}<ul>{% for value in items %}{% component 'item' value=value / %}{% endfor %}</ul>"
+    )
+    # Warm up the template and component caches
+    template.render(Context({"items": range(10)}))
+
+    scenarios = [
+        (
+            "app_settings.CONTEXT_BEHAVIOR",
+            lambda uncached: time_accesses(lambda: app_settings.CONTEXT_BEHAVIOR, uncached),
+        ),
+        (
+            "registry.settings.context_behavior",
+            lambda uncached: time_accesses(lambda: registry.settings.context_behavior, uncached),
+        ),
+        ("{% component %} render (per node)", lambda uncached: time_render(template, args.nodes, uncached)),
+    ]
+
+    print(f"Settings access ({args.runs} runs, {ACCESSES} accesses, {args.nodes} nodes)\n")
+    for label, scenario in scenarios:
+        report(f"{label} - uncached", [scenario(True) for _ in range(args.runs)])
+        report(f"{label} - cached", [scenario(False) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
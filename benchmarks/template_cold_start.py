@@ -0,0 +1,108 @@
+"""
+Measure how long a fresh worker process of the `sampleproject` takes to serve its first requests,
+with and without the persistent template cache (`COMPONENTS.template_cache_dir`).
+
+Each run is a new Python process, so nothing is shared between the runs except the cache directory.
+
+Usage:
+
+```sh
+python benchmarks/template_cold_start.py [--runs 10]
+```
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+SAMPLEPROJECT_DIR = Path(__file__).resolve().parent.parent / "sampleproject"
+
+URLS = [
+    "/",
+    "/greeting/",
+    "/calendar/",
+    "/calendar-relative/",
+    "/calendar-nested/",
+    "/fragment/base/alpine",
+    "/fragment/base/htmx",
+    "/fragment/base/js",
+    "/fragment/frag/alpine",
+    "/fragment/frag/js",
+]
+
+# Runs inside the fresh process. Prints the time (in seconds) it took to serve the first requests.
+CHILD_SCRIPT = """
+import json
+import os
+import sys
+from time import perf_counter
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sampleproject.settings")
+
+import django
+from django.conf import settings
+
+cache_dir = sys.argv[1] or None
+settings.COMPONENTS = settings.COMPONENTS._replace(template_cache_dir=cache_dir)
+settings.ALLOWED_HOSTS = ["*"]
+settings.LOGGING = {"version": 1, "disable_existing_loggers": True}
+
+django.setup()
+
+from django.test import Client
+
+# Render errors (e.g. missing optional middleware) don't matter here, only that the templates were compiled
+client = Client(raise_request_exception=False)
+urls = json.loads(sys.argv[2])
+
+start = perf_counter()
+for url in urls:
+    client.get(url)
+print(perf_counter() - start)
+"""
+
+
+def run_worker(cache_dir: Optional[Path]) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, str(cache_dir) if cache_dir else "", json.dumps(URLS)],
+        cwd=SAMPLEPROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def report(label: str, timings: List[float]) -> None:
+    print(
+        f"{label:<40} median {statistics.median(timings) * 1000:8.2f} ms"
+        f" | min {min(timings) * 1000:8.2f} ms | max {max(timings) * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of fresh processes per scenario")
+    args = parser.parse_args()
+
+    without_cache = [run_worker(None) for _ in range(args.runs)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir)
+        # First worker populates the cache
+        populate = [run_worker(cache_dir)]
+        with_cache = [run_worker(cache_dir) for _ in range(args.runs)]
+
+    print(f"First requests of a fresh sampleproject worker ({len(URLS)} URLs, {args.runs} runs)\n")
+    report("Without template_cache_dir", without_cache)
+    report("With template_cache_dir (populating)", populate)
+    report("With template_cache_dir (warm)", with_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@
 from django_components.app_settings import ContextBehavior, ComponentsSettings
 from django_components.autodiscovery import autodiscover, import_libraries
 from django_components.component import Component, ComponentVars, ComponentView
+from django_components.component_cache import invalidate_cache_tags
 from django_components.component_registry import (
     AlreadyRegistered,
     ComponentRegistry,
@@ -16,7 +17,15 @@ from django_components.component_registry import (
     registry,
 )
 from django_components.components import DynamicComponent
-from django_components.dependencies import render_dependencies
+from django_components.dataloader import LoadedValue
+from django_components.dependencies import (
+    ComponentMediaCacheABC,
+    DjangoCacheComponentMediaCache,
+    FileSystemComponentMediaCache,
+    InMemoryComponentMediaCache,
+    render_dependencies,
+    render_dependencies_stream,
+)
 from django_components.library import TagProtectedError
 from django_components.slots import SlotContent, Slot, SlotFunc, SlotRef, SlotResult
 from django_components.tag_formatter import (
@@ -31,6 +40,7 @@ from django_components.template import cached_template
 import django_components.types as types
 from django_components.util.loader import ComponentFileEntry, get_component_dirs, get_component_files
 from django_components.util.types import EmptyTuple, EmptyDict
+from django_components.warmup import WarmupResult, warmup
 
 # isort: on
 
@@ -44,22 +54,29 @@ __all__ = [
     "Component",
     "ComponentFileEntry",
     "ComponentFormatter",
+    "ComponentMediaCacheABC",
     "ComponentRegistry",
     "ComponentVars",
     "ComponentView",
     "component_formatter",
     "component_shorthand_formatter",
+    "DjangoCacheComponentMediaCache",
     "DynamicComponent",
     "EmptyTuple",
     "EmptyDict",
+    "FileSystemComponentMediaCache",
     "get_component_dirs",
     "get_component_files",
     "import_libraries",
+    "InMemoryComponentMediaCache",
+    "invalidate_cache_tags",
+    "LoadedValue",
     "NotRegistered",
     "register",
     "registry",
     "RegistrySettings",
     "render_dependencies",
+    "render_dependencies_stream",
     "ShorthandComponentFormatter",
     "SlotContent",
     "Slot",
@@ -70,4 +87,6 @@ __all__ = [
     "TagProtectedError",
     "TagResult",
     "types",
+    "warmup",
+    "WarmupResult",
 ]
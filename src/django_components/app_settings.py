@@ -5,7 +5,9 @@ from os import PathLike
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
+    Dict,
     Generic,
     List,
     Literal,
@@ -23,6 +25,7 @@ from django.conf import settings
 from django_components.util.misc import default
 
 if TYPE_CHECKING:
+    from django_components.dependencies import ComponentMediaCacheABC
     from django_components.tag_formatter import TagFormatterABC
 
 
@@ -212,6 +215,38 @@ class ComponentsSettings(NamedTuple):
     ```
     """
 
+    bundle_dependencies: Optional[bool] = None
+    """
+    Serve the [`Component.js`](../api#django_components.Component.js) and
+    [`Component.css`](../api#django_components.Component.css) of the components rendered on a page
+    as a single JS file and a single CSS file, instead of inlining them into the HTML.
+
+    Defaults to `False`.
+
+    By default, when rendering a full page (`type="document"`), each component's JS and CSS is inlined
+    into the HTML in its own `<script>` and `<style>` tag. So the same JS and CSS is sent again
+    with every page, and the browser can't cache it.
+
+    When `bundle_dependencies` is `True`, the JS and CSS of all components on the page are concatenated
+    into a bundle, which is referenced with a single `<script src>` and `<link>` tag. The bundles are
+    served from the same endpoint as the components' JS and CSS (`/components/cache/`), and their URLs
+    contain a hash of their content. Pages that render the same components share the same bundles.
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        bundle_dependencies=True,
+    )
+    ```
+
+    !!! note
+
+        Same as the components' JS and CSS, the bundles are created when the page is rendered,
+        and kept in the [media cache](../settings#django_components.app_settings.ComponentsSettings.media_cache).
+
+        Also, when the JS of one component raises an error, the JS of the components that come
+        after it in the bundle is not executed.
+    """
+
     context_behavior: Optional[ContextBehaviorType] = None
     """
     Configure whether, inside a component template, you can use variables from the outside
@@ -239,6 +274,33 @@ class ComponentsSettings(NamedTuple):
     > [here](https://github.com/EmilStenstrom/django-components/issues/498).
     """
 
+    deterministic_ids: Optional[bool] = None
+    """
+    Generate the IDs of components and template tags deterministically, instead of randomly.
+
+    Defaults to `False`.
+
+    Each `{% component %}` tag gets an ID when its template is parsed. These IDs are
+    available as [`Component.component_id`](../api#django_components.Component.component_id),
+    and may end up in the rendered HTML.
+
+    By default the IDs are random, so the same page renders into a different HTML
+    in each process. When `deterministic_ids` is `True`, the IDs are derived from the template
+    and the position of the tag within it, and IDs generated during the render are derived from
+    their order in the render. So the same inputs render into byte-identical HTML, which allows
+    to cache the responses with ETags or in HTTP caches.
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        deterministic_ids=True,
+    )
+    ```
+
+    !!! note
+
+        Templates that were parsed before this setting was changed keep their IDs.
+    """
+
     dynamic_component_name: Optional[str] = None
     """
     By default, the [dynamic component](../components#django_components.components.dynamic.DynamicComponent)
@@ -310,6 +372,45 @@ class ComponentsSettings(NamedTuple):
     ```
     """
 
+    media_cache: Optional[Union["ComponentMediaCacheABC", str]] = None
+    """
+    Configure where the JS and CSS of the components is stored, so it can be served
+    from the `/components/cache/` endpoint.
+
+    Expects an instance of [`ComponentMediaCacheABC`](../api#django_components.ComponentMediaCacheABC),
+    or an import string to an instance.
+
+    Defaults to [`InMemoryComponentMediaCache`](../api#django_components.InMemoryComponentMediaCache),
+    which keeps the JS and CSS in the memory of the process that rendered the component.
+    So when you run multiple processes (e.g. several gunicorn workers or pods), a page rendered
+    by one process may reference JS or CSS that the other processes don't know about.
+
+    To share the JS and CSS between the processes, use one of the built-in backends:
+
+    - [`DjangoCacheComponentMediaCache`](../api#django_components.DjangoCacheComponentMediaCache)
+      stores the JS and CSS in one of Django's [caches](https://docs.djangoproject.com/en/5.1/topics/cache/),
+      e.g. Redis or Memcached.
+
+    - [`FileSystemComponentMediaCache`](../api#django_components.FileSystemComponentMediaCache)
+      stores the JS and CSS as files in a directory.
+
+    ```python
+    from django_components import ComponentsSettings, DjangoCacheComponentMediaCache
+
+    COMPONENTS = ComponentsSettings(
+        media_cache=DjangoCacheComponentMediaCache("default"),
+    )
+    ```
+
+    or
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        media_cache="mysite.components.media_cache",
+    )
+    ```
+    """
+
     multiline_tags: Optional[bool] = None
     """
     Enable / disable
@@ -565,6 +666,61 @@ class ComponentsSettings(NamedTuple):
     ```
     """
 
+    template_cache_dir: Optional[Union[str, PathLike]] = None
+    """
+    Directory where the parsed Django templates are persisted between server restarts.
+
+    Defaults to `None` (disabled).
+
+    Each new worker process (e.g. after a deploy, or when autoscaling) normally has to lex and parse
+    all templates again before it can render them. When `template_cache_dir` is set, the parsed node trees
+    are pickled to this directory the first time a template is compiled, and subsequent processes
+    load them from there instead of parsing the template source again.
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        template_cache_dir=BASE_DIR / ".template_cache",
+    )
+    ```
+
+    The cache entries are keyed by the template source, the tags and filters available to the template engine,
+    and the versions of django-components, Django and Python. So a changed template never loads a stale entry.
+    Old entries are not removed automatically, it's safe to delete the directory at any time.
+
+    Templates whose nodes cannot be pickled (e.g. third-party tags that hold lambdas) are silently
+    parsed as usual.
+
+    !!! warning
+
+        The cache files are loaded with `pickle`. Make sure the directory is writable only
+        by the user that runs the server.
+    """
+
+    type_validation: Optional[Union[bool, float]] = None
+    """
+    Configure how often the inputs and outputs of typed components are validated at runtime.
+
+    Defaults to `True`.
+
+    When a component is defined with types, e.g. `Component[Args, Kwargs, Slots, Data, JsData, CssData]`,
+    then on each render the args, kwargs, slots, and the data returned from
+    [`get_context_data()`](../api#django_components.Component.get_context_data)
+    are checked against these types. See [Runtime input validation with types](
+    ../../concepts/advanced/typing_and_validation/#runtime-input-validation-with-types).
+
+    - `True` - Validate on every render.
+    - `False` - Never validate.
+    - A number between `0` and `1` - Validate only the given fraction of the renders, chosen at random.
+
+    For example, to keep the validation in development, but check only 1% of the renders in production:
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        type_validation=True if DEBUG else 0.01,
+    )
+    ```
+    """
+
 
 # NOTE: Some defaults depend on the Django settings, which may not yet be
 # initialized at the time that these settings are generated. For such cases
@@ -589,13 +745,16 @@ class Dynamic(Generic[T]):
 # --snippet:defaults--
 defaults = ComponentsSettings(
     autodiscover=True,
+    bundle_dependencies=False,
     context_behavior=ContextBehavior.DJANGO.value,  # "django" | "isolated"
     # Root-level "components" dirs, e.g. `/path/to/proj/components/`
     dirs=Dynamic(lambda: [Path(settings.BASE_DIR) / "components"]),  # type: ignore[arg-type]
     # App-level "components" dirs, e.g. `[app]/components/`
     app_dirs=["components"],
+    deterministic_ids=False,
     dynamic_component_name="dynamic",
     libraries=[],  # E.g. ["mysite.components.forms", ...]
+    media_cache="django_components.dependencies.comp_media_cache",
     multiline_tags=True,
     reload_on_file_change=False,
     static_files_allowed=[
@@ -616,22 +775,82 @@ defaults = ComponentsSettings(
     ],
     tag_formatter="django_components.component_formatter",
     template_cache_size=128,
+    template_cache_dir=None,
+    type_validation=True,  # True | False | 0.0 - 1.0
 )
 # --endsnippet:defaults--
 # fmt: on
 
 
+def _cached_setting(getter: Callable[["InternalSettings"], T]) -> T:
+    """
+    Resolve the setting only once, until the settings change. See `InternalSettings`.
+    """
+    name = getter.__name__
+
+    def cached_getter(self: "InternalSettings") -> T:
+        resolved = self._get_resolved()
+        if name not in resolved:
+            resolved[name] = getter(self)
+        return resolved[name]
+
+    return cast(T, property(cached_getter, doc=getter.__doc__))
+
+
 class InternalSettings:
+    """
+    Resolved values of the [`COMPONENTS`](../settings) settings.
+
+    The values are resolved on first access, and then reused until the Django settings change.
+    The changes are detected from Django's `setting_changed` signal (e.g. when using
+    `override_settings()` in tests), or when the `COMPONENTS` setting is replaced with another object.
+
+    NOTE: Modifying the `COMPONENTS` setting in place is NOT detected, call `reset()` after doing so.
+    """
+
+    def __init__(self) -> None:
+        self._settings_input: Any = None
+        self._settings_snapshot: Optional[ComponentsSettings] = None
+        self._resolved: Dict[str, Any] = {}
+        self._version = 0
+
+    def reset(self) -> None:
+        """Discard the resolved settings, so they are resolved again on next access."""
+        self._settings_input = None
+        self._settings_snapshot = None
+        self._resolved = {}
+        self._version += 1
+
     @property
-    def _settings(self) -> ComponentsSettings:
+    def version(self) -> int:
+        """Incremented each time the settings change. Use it to invalidate values derived from the settings."""
+        self._get_resolved()
+        return self._version
+
+    def _get_resolved(self) -> Dict[str, Any]:
         data = getattr(settings, "COMPONENTS", {})
-        return ComponentsSettings(**data) if not isinstance(data, ComponentsSettings) else data
+        # NOTE: Only the identity is checked, so that accessing the settings stays cheap.
+        #       Other changes are handled by `reset()`, called on the `setting_changed` signal.
+        if self._settings_snapshot is None or data is not self._settings_input:
+            self.reset()
+            self._settings_input = data
+            self._settings_snapshot = ComponentsSettings(**data) if not isinstance(data, ComponentsSettings) else data
+        return self._resolved
 
     @property
+    def _settings(self) -> ComponentsSettings:
+        self._get_resolved()
+        return cast(ComponentsSettings, self._settings_snapshot)
+
+    @_cached_setting
     def AUTODISCOVER(self) -> bool:
         return default(self._settings.autodiscover, cast(bool, defaults.autodiscover))
 
-    @property
+    @_cached_setting
+    def BUNDLE_DEPENDENCIES(self) -> bool:
+        return default(self._settings.bundle_dependencies, cast(bool, defaults.bundle_dependencies))
+
+    @_cached_setting
     def DIRS(self) -> Sequence[Union[str, PathLike, Tuple[str, str], Tuple[str, PathLike]]]:
         # For DIRS we use a getter, because default values uses Django settings,
         # which may not yet be initialized at the time these settings are generated.
@@ -639,23 +858,36 @@ class InternalSettings:
         default_dirs = default_fn.getter()
         return default(self._settings.dirs, default_dirs)
 
-    @property
+    @_cached_setting
     def APP_DIRS(self) -> Sequence[str]:
         return default(self._settings.app_dirs, cast(List[str], defaults.app_dirs))
 
-    @property
+    @_cached_setting
+    def DETERMINISTIC_IDS(self) -> bool:
+        return default(self._settings.deterministic_ids, cast(bool, defaults.deterministic_ids))
+
+    @_cached_setting
     def DYNAMIC_COMPONENT_NAME(self) -> str:
         return default(self._settings.dynamic_component_name, cast(str, defaults.dynamic_component_name))
 
+    # NOTE: Not cached, because it's read only when the libraries are imported. This way it also reflects
+    #       modifications like `settings.COMPONENTS["libraries"] = [...]`.
     @property
     def LIBRARIES(self) -> List[str]:
-        return default(self._settings.libraries, cast(List[str], defaults.libraries))
+        data = getattr(settings, "COMPONENTS", {})
+        libraries = data.get("libraries", None) if isinstance(data, dict) else data.libraries
+        return default(libraries, cast(List[str], defaults.libraries))
 
-    @property
+    @_cached_setting
+    def MEDIA_CACHE(self) -> Union["ComponentMediaCacheABC", str]:
+        media_cache = default(self._settings.media_cache, cast(str, defaults.media_cache))
+        return cast(Union["ComponentMediaCacheABC", str], media_cache)
+
+    @_cached_setting
     def MULTILINE_TAGS(self) -> bool:
         return default(self._settings.multiline_tags, cast(bool, defaults.multiline_tags))
 
-    @property
+    @_cached_setting
     def RELOAD_ON_FILE_CHANGE(self) -> bool:
         val = self._settings.reload_on_file_change
         # TODO_REMOVE_IN_V1
@@ -664,15 +896,20 @@ class InternalSettings:
 
         return default(val, cast(bool, defaults.reload_on_file_change))
 
-    @property
+    @_cached_setting
     def TEMPLATE_CACHE_SIZE(self) -> int:
         return default(self._settings.template_cache_size, cast(int, defaults.template_cache_size))
 
-    @property
+    @_cached_setting
+    def TEMPLATE_CACHE_DIR(self) -> Optional[Path]:
+        cache_dir = default(self._settings.template_cache_dir, defaults.template_cache_dir)
+        return Path(cache_dir) if cache_dir is not None else None
+
+    @_cached_setting
     def STATIC_FILES_ALLOWED(self) -> Sequence[Union[str, re.Pattern]]:
         return default(self._settings.static_files_allowed, cast(List[str], defaults.static_files_allowed))
 
-    @property
+    @_cached_setting
     def STATIC_FILES_FORBIDDEN(self) -> Sequence[Union[str, re.Pattern]]:
         val = self._settings.static_files_forbidden
         # TODO_REMOVE_IN_V1
@@ -681,7 +918,7 @@ class InternalSettings:
 
         return default(val, cast(List[str], defaults.static_files_forbidden))
 
-    @property
+    @_cached_setting
     def CONTEXT_BEHAVIOR(self) -> ContextBehavior:
         raw_value = cast(str, default(self._settings.context_behavior, defaults.context_behavior))
         return self._validate_context_behavior(raw_value)
@@ -693,10 +930,24 @@ class InternalSettings:
             valid_values = [behavior.value for behavior in ContextBehavior]
             raise ValueError(f"Invalid context behavior: {raw_value}. Valid options are {valid_values}")
 
-    @property
+    @_cached_setting
     def TAG_FORMATTER(self) -> Union["TagFormatterABC", str]:
         tag_formatter = default(self._settings.tag_formatter, cast(str, defaults.tag_formatter))
         return cast(Union["TagFormatterABC", str], tag_formatter)
 
+    @_cached_setting
+    def TYPE_VALIDATION(self) -> float:
+        raw_value = default(self._settings.type_validation, cast(bool, defaults.type_validation))
+        return self._validate_type_validation(raw_value)
+
+    def _validate_type_validation(self, raw_value: Union[bool, float]) -> float:
+        if isinstance(raw_value, bool):
+            return 1.0 if raw_value else 0.0
+        if isinstance(raw_value, (int, float)) and 0 <= raw_value <= 1:
+            return float(raw_value)
+        raise ValueError(
+            f"Invalid type validation: {raw_value}. Valid options are True, False, or a number from 0 to 1"
+        )
+
 
 app_settings = InternalSettings()
@@ -3,7 +3,9 @@ from pathlib import Path
 from typing import Any
 
 from django.apps import AppConfig
+from django.core.signals import setting_changed
 from django.template import Template
+from django.templatetags.cache import CacheNode
 from django.utils.autoreload import file_changed, trigger_reload
 
 
@@ -18,18 +20,33 @@ class ComponentsConfig(AppConfig):
         from django_components.component import monkeypatch_template
         from django_components.component_registry import registry
         from django_components.components.dynamic import DynamicComponent
+        from django_components.dependencies import monkeypatch_cache_node
 
         # NOTE: This monkeypatch is applied here, before Django processes any requests.
         #       To make django-components work with django-debug-toolbar-template-profiler
         #       See https://github.com/EmilStenstrom/django-components/discussions/819
         monkeypatch_template(Template)
 
+        # HTML cached with the `{% cache %}` tag must be marked with the components that were rendered in it
+        monkeypatch_cache_node(CacheNode)
+
+        # Load the parsed templates from disk, so that new worker processes don't have to parse them again.
+        if app_settings.TEMPLATE_CACHE_DIR is not None:
+            from django_components.template import monkeypatch_template_compile
+
+            monkeypatch_template_compile(Template)
+
         # Import modules set in `COMPONENTS.libraries` setting
         import_libraries()
 
         if app_settings.AUTODISCOVER:
             autodiscover()
 
+        # Templates defined statically on component classes are compiled only once, and bound
+        # to the class. Discard them when template files or settings change.
+        file_changed.connect(_on_file_changed)
+        setting_changed.connect(_on_setting_changed)
+
         # Auto-reload Django dev server when any component files changes
         # See https://github.com/EmilStenstrom/django-components/discussions/567#discussioncomment-10273632
         if app_settings.RELOAD_ON_FILE_CHANGE:
@@ -70,3 +87,21 @@ def _watch_component_files_for_autoreload() -> None:
                 return
 
     file_changed.connect(template_changed)
+
+
+def _on_file_changed(sender: Any, file_path: Path, **kwargs: Any) -> None:
+    from django_components.component import invalidate_bound_templates
+    from django_components.dependencies import invalidate_media_tags
+
+    invalidate_bound_templates()
+    invalidate_media_tags()
+
+
+def _on_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    from django_components.app_settings import app_settings
+    from django_components.component import invalidate_bound_templates
+    from django_components.dependencies import invalidate_media_tags
+
+    app_settings.reset()
+    invalidate_bound_templates()
+    invalidate_media_tags()
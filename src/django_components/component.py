@@ -1,18 +1,23 @@
+import asyncio
+import functools
 import inspect
 import types
 from collections import deque
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+from copy import copy
 from dataclasses import dataclass
+from random import random
 from typing import (
     Any,
+    Awaitable,
     Callable,
     ClassVar,
     Deque,
     Dict,
     Generator,
     Generic,
+    Iterator,
     List,
-    Literal,
     Mapping,
     NamedTuple,
     Optional,
@@ -24,28 +29,74 @@ from typing import (
     cast,
 )
 
+from asgiref.sync import async_to_sync, markcoroutinefunction, sync_to_async
 from django.core.exceptions import ImproperlyConfigured
 from django.forms.widgets import Media
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.template.base import NodeList, Template, TextNode
 from django.template.context import Context, RequestContext
 from django.template.loader import get_template
-from django.template.loader_tags import BLOCK_CONTEXT_KEY
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+from django.utils.decorators import classonlymethod
 from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
 from django.views import View
 
-from django_components.app_settings import ContextBehavior
+from django_components.app_settings import ContextBehavior, app_settings
+from django_components.component_cache import (
+    ComponentCacheInput,
+    get_render_cache_entry,
+    load_cached_render,
+    save_cached_render,
+)
 from django_components.component_media import ComponentMediaInput, MediaMeta
 from django_components.component_registry import ComponentRegistry
 from django_components.component_registry import registry as registry_
 from django_components.context import (
     _COMPONENT_SLOT_CTX_CONTEXT_KEY,
+    _FILL_VARS_LAYER_CONTEXT_KEY,
     _REGISTRY_CONTEXT_KEY,
     _ROOT_CTX_CONTEXT_KEY,
+    AsyncRenders,
+    BatchedRenders,
+    end_batched_renders,
+    end_render,
+    gen_render_id,
+    get_async_renders,
+    get_batched_renders,
+    get_deferred_renders,
     get_injected_context_var,
+    get_pure_renders_memo,
+    init_async_renders,
+    init_deferred_renders,
     make_isolated_context_copy,
+    start_batched_renders,
+    start_render,
+)
+from django_components.dataloader import (
+    LoadedValue,
+    LoaderFn,
+    count_loads,
+    dispatch_loads,
+    has_pending_loads,
+    load,
+    resolve_loads,
+)
+from django_components.dependencies import (
+    Dependencies,
+    MediaTags,
+    RenderType,
+    _insert_component_comment,
+    _render_dependencies,
+    cache_inlined_css,
+    cache_inlined_js,
+    collect_dependencies,
+    get_dependency_collector,
+    pause_dependency_collector,
+    postprocess_component_html,
+    record_component,
+    render_dependencies_stream,
 )
-from django_components.dependencies import RenderType, cache_inlined_css, cache_inlined_js, postprocess_component_html
 from django_components.expression import Expression, RuntimeKwargs, safe_resolve_list
 from django_components.node import BaseNode
 from django_components.slots import (
@@ -59,12 +110,13 @@ from django_components.slots import (
     SlotResult,
     _is_extracting_fill,
     _nodelist_to_slot_render_func,
+    analyze_fills,
     resolve_fills,
 )
-from django_components.template import cached_template
+from django_components.template import cached_template, parsing_component_template
 from django_components.util.logger import trace_msg
 from django_components.util.misc import gen_id
-from django_components.util.validation import validate_typed_dict, validate_typed_tuple
+from django_components.util.validation import TypeValidator, compile_dict_validator, compile_tuple_validator
 
 # TODO_REMOVE_IN_V1 - Users should use top-level import instead
 # isort: off
@@ -77,6 +129,19 @@ from django_components.component_registry import registry as registry  # NOQA
 # isort: on
 
 COMP_ONLY_FLAG = "only"
+COMP_DEFER_FLAG = "defer"
+
+# When streaming, components with the `defer` flag are first rendered as a placeholder.
+# Their content is sent at the end of the stream, and swapped in by the client-side manager.
+DEFER_PLACEHOLDER = '<template data-djc-defer="{id}"></template>'
+DEFERRED_CONTENT = (
+    '<template data-djc-deferred="{id}">{content}</template>'
+    '<script>Components.manager.swapDeferred("{id}");</script>'
+)
+# With `Component.arender()`, components with async `get_context_data()` are first rendered as a placeholder.
+# Once their data is fetched, they are rendered, and their HTML replaces the placeholder.
+ASYNC_PLACEHOLDER = "<!-- _ASYNC {id} -->"
+BATCHED_PLACEHOLDER = "<!-- _BATCHED {id} -->"
 
 # Define TypeVars for args and kwargs
 ArgsType = TypeVar("ArgsType", bound=tuple, contravariant=True)
@@ -153,8 +218,51 @@ class ComponentVars(NamedTuple):
     """
 
 
+class _ClassOrInstanceMethod:
+    """
+    Same as `classmethod`, but when accessed on an instance, the method is bound to the instance.
+
+    So `MyComp.render()` receives the class, while `MyComp(registered_name="abc").render()`
+    receives the already-instantiated object.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.__func__ = func
+        functools.update_wrapper(self, func)  # type: ignore[arg-type]
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        return types.MethodType(self.__func__, owner if instance is None else instance)
+
+
+# Methods that can be called both on the component class and on its instance
+_CLASS_OR_INSTANCE_METHODS = (
+    "as_view",
+    "render",
+    "render_to_response",
+    "render_to_stream",
+    "render_to_stream_response",
+    "arender",
+    "arender_to_response",
+)
+
+
 class ComponentMeta(MediaMeta):
     def __new__(mcs, name: str, bases: Tuple[Type, ...], attrs: Dict[str, Any]) -> Type:
+        # NOTE: When user first instantiates the component class before calling
+        # `render` or `render_to_response`, then we want to allow the render
+        # function to make use of the instantiated object.
+        #
+        # So while `MyComp.render()` creates a new instance of MyComp internally,
+        # if we do `MyComp(registered_name="abc").render()`, then we use the
+        # already-instantiated object.
+        #
+        # We do so by replacing the class methods with descriptors, which is cheaper
+        # than re-binding the methods each time the component is instantiated.
+        for method_name in _CLASS_OR_INSTANCE_METHODS:
+            method = attrs.get(method_name, None)
+            if isinstance(method, classmethod):
+                attrs[method_name] = _ClassOrInstanceMethod(method.__func__)
+
         # NOTE: Skip template/media file resolution when then Component class ITSELF
         # is being created.
         if "__module__" in attrs and attrs["__module__"] == "django_components.component":
@@ -173,6 +281,7 @@ class ComponentViewMeta(type):
                 component: "Component" = self.component
                 return getattr(component, method)(request, *args, **kwargs)
 
+            handler._djc_calls_component = True  # type: ignore[attr-defined]
             return handler
 
         # Add methods to the class
@@ -197,6 +306,38 @@ class ComponentView(View, metaclass=ComponentViewMeta):
         super().__init__(**kwargs)
         self.component = component
 
+    @classonlymethod
+    def as_view(cls, **initkwargs: Any) -> Callable[..., Any]:
+        view = super().as_view(**initkwargs)
+
+        # The handlers defined on the component, e.g. `async def get(self, request)`, may be async.
+        # Django decides whether the view is async based on the handlers on the View class,
+        # which are sync, because they only call the component's handlers.
+        component: Optional["Component"] = initkwargs.get("component", None)
+        if cls.view_is_async or component is None:
+            return view
+
+        async_methods = {
+            method
+            for method in cls.http_method_names
+            if getattr(getattr(cls, method, None), "_djc_calls_component", False)
+            and inspect.iscoroutinefunction(getattr(component, method, None))
+        }
+        if not async_methods:
+            return view
+
+        sync_view = view
+
+        async def async_view(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+            if request.method and request.method.lower() in async_methods:
+                return await sync_view(request, *args, **kwargs)
+            return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+        async_view.__dict__.update(sync_view.__dict__)
+        async_view.__doc__ = sync_view.__doc__
+        markcoroutinefunction(async_view)
+        return async_view
+
 
 class Component(
     Generic[ArgsType, KwargsType, SlotsType, DataType, JsDataType, CssDataType],
@@ -261,7 +402,32 @@ class Component(
 
     response_class = HttpResponse
     """This allows to configure what class is used to generate response from `render_to_response`"""
+    streaming_response_class = StreamingHttpResponse
+    """This allows to configure what class is used to generate response from `render_to_stream_response`"""
     View = ComponentView
+    Cache = ComponentCacheInput
+    """Defines whether and how the rendered output of this component is cached."""
+
+    pure: ClassVar[bool] = False
+    """
+    Set this to `True` if the component's output depends ONLY on its args and kwargs.
+
+    When a pure component is rendered multiple times with the same args and kwargs (and without slot fills)
+    within a single render, e.g. an icon inside a table with many rows, it is rendered only once,
+    and the HTML is reused.
+
+    Pure components must NOT use the outer context, `self.inject()`, or other side effects
+    that could make the output differ between renders.
+
+    ```py
+    class Icon(Component):
+        pure = True
+        template = '<svg class="icon icon-{{ name }}">...</svg>'
+
+        def get_context_data(self, name):
+            return {"name": name}
+    ```
+    """
 
     # #####################################
     # PUBLIC API - HOOKS
@@ -293,6 +459,8 @@ class Component(
     # #####################################
 
     _class_hash: ClassVar[int]
+    _template_binding: ClassVar[Optional["TemplateBinding"]] = None
+    _media_tags: ClassVar[Optional["MediaTags"]] = None
 
     def __init__(
         self,
@@ -301,28 +469,16 @@ class Component(
         outer_context: Optional[Context] = None,
         registry: Optional[ComponentRegistry] = None,  # noqa F811
     ):
-        # When user first instantiates the component class before calling
-        # `render` or `render_to_response`, then we want to allow the render
-        # function to make use of the instantiated object.
-        #
-        # So while `MyComp.render()` creates a new instance of MyComp internally,
-        # if we do `MyComp(registered_name="abc").render()`, then we use the
-        # already-instantiated object.
-        #
-        # To achieve that, we want to re-assign the class methods as instance methods.
-        # For that we have to "unwrap" the class methods via __func__.
-        # See https://stackoverflow.com/a/76706399/9788634
-        self.render_to_response = types.MethodType(self.__class__.render_to_response.__func__, self)  # type: ignore
-        self.render = types.MethodType(self.__class__.render.__func__, self)  # type: ignore
-        self.as_view = types.MethodType(self.__class__.as_view.__func__, self)  # type: ignore
-
+        # NOTE: The methods like `render()` are bound to the instance by `ComponentMeta`.
         self.registered_name: Optional[str] = registered_name
-        self.outer_context: Context = outer_context or Context()
-        self.component_id = component_id or gen_id()
+        # NOTE: Outer context and ID are created only when needed, as components
+        # created by the `{% component %}` tag always receive them.
+        self._outer_context: Optional[Context] = outer_context
+        self._component_id: Optional[str] = component_id
         self.registry = registry or registry_
         self._render_stack: Deque[RenderStackItem[ArgsType, KwargsType, SlotsType]] = deque()
-        # None == uninitialized, False == No types, Tuple == types
-        self._types: Optional[Union[Tuple[Any, Any, Any, Any, Any, Any], Literal[False]]] = None
+        # Set by `arender()`, wrapped in a tuple so `None` can be a valid value
+        self._prefetched_context_data: Optional[Tuple[Any]] = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         cls._class_hash = hash(inspect.getfile(cls) + cls.__name__)
@@ -331,6 +487,26 @@ class Component(
     def name(self) -> str:
         return self.registered_name or self.__class__.__name__
 
+    @property
+    def outer_context(self) -> Context:
+        if self._outer_context is None:
+            self._outer_context = Context()
+        return self._outer_context
+
+    @outer_context.setter
+    def outer_context(self, value: Context) -> None:
+        self._outer_context = value
+
+    @property
+    def component_id(self) -> str:
+        if self._component_id is None:
+            self._component_id = gen_id()
+        return self._component_id
+
+    @component_id.setter
+    def component_id(self, value: str) -> None:
+        self._component_id = value
+
     @property
     def input(self) -> RenderInput[ArgsType, KwargsType, SlotsType]:
         """
@@ -371,6 +547,36 @@ class Component(
     # of Template is reused. This is important to keep in mind, because the implication
     # is that we should treat Templates AND their nodelists as IMMUTABLE.
     def _get_template(self, context: Context) -> Template:
+        # Fast path - If the template is defined statically on the class, then we resolve it
+        # only once, and reuse the compiled Template for all subsequent renders.
+        template = self._get_bound_template()
+        if template is not None:
+            return template
+
+        return self._resolve_template(context)
+
+    def _get_bound_template(self) -> Optional[Template]:
+        """
+        Get the compiled Template that's bound to this component's class.
+
+        Returns `None` if the template is NOT static, e.g. if the component defines
+        `get_template()` or `get_template_name()`, or if the template was set on the instance.
+        """
+        comp_cls = type(self)
+        binding: Optional[TemplateBinding] = comp_cls.__dict__.get("_template_binding", None)
+        if binding is None or binding.version != _template_binding_version:
+            binding = _bind_template(comp_cls)
+
+        if binding.template is None:
+            return None
+
+        # Allow to override the template on the instance
+        if "template" in self.__dict__ or "template_name" in self.__dict__:
+            return None
+
+        return binding.template
+
+    def _resolve_template(self, context: Context) -> Template:
         # Resolve template name
         template_name = self.template_name
         if self.template_name is not None:
@@ -407,7 +613,8 @@ class Component(
         elif template_input is not None:
             # We got template string, so we convert it to Template
             if isinstance(template_input, str):
-                template: Template = cached_template(template_input)
+                with parsing_component_template(self.__class__):
+                    template: Template = cached_template(template_input)
             else:
                 template = template_input
 
@@ -467,6 +674,61 @@ class Component(
 
         return get_injected_context_var(self.name, self.input.context, key, default)
 
+    def load(self, loader: LoaderFn, key: Any) -> LoadedValue:
+        """
+        Use this method to fetch data for many components at once, instead of each
+        component making its own query.
+
+        `loader` is a function that receives a list of keys, and returns either a list of values
+        in the same order, or a dict that maps the keys to the values. Missing keys in the dict
+        are set to `None`.
+
+        `load()` returns a [`LoadedValue`](../api#django_components.LoadedValue). When returned from
+        `get_context_data()`, it is replaced with the actual value before the template is rendered.
+
+        Components inside a template, e.g. in a `{% for %}` loop, are rendered only after the rest
+        of the template. By then, all the keys requested by the sibling components are known,
+        and are fetched with a single call to the loader.
+
+        This method must be used inside the `get_context_data()` method and raises
+        an error if called elsewhere.
+
+        Example:
+
+        ```py
+        from django_components import Component, register
+
+        def load_users(user_ids):
+            return User.objects.in_bulk(user_ids)
+
+        @register("user_card")
+        class UserCard(Component):
+            template = "<div>{{ user.name }}</div>"
+
+            def get_context_data(self, user_id):
+                return {"user": self.load(load_users, user_id)}
+        ```
+
+        Now, this makes only a single database query:
+        ```django
+        {% for user_id in user_ids %}
+            {% component "user_card" user_id=user_id / %}
+        {% endfor %}
+        ```
+
+        The keys and the loaded values are shared by all components within the same render,
+        so each key is fetched only once.
+
+        When streaming with [`Component.render_to_stream()`](../api#django_components.Component.render_to_stream),
+        the data is fetched separately for each chunk, before the chunk is sent.
+        """
+        if not len(self._render_stack):
+            raise RuntimeError(
+                f"Method 'load()' of component '{self.name}' was called outside of 'get_context_data()'"
+            )
+
+        return load(self.input.context, loader, key)
+
     @classmethod
     def as_view(cls, **initkwargs: Any) -> ViewFn:
         """
@@ -619,7 +881,194 @@ class Component(
         else:
             comp = cls()
 
-        return comp._render(context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request)
+        # NOTE: The HTML rendered without dependencies may be used outside of the current render,
+        #       e.g. passed to `render_dependencies()` or returned in JSON. So the components
+        #       must be marked with the `<!-- _RENDERED ... -->` comments.
+        with pause_dependency_collector() if not render_dependencies else nullcontext():
+            return comp._render(context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request)
+
+    @classmethod
+    async def arender(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> str:
+        """
+        Async counterpart of [`Component.render()`](../api#django_components.Component.render).
+        Accepts the same inputs.
+
+        With `arender()`, components may define `get_context_data()` as an async function:
+
+        ```py
+        class UserCard(Component):
+            template = "{{ user.name }}"
+
+            async def get_context_data(self, user_id):
+                user = await User.objects.aget(pk=user_id)
+                return {"user": user}
+
+        html = await UserCard.arender(kwargs={"user_id": 1})
+        ```
+
+        The rest of the rendering is synchronous, and runs in a thread with
+        [`sync_to_async`](https://docs.djangoproject.com/en/5.1/topics/async/#sync-to-async),
+        so it doesn't block the event loop.
+
+        The data of nested components with async `get_context_data()` is fetched after
+        the rest of the template was rendered. Data of all such components in the template
+        is fetched concurrently, and only then are the components rendered.
+
+        NOTE: Because the nested async components are rendered later, their HTML
+        is not yet available in the parent's `on_render_after()`.
+
+        When `render()` is used instead, async `get_context_data()` is awaited synchronously.
+        """
+        # This method may be called as class method or as instance method.
+        # If called as class method, create a new instance.
+        if isinstance(cls, Component):
+            comp: Component = cls
+        else:
+            comp = cls()
+
+        # NOTE: The HTML rendered without dependencies may be used outside of the current render,
+        #       see `Component.render()`
+        with pause_dependency_collector() if not render_dependencies else nullcontext():
+            return await comp._arender(
+                context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+            )
+
+    @classmethod
+    async def arender_to_response(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        type: RenderType = "document",
+        request: Optional[HttpRequest] = None,
+        *response_args: Any,
+        **response_kwargs: Any,
+    ) -> HttpResponse:
+        """
+        Async counterpart of [`Component.render_to_response()`](../api#django_components.Component.render_to_response).
+
+        The component is rendered with [`Component.arender()`](../api#django_components.Component.arender).
+
+        Example:
+        ```py
+        class MyPage(Component):
+            async def get(self, request):
+                return await self.arender_to_response(request=request)
+        ```
+        """
+        content = await cls.arender(
+            args=args,
+            kwargs=kwargs,
+            context=context,
+            slots=slots,
+            escape_slots_content=escape_slots_content,
+            type=type,
+            render_dependencies=True,
+            request=request,
+        )
+        return cls.response_class(content, *response_args, **response_kwargs)
+
+    @classmethod
+    def render_to_stream(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> Iterator[str]:
+        """
+        Render the component into an iterator of HTML chunks.
+
+        Accepts the same inputs as [`Component.render()`](../api#django_components.Component.render).
+
+        The chunks are rendered lazily, as the iterator is consumed. Each top-level tag or text
+        of the component's template makes one chunk, so e.g. the `<head>` of a page can be sent
+        to the client before the rest of the page is rendered.
+
+        Top-level `{% extends %}` and `{% component %}` tags are streamed the same way, node by node
+        of the parent template or of the component's template. Other tags, e.g. `{% if %}` or `{% for %}`,
+        are sent as a single chunk once they are fully rendered.
+
+        When `render_dependencies=True`, the JS and CSS are inserted as the chunks are sent,
+        see [`render_dependencies_stream()`](../api#django_components.render_dependencies_stream).
+
+        NOTE: Because the content was already sent, the output of `on_render_after()`
+        is ignored when streaming.
+
+        Example:
+        ```py
+        for chunk in MyComponent.render_to_stream(kwargs={"key": 123}):
+            print(chunk)
+        ```
+        """
+        # This method may be called as class method or as instance method.
+        # If called as class method, create a new instance.
+        if isinstance(cls, Component):
+            comp: Component = cls
+        else:
+            comp = cls()
+
+        return comp._render_stream(
+            context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+        )
+
+    @classmethod
+    def render_to_stream_response(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        type: RenderType = "document",
+        request: Optional[HttpRequest] = None,
+        *response_args: Any,
+        **response_kwargs: Any,
+    ) -> StreamingHttpResponse:
+        """
+        Same as [`Component.render_to_response()`](../api#django_components.Component.render_to_response),
+        but the component is rendered with
+        [`Component.render_to_stream()`](../api#django_components.Component.render_to_stream),
+        and the chunks are sent to the client as soon as they are rendered.
+
+        The response class is taken from `Component.streaming_response_class`.
+        Defaults to `django.http.StreamingHttpResponse`.
+
+        Example:
+        ```py
+        class MyPage(Component):
+            class View:
+                def get(self, request):
+                    return self.component.render_to_stream_response(request=request)
+        ```
+        """
+        chunks = cls.render_to_stream(
+            args=args,
+            kwargs=kwargs,
+            context=context,
+            slots=slots,
+            escape_slots_content=escape_slots_content,
+            type=type,
+            render_dependencies=True,
+            request=request,
+        )
+        return cls.streaming_response_class(chunks, *response_args, **response_kwargs)
 
     # This is the internal entrypoint for the render function
     def _render(
@@ -634,36 +1083,150 @@ class Component(
         request: Optional[HttpRequest] = None,
     ) -> str:
         try:
-            return self._render_impl(
-                context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
-            )
+            if not render_dependencies:
+                return self._render_impl(
+                    context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+                )
+
+            # Record the rendered components as we go, so that `render_dependencies()` doesn't have
+            # to search the output for the `<!-- _RENDERED ... -->` comments.
+            with collect_dependencies():
+                return self._render_impl(
+                    context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+                )
         except Exception as err:
-            # Nicely format the error message to include the component path.
-            # E.g.
-            # ```
-            # KeyError: "An error occured while rendering components ProjectPage > ProjectLayoutTabbed >
-            # Layout > RenderContextProvider > Base > TabItem:
-            # Component 'TabItem' tried to inject a variable '_tab' before it was provided.
-            # ```
-
-            if not hasattr(err, "_components"):
-                err._components = []  # type: ignore[attr-defined]
-
-            components = getattr(err, "_components", [])
-
-            # Access the exception's message, see https://stackoverflow.com/a/75549200/9788634
-            if not components:
-                orig_msg = err.args[0]
-            else:
-                orig_msg = err.args[0].split("\n", 1)[1]
+            self._add_component_path_to_error(err)
+            raise err
 
-            components.insert(0, self.name)
-            comp_path = " > ".join(components)
-            prefix = f"An error occured while rendering components {comp_path}:\n"
+    # Internal entrypoint for `render_to_stream`
+    def _render_stream(
+        self,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> Generator[str, None, None]:
+        chunks: Iterator[str] = _iter_with_paused_dependency_collector(
+            self._render_chunks(context, args, kwargs, slots, escape_slots_content, type, False, request, stream=True)
+        )
+        if render_dependencies:
+            chunks = render_dependencies_stream(chunks, type)
 
-            err.args = (prefix + orig_msg,)  # tuple of one
+        try:
+            yield from chunks
+        except Exception as err:
+            self._add_component_path_to_error(err)
             raise err
 
+    # Internal entrypoint for `arender`
+    async def _arender(
+        self,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> str:
+        if not render_dependencies:
+            return await self._arender_impl(context, args, kwargs, slots, escape_slots_content, type, request)
+
+        # Record the rendered components, see `Component._render()`
+        with collect_dependencies() as collector:
+            output = await self._arender_impl(context, args, kwargs, slots, escape_slots_content, type, request)
+            return mark_safe(_render_dependencies(output, type, collector))
+
+    async def _arender_impl(
+        self,
+        context: Optional[Union[Dict[str, Any], Context]],
+        args: Optional[ArgsType],
+        kwargs: Optional[KwargsType],
+        slots: Optional[SlotsType],
+        escape_slots_content: bool,
+        type: RenderType,
+        request: Optional[HttpRequest],
+    ) -> str:
+        # NOTE: The Context must be created here, so the nested async components are collected in it
+        context = _to_context(context, request)
+        is_render_root = start_render(context)
+        try:
+            return await self._arender_root(context, args, kwargs, slots, escape_slots_content, type, request)
+        finally:
+            if is_render_root:
+                end_render(context)
+
+    async def _arender_root(
+        self,
+        context: Context,
+        args: Optional[ArgsType],
+        kwargs: Optional[KwargsType],
+        slots: Optional[SlotsType],
+        escape_slots_content: bool,
+        type: RenderType,
+        request: Optional[HttpRequest],
+    ) -> str:
+        async_renders = init_async_renders(context)
+
+        if inspect.iscoroutinefunction(self.get_context_data):
+            await self._aprefetch_context_data(context, args, kwargs, slots, escape_slots_content, type)
+
+        # Render everything that's sync. Nested components with async `get_context_data()`
+        # are rendered as placeholders.
+        output: str = await sync_to_async(self._render)(
+            context, args, kwargs, slots, escape_slots_content, type, False, request
+        )
+        # In case the output was cached, and the prefetched data was not used
+        self._prefetched_context_data = None
+
+        # Fetch the data of the async components concurrently, and render them in place of the placeholders.
+        # Their templates may contain further async components, so repeat until there's none left.
+        start = 0
+        while start < len(async_renders):
+            batch = async_renders[start:]
+            start = len(async_renders)
+
+            await asyncio.gather(*(fetch_data() for _, fetch_data, _ in batch))
+            # Fetch the keys requested with `Component.load()` by all the components in the batch at once
+            await sync_to_async(dispatch_loads)(context)
+            rendered = await sync_to_async(lambda: [render() for _, _, render in batch])()
+
+            for (placeholder_id, _, _), html in zip(batch, rendered):
+                output = output.replace(ASYNC_PLACEHOLDER.format(id=placeholder_id), html, 1)
+
+        return mark_safe(output)
+
+    def _add_component_path_to_error(self, err: Exception) -> None:
+        # Nicely format the error message to include the component path.
+        # E.g.
+        # ```
+        # KeyError: "An error occured while rendering components ProjectPage > ProjectLayoutTabbed >
+        # Layout > RenderContextProvider > Base > TabItem:
+        # Component 'TabItem' tried to inject a variable '_tab' before it was provided.
+        # ```
+
+        if not hasattr(err, "_components"):
+            err._components = []  # type: ignore[attr-defined]
+
+        components = getattr(err, "_components", [])
+
+        # Access the exception's message, see https://stackoverflow.com/a/75549200/9788634
+        if not components:
+            orig_msg = err.args[0]
+        else:
+            orig_msg = err.args[0].split("\n", 1)[1]
+
+        components.insert(0, self.name)
+        comp_path = " > ".join(components)
+        prefix = f"An error occured while rendering components {comp_path}:\n"
+
+        err.args = (prefix + orig_msg,)  # tuple of one
+
     def _render_impl(
         self,
         context: Optional[Union[Dict[str, Any], Context]] = None,
@@ -675,22 +1238,76 @@ class Component(
         render_dependencies: bool = True,
         request: Optional[HttpRequest] = None,
     ) -> str:
+        context = _to_context(context, request)
+        is_render_root = start_render(context)
+
+        # The rendering is shared with `render_to_stream()`. Without streaming,
+        # the whole output is yielded at once.
+        output = ""
+        try:
+            for output in self._render_chunks(
+                context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+            ):
+                pass
+        finally:
+            if is_render_root:
+                end_render(context)
+        return output
+
+    def _render_chunks(
+        self,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+        stream: bool = False,
+    ) -> Generator[str, None, None]:
+        """
+        Render the component. With `stream=False`, yields the whole output at once.
+
+        With `stream=True`, yields the output of the component's template node by node,
+        as it gets rendered. The dependencies are NOT rendered in that case, the chunks
+        should be passed through `render_dependencies_stream()` instead.
+        """
         # NOTE: We must run validation before we normalize the slots, because the normalization
         #       wraps them in functions.
-        self._validate_inputs(args or (), kwargs or {}, slots or {})
+        validate_types = _should_validate_types()
+        if validate_types:
+            self._validate_inputs(args or (), kwargs or {}, slots or {})
 
         # Allow to provide no args/kwargs/slots/context
         args = cast(ArgsType, args or ())
         kwargs = cast(KwargsType, kwargs or {})
         slots_untyped = self._normalize_slot_fills(slots or {}, escape_slots_content)
         slots = cast(SlotsType, slots_untyped)
-        context = context or (RequestContext(request) if request else Context())
-
-        # Allow to provide a dict instead of Context
-        # NOTE: This if/else is important to avoid nested Contexts,
-        # See https://github.com/EmilStenstrom/django-components/issues/414
-        if not isinstance(context, Context):
-            context = RequestContext(request, context) if request else Context(context)
+        context = _to_context(context, request)
+
+        if self._component_id is None:
+            self._component_id = gen_render_id(context)
+
+        # When streaming, components with the `defer` flag are rendered at the end.
+        # NOTE: Nested components may be streamed too, see `_render_nodelist_chunks()`. But the deferred
+        #       components are rendered only at the end of the outermost stream.
+        is_stream_root = stream and get_deferred_renders(context) is None
+        deferred_renders = init_deferred_renders(context) if is_stream_root else None
+
+        # If the output is cached, skip the rendering altogether. See `Component.Cache`
+        cache_entry = get_render_cache_entry(self, args, kwargs, slots_untyped, context)
+        if cache_entry is not None:
+            cached_content = load_cached_render(cache_entry)
+            if cached_content is not None:
+                yield postprocess_component_html(
+                    component_cls=self.__class__,
+                    component_id=self.component_id,
+                    html_content=mark_safe(cached_content),
+                    type=type,
+                    render_dependencies=render_dependencies,
+                )
+                return
 
         # Required for compatibility with Django's {% extends %} tag
         # See https://github.com/EmilStenstrom/django-components/pull/859
@@ -713,14 +1330,35 @@ class Component(
             ),
         )
 
-        context_data = self.get_context_data(*args, **kwargs)
-        self._validate_outputs(data=context_data)
+        num_loads = count_loads(context)
+        is_prefetched = self._prefetched_context_data is not None
+        context_data = self._get_context_data(args, kwargs)
+
+        if is_prefetched or count_loads(context) != num_loads:
+            # Postpone the rendering until the data requested with `Component.load()` is fetched
+            # together with the data requested by the other components. See `Component.load()`
+            batched_renders = get_batched_renders(context)
+            if batched_renders is not None and not stream and not render_dependencies:
+                if has_pending_loads(context_data):
+                    self._render_stack.pop()
+                    context.render_context.pop()  # type: ignore[union-attr]
+                    yield self._render_batched_later(
+                        context, args, kwargs, slots, context_data, type, request, batched_renders
+                    )
+                    return
+            context_data = resolve_loads(context_data)
+
+        if validate_types:
+            self._validate_outputs(data=context_data)
 
         # Process JS and CSS files
         cache_inlined_js(self.__class__, self.js or "")
         cache_inlined_css(self.__class__, self.css or "")
 
-        with _prepare_template(self, context, context_data) as template:
+        # Reserve the component's place among the dependencies before its children are rendered
+        record_component(self.__class__)
+
+        with _prepare_template(self, context, context_data) as (template, fill_vars_layer):
             # For users, we expose boolean variables that they may check
             # to see if given slot was filled, e.g.:
             # `{% if variable > 8 and component_vars.is_filled.header %}`
@@ -744,6 +1382,7 @@ class Component(
                     # Private context fields
                     _ROOT_CTX_CONTEXT_KEY: self.outer_context,
                     _COMPONENT_SLOT_CTX_CONTEXT_KEY: component_slot_ctx,
+                    _FILL_VARS_LAYER_CONTEXT_KEY: fill_vars_layer,
                     _REGISTRY_CONTEXT_KEY: self.registry,
                     # NOTE: Public API for variables accessible from within a component's template
                     # See https://github.com/EmilStenstrom/django-components/issues/280#issuecomment-2081180940
@@ -753,28 +1392,133 @@ class Component(
                 }
             ):
                 self.on_render_before(context, template)
-
-                # Get the component's HTML
-                html_content = template.render(context)
-
-                # Allow to optionally override/modify the rendered content
-                new_output = self.on_render_after(context, template, html_content)
-                html_content = new_output if new_output is not None else html_content
-
-                output = postprocess_component_html(
-                    component_cls=self.__class__,
-                    component_id=self.component_id,
-                    html_content=html_content,
-                    type=type,
-                    render_dependencies=render_dependencies,
-                )
+                pending_count = _count_pending_renders(context)
+
+                if stream:
+                    # Send the dependency comment first, then the template's top-level nodes
+                    # one by one, as they get rendered.
+                    yield _insert_component_comment("", Dependencies(self.__class__, self.component_id))
+                    html_chunks: List[str] = []
+                    for chunk in _render_template_chunks(template, context):
+                        html_chunks.append(chunk)
+                        yield chunk
+                    html_content = mark_safe("".join(html_chunks))
+
+                    # NOTE: The content was already sent, so when streaming,
+                    #       `on_render_after` can NOT change the output.
+                    self.on_render_after(context, template, html_content)
+                else:
+                    # Get the component's HTML
+                    # NOTE: The cached HTML may be used in another render, so the nested components
+                    #       must be marked with the `<!-- _RENDERED ... -->` comments.
+                    with pause_dependency_collector() if cache_entry is not None else nullcontext():
+                        html_content = template.render(context)
+
+                    # Allow to optionally override/modify the rendered content
+                    new_output = self.on_render_after(context, template, html_content)
+                    html_content = new_output if new_output is not None else html_content
+
+                # NOTE: Do not cache the output if it contains placeholders of deferred or async components
+                if cache_entry is not None and _count_pending_renders(context) == pending_count:
+                    save_cached_render(cache_entry, html_content)
+
+                if not stream:
+                    output = postprocess_component_html(
+                        component_cls=self.__class__,
+                        component_id=self.component_id,
+                        html_content=html_content,
+                        type=type,
+                        render_dependencies=render_dependencies,
+                    )
 
         # After rendering is done, remove the current state from the stack, which means
         # properties like `self.context` will no longer return the current state.
         self._render_stack.pop()
         context.render_context.pop()
 
-        return output
+        if not stream:
+            yield output
+        elif deferred_renders is not None:
+            # Now that the rest of the page was sent, render the components with the `defer` flag.
+            # NOTE: Deferred components may defer other components, so the list may grow as we go.
+            index = 0
+            while index < len(deferred_renders):
+                defer_id, render_fn = deferred_renders[index]
+                yield DEFERRED_CONTENT.format(id=defer_id, content=render_fn())
+                index += 1
+            end_render(context)
+
+    def _render_batched_later(
+        self,
+        context: Context,
+        args: ArgsType,
+        kwargs: KwargsType,
+        slots: SlotsType,
+        context_data: Any,
+        type: RenderType,
+        request: Optional[HttpRequest],
+        batched_renders: BatchedRenders,
+    ) -> str:
+        render_context = _snapshot_context(context)
+
+        def render() -> str:
+            self._prefetched_context_data = (context_data,)
+            # NOTE: The slots were already normalized (and escaped), so they must not be escaped again
+            return self._render(render_context, args, kwargs, slots, False, type, False, request)
+
+        placeholder_id = gen_render_id(context)
+        batched_renders.append((placeholder_id, render))
+        return mark_safe(BATCHED_PLACEHOLDER.format(id=placeholder_id))
+
+    def _get_context_data(self, args: Any, kwargs: Any) -> Any:
+        # The data was already fetched by `arender()`
+        if self._prefetched_context_data is not None:
+            context_data = self._prefetched_context_data[0]
+            self._prefetched_context_data = None
+            return context_data
+
+        context_data = self.get_context_data(*args, **kwargs)
+        if inspect.isawaitable(context_data):
+            # When rendering synchronously, wait for the async `get_context_data()` to finish
+            context_data = async_to_sync(_await)(context_data)
+        return context_data
+
+    async def _aprefetch_context_data(
+        self,
+        context: Context,
+        args: Optional[ArgsType],
+        kwargs: Optional[KwargsType],
+        slots: Optional[SlotsType],
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+    ) -> None:
+        # Same as during the rendering, `get_context_data()` may access `self.input`, or call `self.inject()`,
+        # so the inputs must be on the render stack.
+        args = cast(ArgsType, args or ())
+        kwargs = cast(KwargsType, kwargs or {})
+        slots_untyped = self._normalize_slot_fills(slots or {}, escape_slots_content)
+        self._render_stack.append(
+            RenderStackItem(
+                input=RenderInput(
+                    context=context,
+                    args=args,
+                    kwargs=kwargs,
+                    slots=cast(SlotsType, slots_untyped),
+                    type=type,
+                    render_dependencies=False,
+                ),
+                is_filled=SlotIsFilled(slots_untyped),
+            ),
+        )
+        try:
+            context_data = await cast(Awaitable[Any], self.get_context_data(*args, **kwargs))
+        except Exception as err:
+            self._add_component_path_to_error(err)
+            raise err
+        finally:
+            self._render_stack.pop()
+
+        self._prefetched_context_data = (context_data,)
 
     def _normalize_slot_fills(
         self,
@@ -797,6 +1541,9 @@ class Component(
         for slot_name, content in fills.items():
             if content is None:
                 continue
+            # Reuse the Slot instances, e.g. the fills from the `{% component %}` tag, see `resolve_fills()`
+            elif isinstance(content, Slot) and not escape_content:
+                slot = content
             elif not callable(content):
                 slot = _nodelist_to_slot_render_func(
                     slot_name,
@@ -836,73 +1583,162 @@ class Component(
             ...
         ```
         """
-        # For efficiency, the type extraction is done only once.
-        # If `self._types` is `False`, that means that the types were not specified.
-        # If `self._types` is `None`, then this is the first time running this method.
-        # Otherwise, `self._types` should be a tuple of (Args, Kwargs, Data, Slots)
-        if self._types == False:  # noqa: E712
-            return None
-        elif self._types:
-            return self._types
-
-        # Since a class can extend multiple classes, e.g.
-        #
-        # ```py
-        # class MyClass(BaseOne, BaseTwo, ...):
-        #     ...
-        # ```
-        #
-        # Then we need to find the base class that is our `Component` class.
-        #
-        # NOTE: __orig_bases__ is a tuple of _GenericAlias
-        # See https://github.com/python/cpython/blob/709ef004dffe9cee2a023a3c8032d4ce80513582/Lib/typing.py#L1244
-        # And https://github.com/python/cpython/issues/101688
-        generics_bases: Tuple[Any, ...] = self.__orig_bases__  # type: ignore[attr-defined]
-        component_generics_base = None
-        for base in generics_bases:
-            origin_cls = base.__origin__
-            if origin_cls == Component or issubclass(origin_cls, Component):
-                component_generics_base = base
-                break
-
-        if not component_generics_base:
-            # If we get here, it means that the Component class wasn't supplied any generics
-            self._types = False
-            return None
-
-        # If we got here, then we've found ourselves the typed Component class, e.g.
-        #
-        # `Component(Tuple[int], MyKwargs, MySlots, Any, Any, Any)`
-        #
-        # By accessing the __args__, we access individual types between the brackets, so
-        #
-        # (Tuple[int], MyKwargs, MySlots, Any, Any, Any)
-        args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type = component_generics_base.__args__
-
-        self._types = args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type
-        return self._types
+        return _get_type_validators(type(self)).types
 
     def _validate_inputs(self, args: Tuple, kwargs: Any, slots: Any) -> None:
-        maybe_inputs = self._get_types()
-        if maybe_inputs is None:
+        validators = _get_type_validators(type(self))
+        if validators.types is None:
             return
-        args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type = maybe_inputs
 
-        # Validate args
-        validate_typed_tuple(args, args_type, f"Component '{self.name}'", "positional argument")
-        # Validate kwargs
-        validate_typed_dict(kwargs, kwargs_type, f"Component '{self.name}'", "keyword argument")
-        # Validate slots
-        validate_typed_dict(slots, slots_type, f"Component '{self.name}'", "slot")
+        prefix = f"Component '{self.name}'"
+        if validators.args is not None:
+            validators.args(args, prefix)
+        if validators.kwargs is not None:
+            validators.kwargs(kwargs, prefix)
+        if validators.slots is not None:
+            validators.slots(slots, prefix)
 
     def _validate_outputs(self, data: Any) -> None:
-        maybe_inputs = self._get_types()
-        if maybe_inputs is None:
-            return
-        args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type = maybe_inputs
+        validators = _get_type_validators(type(self))
+        if validators.data is not None:
+            validators.data(data, f"Component '{self.name}'")
+
 
-        # Validate data
-        validate_typed_dict(data, data_type, f"Component '{self.name}'", "data")
+class TemplateBinding(NamedTuple):
+    version: int
+    # `None` if the component's template is not static
+    template: Optional[Template]
+
+
+# Bumping this number invalidates all templates bound to the component classes.
+_template_binding_version = 0
+
+
+def _is_template_static(comp_cls: Type[Component]) -> bool:
+    """
+    Template is static if it's defined ONLY via `Component.template` or `Component.template_name`,
+    as these don't depend on the rendering context.
+    """
+    if comp_cls.get_template_name is not Component.get_template_name:
+        return False
+    if comp_cls.get_template is not Component.get_template:
+        return False
+    # TODO_REMOVE_IN_V1 - Remove `get_template_string` in v1
+    if hasattr(comp_cls, "get_template_string"):
+        return False
+
+    # Exactly one of the two must be set. Otherwise we let `Component._resolve_template()`
+    # raise the error.
+    return (comp_cls.template is None) != (comp_cls.template_name is None)
+
+
+def _bind_template(comp_cls: Type[Component]) -> TemplateBinding:
+    template: Optional[Template] = None
+    if _is_template_static(comp_cls):
+        if comp_cls.template_name is not None:
+            template = get_template(comp_cls.template_name).template
+        elif isinstance(comp_cls.template, str):
+            with parsing_component_template(comp_cls):
+                template = cached_template(comp_cls.template)
+        else:
+            template = comp_cls.template
+
+    binding = TemplateBinding(version=_template_binding_version, template=template)
+    comp_cls._template_binding = binding
+    return binding
+
+
+class TypeValidators(NamedTuple):
+    # `None` if the component class was not given any types
+    types: Optional[Tuple[Any, Any, Any, Any, Any, Any]]
+    # Each validator is `None` if the corresponding type is `Any`
+    args: Optional[TypeValidator]
+    kwargs: Optional[TypeValidator]
+    slots: Optional[TypeValidator]
+    data: Optional[TypeValidator]
+
+
+def _get_type_validators(comp_cls: Type[Component]) -> TypeValidators:
+    """
+    Get the validators for the types passed to the Component class.
+
+    The types are extracted and the validators are prepared only once per component class,
+    on the first render.
+    """
+    # NOTE: We read from `__dict__`, so that subclasses don't reuse the validators of their parent
+    validators: Optional[TypeValidators] = comp_cls.__dict__.get("_type_validators", None)
+    if validators is not None:
+        return validators
+
+    comp_types = _extract_types(comp_cls)
+    if comp_types is None:
+        validators = TypeValidators(types=None, args=None, kwargs=None, slots=None, data=None)
+    else:
+        args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type = comp_types
+        validators = TypeValidators(
+            types=comp_types,
+            args=compile_tuple_validator(args_type, "positional argument"),
+            kwargs=compile_dict_validator(kwargs_type, "keyword argument"),
+            slots=compile_dict_validator(slots_type, "slot"),
+            data=compile_dict_validator(data_type, "data"),
+        )
+
+    comp_cls._type_validators = validators  # type: ignore[attr-defined]
+    return validators
+
+
+def _extract_types(comp_cls: Type[Component]) -> Optional[Tuple[Any, Any, Any, Any, Any, Any]]:
+    # Since a class can extend multiple classes, e.g.
+    #
+    # ```py
+    # class MyClass(BaseOne, BaseTwo, ...):
+    #     ...
+    # ```
+    #
+    # Then we need to find the base class that is our `Component` class.
+    #
+    # NOTE: __orig_bases__ is a tuple of _GenericAlias
+    # See https://github.com/python/cpython/blob/709ef004dffe9cee2a023a3c8032d4ce80513582/Lib/typing.py#L1244
+    # And https://github.com/python/cpython/issues/101688
+    generics_bases: Tuple[Any, ...] = comp_cls.__orig_bases__  # type: ignore[attr-defined]
+    component_generics_base = None
+    for base in generics_bases:
+        origin_cls = base.__origin__
+        if origin_cls == Component or issubclass(origin_cls, Component):
+            component_generics_base = base
+            break
+
+    if not component_generics_base:
+        # If we get here, it means that the Component class wasn't supplied any generics
+        return None
+
+    # If we got here, then we've found ourselves the typed Component class, e.g.
+    #
+    # `Component(Tuple[int], MyKwargs, MySlots, Any, Any, Any)`
+    #
+    # By accessing the __args__, we access individual types between the brackets, so
+    #
+    # (Tuple[int], MyKwargs, MySlots, Any, Any, Any)
+    args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type = component_generics_base.__args__
+
+    return args_type, kwargs_type, slots_type, data_type, js_data_type, css_data_type
+
+
+def _should_validate_types() -> bool:
+    """Decide whether to validate the types in this render, see `COMPONENTS.type_validation`."""
+    rate = app_settings.TYPE_VALIDATION
+    return rate >= 1 or (rate > 0 and random() < rate)
+
+
+def invalidate_bound_templates() -> None:
+    """
+    Discard the compiled templates bound to the component classes, so they are resolved
+    again on the next render.
+
+    This is called when the dev server detects a file change, or when Django settings change.
+    """
+    global _template_binding_version
+    _template_binding_version += 1
 
 
 class ComponentNode(BaseNode):
@@ -917,12 +1753,17 @@ class ComponentNode(BaseNode):
         isolated_context: bool = False,
         nodelist: Optional[NodeList] = None,
         node_id: Optional[str] = None,
+        defer: bool = False,
     ) -> None:
         super().__init__(nodelist=nodelist or NodeList(), args=args, kwargs=kwargs, node_id=node_id)
 
         self.name = name
         self.isolated_context = isolated_context
         self.registry = registry
+        self.defer = defer
+        # Fills found when the template was parsed, so we don't have to render the body to find them.
+        # `None` if the fills can be found only at render time. See `resolve_fills()`
+        self.static_fills = analyze_fills(self.nodelist, ComponentNode)
 
     def __repr__(self) -> str:
         return "<ComponentNode: {}. Contents: {!r}>".format(
@@ -938,6 +1779,22 @@ class ComponentNode(BaseNode):
         if _is_extracting_fill(context):
             return ""
 
+        if self.defer:
+            deferred_renders = get_deferred_renders(context)
+            # The `defer` flag has effect only when streaming, see `Component.render_to_stream()`
+            if deferred_renders is not None:
+                deferred_context = _snapshot_context(context)
+
+                # NOTE: The same node may be rendered multiple times, e.g. inside a loop,
+                #       so the placeholders need their own IDs.
+                defer_id = gen_render_id(context)
+                deferred_renders.append((defer_id, lambda: self._render_component(deferred_context)))
+                trace_msg("RENDR", "COMP", self.name, self.node_id, "...Done! (deferred)")
+                return DEFER_PLACEHOLDER.format(id=defer_id)
+
+        return self._render_component(context)
+
+    def _render_component(self, context: Context) -> str:
         component_cls: Type[Component] = self.registry.get(self.name)
 
         # Resolve FilterExpressions and Variables that were passed as args to the
@@ -946,7 +1803,17 @@ class ComponentNode(BaseNode):
         args = safe_resolve_list(context, self.args)
         kwargs = self.kwargs.resolve(context)
 
-        slot_fills = resolve_fills(context, self.nodelist, self.name)
+        slot_fills = resolve_fills(context, self.nodelist, self.name, self.static_fills)
+
+        # Pure components with the same inputs are rendered only once per render, see `Component.pure`
+        pure_key = _get_pure_render_key(component_cls, args, kwargs) if component_cls.pure and not slot_fills else None
+        if pure_key is not None:
+            pure_memo = get_pure_renders_memo(context)
+            if pure_key in pure_memo:
+                trace_msg("RENDR", "COMP", self.name, self.node_id, "...Done! (memoized)")
+                # Mark the reused HTML with this node's ID, so the dependencies are collected as usual
+                deps = Dependencies(component_cls=component_cls, component_id=self.node_id)
+                return _insert_component_comment(pure_memo[pure_key], deps)
 
         component: Component = component_cls(
             registered_name=self.name,
@@ -959,19 +1826,227 @@ class ComponentNode(BaseNode):
         if self.isolated_context or self.registry.settings.context_behavior == ContextBehavior.ISOLATED:
             context = make_isolated_context_copy(context)
 
+        # The data of components with async `get_context_data()` is fetched after the rest of the template
+        # is rendered, concurrently with the other async components. See `Component.arender()`
+        if inspect.iscoroutinefunction(component.get_context_data):
+            async_renders = get_async_renders(context)
+            if async_renders is not None:
+                return self._render_async_later(component, context, args, kwargs, slot_fills, async_renders)
+
+        pending_count = _count_pending_renders(context)
+
         output = component._render(
             context=context,
             args=args,
             kwargs=kwargs,
             slots=slot_fills,
+            # NOTE: The fills are rendered from the template, so they are already escaped
+            escape_slots_content=False,
             # NOTE: When we render components inside the template via template tags,
             # do NOT render deps, because this may be decided by outer component
             render_dependencies=False,
         )
 
+        # NOTE: Do not reuse the output if it contains placeholders of deferred or async components
+        if pure_key is not None and _count_pending_renders(context) == pending_count:
+            # Store the HTML without this component's dependency marker, which is always at the start
+            marker = _insert_component_comment("", Dependencies(component_cls, self.node_id))
+            if output.startswith(marker):
+                content_start = len(marker)
+                pure_memo[pure_key] = output[content_start:]
+
         trace_msg("RENDR", "COMP", self.name, self.node_id, "...Done!")
         return output
 
+    def render_chunks(self, context: Context) -> Generator[str, None, None]:
+        """
+        Same as `render()`, but yields the output of the component's template node by node,
+        as it gets rendered. Used by `Component.render_to_stream()`.
+
+        Components with the `defer` flag, pure components, and components with async `get_context_data()`
+        are rendered in one piece.
+        """
+        component_cls: Type[Component] = self.registry.get(self.name)
+        if (
+            self.defer
+            or component_cls.pure
+            or inspect.iscoroutinefunction(component_cls.get_context_data)
+            or _is_extracting_fill(context)
+        ):
+            yield self.render_annotated(context)
+            return
+
+        trace_msg("RENDR", "COMP", self.name, self.node_id, "(streamed)")
+
+        args = safe_resolve_list(context, self.args)
+        kwargs = self.kwargs.resolve(context)
+        slot_fills = resolve_fills(context, self.nodelist, self.name, self.static_fills)
+
+        component: Component = component_cls(
+            registered_name=self.name,
+            outer_context=context,
+            component_id=self.node_id,
+            registry=self.registry,
+        )
+
+        # Prevent outer context from leaking into the template of the component
+        if self.isolated_context or self.registry.settings.context_behavior == ContextBehavior.ISOLATED:
+            context = make_isolated_context_copy(context)
+
+        try:
+            yield from component._render_chunks(
+                context=context,
+                args=args,
+                kwargs=kwargs,
+                slots=slot_fills,
+                # NOTE: The fills are rendered from the template, so they are already escaped
+                escape_slots_content=False,
+                render_dependencies=False,
+                stream=True,
+            )
+        except Exception as err:
+            component._add_component_path_to_error(err)
+            raise err
+
+        trace_msg("RENDR", "COMP", self.name, self.node_id, "...Done! (streamed)")
+
+    def _render_async_later(
+        self,
+        component: Component,
+        context: Context,
+        args: List,
+        kwargs: Dict[str, Any],
+        slot_fills: Dict[SlotName, Slot],
+        async_renders: AsyncRenders,
+    ) -> str:
+        render_context = _snapshot_context(context)
+
+        def render() -> str:
+            return component._render(
+                context=render_context,
+                args=args,
+                kwargs=kwargs,
+                slots=slot_fills,
+                render_dependencies=False,
+            )
+
+        placeholder_id = gen_render_id(context)
+        async_renders.append(
+            (
+                placeholder_id,
+                lambda: component._aprefetch_context_data(render_context, args, kwargs, slot_fills),
+                render,
+            )
+        )
+        trace_msg("RENDR", "COMP", self.name, self.node_id, "...Done! (async)")
+        return ASYNC_PLACEHOLDER.format(id=placeholder_id)
+
+
+def _count_pending_renders(context: Context) -> int:
+    """
+    Count the components that were rendered as a placeholder, either because of the `defer` flag,
+    because they have async `get_context_data()`, or because they wait for data from `Component.load()`.
+    """
+    count = 0
+    for renders in (get_deferred_renders(context), get_async_renders(context), get_batched_renders(context)):
+        if renders is not None:
+            count += len(renders)
+    return count
+
+
+def _render_batched(context: Context, output: str) -> str:
+    """
+    Render the components that wait for data from `Component.load()` in place of their placeholders.
+    """
+    batched_renders = get_batched_renders(context) or []
+
+    # The rendered components may contain further components that wait for data,
+    # so repeat until there's none left.
+    start = 0
+    while start < len(batched_renders):
+        batch = batched_renders[start:]
+        start = len(batched_renders)
+
+        dispatch_loads(context)
+        for placeholder_id, render in batch:
+            output = output.replace(BATCHED_PLACEHOLDER.format(id=placeholder_id), render(), 1)
+
+    return mark_safe(output)
+
+
+def _iter_with_paused_dependency_collector(chunks: Iterator[str]) -> Generator[str, None, None]:
+    # When streaming, the chunks are sent before the whole output is rendered. So the components
+    # must be marked with the `<!-- _RENDERED ... -->` comments, see `render_dependencies_stream()`.
+    while True:
+        with pause_dependency_collector():
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _snapshot_context(context: Context) -> Context:
+    # Take a snapshot of the context, as it will change by the time we render the component.
+    # E.g. inside `{% for %}` loops, the loop variable is updated in place.
+    context_copy = copy(context)
+    context_copy.dicts = [dict(ctx_dict) for ctx_dict in context.dicts]
+    dicts_copies = {id(ctx_dict): dict_copy for ctx_dict, dict_copy in zip(context.dicts, context_copy.dicts)}
+
+    # `{% for %}` updates the `forloop` dict in place, so it must be copied too. The nested loops
+    # point to the `forloop` of the outer loop via `parentloop`, so that must point to the copy.
+    forloop_copies: Dict[int, Dict[str, Any]] = {}
+
+    for ctx_dict in context_copy.dicts:
+        # Point to the copy of the layer for the variables of `{% fill %}` tags
+        fill_vars_layer = ctx_dict.get(_FILL_VARS_LAYER_CONTEXT_KEY, None)
+        if fill_vars_layer is not None:
+            ctx_dict[_FILL_VARS_LAYER_CONTEXT_KEY] = dicts_copies.get(id(fill_vars_layer), fill_vars_layer)
+
+        forloop = ctx_dict.get("forloop", None)
+        if isinstance(forloop, dict):
+            forloop_copy = forloop_copies.get(id(forloop), None)
+            if forloop_copy is None:
+                forloop_copy = forloop_copies[id(forloop)] = forloop.copy()
+                parentloop = forloop_copy.get("parentloop", None)
+                if isinstance(parentloop, dict):
+                    forloop_copy["parentloop"] = forloop_copies.get(id(parentloop), parentloop)
+            ctx_dict["forloop"] = forloop_copy
+    return context_copy
+
+
+def _to_context(context: Optional[Union[Dict[str, Any], Context]], request: Optional[HttpRequest]) -> Context:
+    context = context or (RequestContext(request) if request else Context())
+
+    # Allow to provide a dict instead of Context
+    # NOTE: This if/else is important to avoid nested Contexts,
+    # See https://github.com/EmilStenstrom/django-components/issues/414
+    if not isinstance(context, Context):
+        context = RequestContext(request, context) if request else Context(context)
+    return context
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+def _get_pure_render_key(component_cls: Type[Component], args: List, kwargs: Dict[str, Any]) -> Optional[Tuple]:
+    # NOTE: We include the types of the values, as e.g. `1`, `1.0` and `True` are equal and have the same hash,
+    #       and `str` and `SafeString` are equal, but are escaped differently.
+    # NOTE: We include also the dependency collector, as the nested components are marked with
+    #       the `<!-- _RENDERED ... -->` comments only if the collector is not active.
+    key = (
+        component_cls,
+        get_dependency_collector(),
+        tuple((type(arg), arg) for arg in args),
+        tuple((name, type(value), value) for name, value in sorted(kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # Inputs like lists or dicts cannot be memoized
+        return None
+    return key
+
 
 def monkeypatch_template(template_cls: Type[Template]) -> None:
     # Modify `Template.render` to set `isolated_context` kwarg of `push_state`
@@ -1009,13 +2084,23 @@ def monkeypatch_template(template_cls: Type[Template]) -> None:
             isolated_context = not self._dc_is_component_nested
         #  ---------------- OUR CHANGES END ----------------
 
-        with context.render_context.push_state(self, isolated_context=isolated_context):
-            if context.template is None:
-                with context.bind_template(self):
-                    context.template_name = self.name
-                    return self._render(context, *args, **kwargs)
-            else:
-                return self._render(context, *args, **kwargs)
+        # The outermost template renders the components that wait for data from `Component.load()`
+        is_batch_root = start_batched_renders(context)
+        try:
+            with context.render_context.push_state(self, isolated_context=isolated_context):
+                if context.template is None:
+                    with context.bind_template(self):
+                        context.template_name = self.name
+                        output = self._render(context, *args, **kwargs)
+                else:
+                    output = self._render(context, *args, **kwargs)
+
+            if is_batch_root:
+                output = _render_batched(context, output)
+            return output
+        finally:
+            if is_batch_root:
+                end_batched_renders(context)
 
     template_cls.render = _template_render
     template_cls._dc_patched = True
@@ -1030,13 +2115,80 @@ def _maybe_bind_template(context: Context, template: Template) -> Generator[None
         yield
 
 
+def _render_template_chunks(template: Template, context: Context) -> Generator[str, None, None]:
+    """
+    Same as the patched `Template.render()` (see `monkeypatch_template`), but yields
+    the output of the template's top-level nodes one by one, instead of joining them.
+    """
+    isolated_context = not getattr(template, "_dc_is_component_nested", False)
+
+    with context.render_context.push_state(template, isolated_context=isolated_context):
+        with _maybe_bind_template(context, template):
+            yield from _render_nodelist_chunks(template.nodelist, context)
+
+
+def _render_nodelist_chunks(nodelist: NodeList, context: Context) -> Generator[str, None, None]:
+    """
+    Render the nodes one by one. The `{% extends %}` and `{% component %}` tags are not rendered
+    in one piece, but their templates are streamed node by node too.
+    """
+    for node in nodelist:
+        if isinstance(node, ExtendsNode):
+            yield from _render_extends_chunks(node, context)
+            continue
+        if isinstance(node, ComponentNode):
+            yield from node.render_chunks(context)
+            continue
+
+        # The components that wait for data from `Component.load()` are batched within each chunk,
+        # and rendered before the chunk is sent.
+        is_batch_root = start_batched_renders(context)
+        try:
+            chunk = node.render_annotated(context)
+            if is_batch_root and chunk:
+                chunk = _render_batched(context, chunk)
+        finally:
+            if is_batch_root:
+                end_batched_renders(context)
+
+        if chunk:
+            yield chunk
+
+
+def _render_extends_chunks(node: ExtendsNode, context: Context) -> Generator[str, None, None]:
+    # Same as `ExtendsNode.render()`, but the parent template is rendered node by node
+    compiled_parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+
+    # Add the block nodes from this node to the block context
+    block_context.add_blocks(node.blocks)
+
+    # If this block's parent doesn't have an extends node it is the root,
+    # and its block nodes also need to be added to the block context.
+    for parent_node in compiled_parent.nodelist:
+        # The ExtendsNode has to be the first non-text node.
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                blocks = {n.name: n for n in compiled_parent.nodelist.get_nodes_by_type(BlockNode)}
+                block_context.add_blocks(blocks)
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from _render_nodelist_chunks(compiled_parent.nodelist, context)
+
+
 @contextmanager
 def _prepare_template(
     component: Component,
     context: Context,
     context_data: Any,
-) -> Generator[Template, Any, None]:
-    with context.update(context_data):
+) -> Generator[Tuple[Template, Dict[str, Any]], Any, None]:
+    # Variables captured by the `{% fill %}` tags (e.g. from for-loops) are set to this layer,
+    # so that they are below the component's data. See `_nodelist_to_slot_render_func()`
+    with context.update({}) as fill_vars_layer, context.update(context_data):
         # Associate the newly-created Context with a Template, otherwise we get
         # an error when we try to use `{% include %}` tag inside the template?
         # See https://github.com/EmilStenstrom/django-components/issues/580
@@ -1057,4 +2209,4 @@ def _prepare_template(
         template._dc_is_component_nested = bool(context.render_context.get(BLOCK_CONTEXT_KEY))
 
         with _maybe_bind_template(context, template):
-            yield template
+            yield template, fill_vars_layer
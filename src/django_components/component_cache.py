@@ -0,0 +1,258 @@
+import hashlib
+import time
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Type, Union
+from uuid import UUID
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
+from django.template import Context
+
+from django_components.component_registry import all_registries
+from django_components.dependencies import (
+    COMPONENT_COMMENT_REGEX,
+    SCRIPT_NAME_REGEX,
+    _hash_comp_cls,
+    cache_inlined_css,
+    cache_inlined_js,
+    comp_hash_mapping,
+)
+
+if TYPE_CHECKING:
+    from django_components.component import Component
+
+
+class ComponentCacheInput:
+    """
+    Defines whether and how the rendered output of this component is cached.
+
+    ```py
+    class NavMenu(Component):
+        class Cache:
+            enabled = True
+            ttl = 60 * 5
+            tags = ["nav"]
+    ```
+
+    The output is cached per combination of the component's args and kwargs, and the
+    context variables listed in `context_keys`. To decide the cache key yourself,
+    define `key()`. It is called like a component method, so `self` is the component instance:
+
+    ```py
+    class ProductCard(Component):
+        class Cache:
+            enabled = True
+
+            def key(self, product, **kwargs):
+                return f"{product.pk}:{product.updated_at.isoformat()}"
+
+            def tags(self, product, **kwargs):
+                return [f"product:{product.pk}"]
+    ```
+
+    Components that are given slot fills are never cached, because the fills
+    may depend on the outer context.
+    """
+
+    enabled: bool = False
+    """Whether the rendered output is cached. Defaults to `False`."""
+    ttl: Optional[int] = None
+    """
+    How long the output is cached, in seconds.
+    Defaults to `None`, which uses the default timeout of the Django cache.
+    """
+    cache_name: str = DEFAULT_CACHE_ALIAS
+    """Which of the caches in Django's `CACHES` setting to use. Defaults to `"default"`."""
+    context_keys: Sequence[str] = ()
+    """
+    Names of the context variables that affect the rendered output, and hence
+    are part of the cache key. Other context variables are ignored.
+    """
+    tags: Union[Sequence[str], Callable[..., Sequence[str]]] = ()
+    """
+    Invalidation tags. All cached outputs tagged with a given tag can be discarded with
+    [`invalidate_cache_tags()`](../api#django_components.invalidate_cache_tags).
+
+    Can be a list of strings, or a method that receives the same args and kwargs
+    as the component.
+    """
+    key: Optional[Callable[..., Any]] = None
+    """
+    Method that receives the same args and kwargs as the component, and returns a string
+    that identifies the rendered output.
+
+    By default, the key is generated from the args, kwargs and the context variables listed in
+    `context_keys`. These must then be made only of strings, numbers, booleans, `None`, dates,
+    decimals, UUIDs, and lists, tuples and dicts thereof.
+    """
+
+
+class RenderCacheEntry(NamedTuple):
+    cache: BaseCache
+    key: str
+    ttl: Optional[int]
+
+
+CACHE_KEY_PREFIX = "components:render"
+TAG_KEY_PREFIX = "components:tag"
+
+_SIMPLE_TYPES = (str, int, float, bool, type(None), Decimal, UUID, date, datetime, dt_time, timedelta)
+
+
+def get_render_cache_entry(
+    component: "Component",
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+    slots: Mapping[str, Any],
+    context: Context,
+) -> Optional[RenderCacheEntry]:
+    """
+    Return the cache and the key under which the rendered output of this component is cached,
+    or `None` if this render should not be cached.
+    """
+    cache_config = component.Cache
+    if not getattr(cache_config, "enabled", False) or slots:
+        return None
+
+    key_fn = getattr(cache_config, "key", None)
+    if key_fn is not None:
+        input_key = str(key_fn(component, *args, **kwargs))
+    else:
+        context_keys = getattr(cache_config, "context_keys", ())
+        try:
+            input_key = _serialize_key_part(
+                [list(args), kwargs, {key: context.get(key, None) for key in context_keys}],
+            )
+        except ValueError as err:
+            raise ValueError(
+                f"Component '{component.name}' cannot be cached: {err}. Define `Cache.key()` to set the cache key."
+            ) from None
+
+    tags = getattr(cache_config, "tags", ())
+    if callable(tags):
+        tags = tags(component, *args, **kwargs)
+
+    cache_name = getattr(cache_config, "cache_name", DEFAULT_CACHE_ALIAS)
+    cache = caches[cache_name]
+    tag_versions = _get_tag_versions(cache, tags)
+
+    digest = hashlib.sha256()
+    digest.update(input_key.encode())
+    for tag in sorted(tag_versions):
+        digest.update(f"\0{tag}={tag_versions[tag]}".encode())
+
+    key = f"{CACHE_KEY_PREFIX}:{_hash_comp_cls(type(component))}:{digest.hexdigest()}"
+    return RenderCacheEntry(cache=cache, key=key, ttl=getattr(cache_config, "ttl", None))
+
+
+def load_cached_render(entry: RenderCacheEntry) -> Optional[str]:
+    """
+    Get the cached output. Returns `None` if the output is not cached, or if the output
+    contains components that are not known to this process.
+    """
+    content: Optional[str] = entry.cache.get(entry.key)
+    if content is None:
+        return None
+
+    if not _prepare_nested_components(content):
+        return None
+    return content
+
+
+def save_cached_render(entry: RenderCacheEntry, content: str) -> None:
+    if entry.ttl is None:
+        entry.cache.set(entry.key, content)
+    else:
+        entry.cache.set(entry.key, content, entry.ttl)
+
+
+def invalidate_cache_tags(*tags: str, cache_name: str = DEFAULT_CACHE_ALIAS) -> None:
+    """
+    Discard the cached outputs of all components that were cached with any of the given tags.
+
+    See [`Component.Cache.tags`](../api#django_components.Component.Cache).
+
+    ```py
+    from django_components import invalidate_cache_tags
+
+    def on_product_saved(sender, instance, **kwargs):
+        invalidate_cache_tags(f"product:{instance.pk}")
+    ```
+    """
+    cache = caches[cache_name]
+    for tag in tags:
+        # NOTE: The entries are not deleted, instead the tag version, which is part
+        #       of the cache key, changes. The old entries then expire on their own.
+        tag_key = f"{TAG_KEY_PREFIX}:{tag}"
+        try:
+            cache.incr(tag_key)
+        except ValueError:
+            cache.set(tag_key, time.time_ns(), None)
+
+
+def _get_tag_versions(cache: BaseCache, tags: Sequence[str]) -> Dict[str, Any]:
+    if not tags:
+        return {}
+
+    tag_keys = {f"{TAG_KEY_PREFIX}:{tag}": tag for tag in tags}
+    versions = cache.get_many(list(tag_keys))
+
+    for tag_key in tag_keys:
+        if tag_key not in versions:
+            # Start from the current time, so a tag that was evicted from the cache
+            # does NOT revive the entries cached under its old version.
+            cache.add(tag_key, time.time_ns(), None)
+            versions[tag_key] = cache.get(tag_key)
+
+    return {tag: versions[tag_key] for tag_key, tag in tag_keys.items()}
+
+
+def _serialize_key_part(value: Any) -> str:
+    if isinstance(value, _SIMPLE_TYPES):
+        return f"{type(value).__name__}:{value!r}"
+    elif isinstance(value, (list, tuple)):
+        items = ",".join(_serialize_key_part(item) for item in value)
+        return f"{type(value).__name__}:[{items}]"
+    elif isinstance(value, dict):
+        entries = sorted((str(key), _serialize_key_part(val)) for key, val in value.items())
+        items = ",".join(f"{key!r}={val}" for key, val in entries)
+        return f"dict:{{{items}}}"
+    raise ValueError(f"value of type '{type(value).__name__}' cannot be used in the cache key")
+
+
+def _prepare_nested_components(content: str) -> bool:
+    """
+    Cached output may come from another process (e.g. shared Redis cache). So the components
+    rendered inside of it may not have been rendered in this process yet. Make sure
+    that their JS / CSS can be found by `render_dependencies`.
+
+    Returns `False` if some of the components could not be found.
+    """
+    comp_hashes = set()
+    for match in COMPONENT_COMMENT_REGEX.finditer(content.encode()):
+        part_match = SCRIPT_NAME_REGEX.match(match.group("data"))
+        if part_match:
+            comp_hashes.add(part_match.group("comp_cls_hash").decode("utf-8"))
+
+    missing = [comp_hash for comp_hash in comp_hashes if comp_hash not in comp_hash_mapping]
+    if not missing:
+        return True
+
+    known_classes: Dict[str, Type["Component"]] = {}
+    for registry in all_registries:
+        for comp_cls in registry.all().values():
+            known_classes[_hash_comp_cls(comp_cls)] = comp_cls
+
+    found: List[Type["Component"]] = []
+    for comp_hash in missing:
+        if comp_hash not in known_classes:
+            return False
+        found.append(known_classes[comp_hash])
+
+    for comp_cls in found:
+        comp_hash_mapping[_hash_comp_cls(comp_cls)] = comp_cls
+        cache_inlined_js(comp_cls, comp_cls.js or "")
+        cache_inlined_css(comp_cls, comp_cls.css or "")
+    return True
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Set, Type, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union
 
 from django.template import Library
 
@@ -224,6 +224,8 @@ class ComponentRegistry:
         self._library = library
         self._settings_input = settings
         self._settings: Optional[Callable[[], InternalRegistrySettings]] = None
+        # Resolved settings, together with the version of `app_settings` they were resolved with
+        self._settings_cache: Optional[Tuple[int, InternalRegistrySettings]] = None
 
         all_registries.append(self)
 
@@ -253,10 +255,15 @@ class ComponentRegistry:
         """
         [Registry settings](../api#django_components.RegistrySettings) configured for this registry.
         """
+        # The settings are accessed each time a component is rendered, so we resolve them
+        # only once, and then again only when Django settings change.
+        # NOTE: Registry's settings can be a function, so that it can respond to changes in Django's settings.
+        settings_version = app_settings.version
+        if self._settings_cache is not None and self._settings_cache[0] == settings_version:
+            return self._settings_cache[1]
+
         # This is run on subsequent calls
         if self._settings is not None:
-            # NOTE: Registry's settings can be a function, so we always take
-            # the latest value from Django's settings.
             settings = self._settings()
 
         # First-time initialization
@@ -286,6 +293,7 @@ class ComponentRegistry:
             self._settings = get_settings
             settings = self._settings()
 
+        self._settings_cache = (settings_version, settings)
         return settings
 
     def register(self, name: str, component: Type["Component"]) -> None:
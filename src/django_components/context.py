@@ -6,16 +6,46 @@ You can think of the Context as our storage system.
 """
 
 from collections import namedtuple
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
 
 from django.template import Context, TemplateSyntaxError
 
-from django_components.util.misc import find_last_index
+from django_components.app_settings import app_settings
+from django_components.util.misc import find_last_index, gen_deterministic_id, gen_id
 
 _COMPONENT_SLOT_CTX_CONTEXT_KEY = "_DJANGO_COMPONENTS_COMPONENT_SLOT_CTX"
 _ROOT_CTX_CONTEXT_KEY = "_DJANGO_COMPONENTS_ROOT_CTX"
 _REGISTRY_CONTEXT_KEY = "_DJANGO_COMPONENTS_REGISTRY"
-_INJECT_CONTEXT_KEY_PREFIX = "_DJANGO_COMPONENTS_INJECT__"
+_FILL_VARS_LAYER_CONTEXT_KEY = "_DJANGO_COMPONENTS_FILL_VARS_LAYER"
+_PROVIDED_CONTEXT_KEY = "_DJANGO_COMPONENTS_PROVIDED"
+_PURE_RENDERS_CONTEXT_KEY = "_DJANGO_COMPONENTS_PURE_RENDERS"
+_DEFERRED_RENDERS_CONTEXT_KEY = "_DJANGO_COMPONENTS_DEFERRED_RENDERS"
+_ASYNC_RENDERS_CONTEXT_KEY = "_DJANGO_COMPONENTS_ASYNC_RENDERS"
+_BATCHED_RENDERS_CONTEXT_KEY = "_DJANGO_COMPONENTS_BATCHED_RENDERS"
+_ID_SEQUENCE_CONTEXT_KEY = "_DJANGO_COMPONENTS_ID_SEQUENCE"
+_RENDER_IN_PROGRESS_CONTEXT_KEY = "_DJANGO_COMPONENTS_RENDER_IN_PROGRESS"
+
+# Pairs of `(placeholder_id, render_fn)` of the components rendered with the `defer` flag
+DeferredRenders = List[Tuple[str, Callable[[], str]]]
+# Triples of `(placeholder_id, fetch_data_fn, render_fn)` of the components with async `get_context_data()`
+AsyncRenders = List[Tuple[str, Callable[[], Awaitable[None]], Callable[[], str]]]
+# Pairs of `(placeholder_id, render_fn)` of the components waiting for data from `Component.load()`
+BatchedRenders = List[Tuple[str, Callable[[], str]]]
+
+
+class ProvidedData(NamedTuple):
+    """
+    Data provided with the `{% provide %}` tag.
+
+    The provided data form a linked list, from the innermost `{% provide %}` tag to the outermost.
+    The entries are never modified, so the nested `{% provide %}` tags share the entries
+    of their ancestors, and only a reference to the innermost entry needs to be passed around.
+    """
+
+    key: str
+    value: Any
+    parent: Optional["ProvidedData"]
 
 
 def make_isolated_context_copy(context: Context) -> Context:
@@ -32,10 +62,8 @@ def make_isolated_context_copy(context: Context) -> Context:
         context_copy[_ROOT_CTX_CONTEXT_KEY] = context[_ROOT_CTX_CONTEXT_KEY]
 
     # Make inject/provide to work in isolated mode
-    context_keys = context.flatten().keys()
-    for key in context_keys:
-        if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-            context_copy[key] = context[key]
+    if _PROVIDED_CONTEXT_KEY in context:
+        context_copy[_PROVIDED_CONTEXT_KEY] = context[_PROVIDED_CONTEXT_KEY]
 
     return context_copy
 
@@ -63,14 +91,12 @@ def get_injected_context_var(
     Retrieve a 'provided' field. The field MUST have been previously 'provided'
     by the component's ancestors using the `{% provide %}` template tag.
     """
-    # NOTE: For simplicity, we keep the provided values directly on the context.
-    # This plays nicely with Django's Context, which behaves like a stack, so "newer"
-    # values overshadow the "older" ones.
-    internal_key = _INJECT_CONTEXT_KEY_PREFIX + key
-
     # Return provided value if found
-    if internal_key in context:
-        return context[internal_key]
+    provided: Optional[ProvidedData] = context.get(_PROVIDED_CONTEXT_KEY, None)
+    while provided is not None:
+        if provided.key == key:
+            return provided.value
+        provided = provided.parent
 
     # If a default was given, return that
     if default is not None:
@@ -108,8 +134,137 @@ def set_provided_context_var(
     # We turn the kwargs into a NamedTuple so that the object that's "provided"
     # is immutable. This ensures that the data returned from `inject` will always
     # have all the keys that were passed to the `provide` tag.
-    tpl_cls = namedtuple("DepInject", provided_kwargs.keys())  # type: ignore[misc]
+    tpl_cls = _get_provided_tuple_cls(tuple(provided_kwargs.keys()))
     payload = tpl_cls(**provided_kwargs)
 
-    internal_key = _INJECT_CONTEXT_KEY_PREFIX + key
-    context[internal_key] = payload
+    parent: Optional[ProvidedData] = context.get(_PROVIDED_CONTEXT_KEY, None)
+    context[_PROVIDED_CONTEXT_KEY] = ProvidedData(key=key, value=payload, parent=parent)
+
+
+@lru_cache(maxsize=256)
+def _get_provided_tuple_cls(fields: Tuple[str, ...]) -> Type[Tuple]:
+    return namedtuple("DepInject", fields)  # type: ignore[misc]
+
+
+def start_render(context: Context) -> bool:
+    """
+    Mark the start of a top-level render of a component with given `Context`.
+
+    Returns `False` if the `Context` is already being rendered, e.g. when rendering
+    a nested component, or a component inside of a template.
+    """
+    root_render_ctx = context.render_context.dicts[0]
+    if context.template is not None or _RENDER_IN_PROGRESS_CONTEXT_KEY in root_render_ctx:
+        return False
+    root_render_ctx[_RENDER_IN_PROGRESS_CONTEXT_KEY] = True
+    return True
+
+
+def end_render(context: Context) -> None:
+    """
+    Discard the pure, deferred and async renders collected during the top-level render,
+    so they don't leak into the next render if the `Context` is reused. See `start_render()`.
+    """
+    root_render_ctx = context.render_context.dicts[0]
+    for key in (
+        _RENDER_IN_PROGRESS_CONTEXT_KEY,
+        _PURE_RENDERS_CONTEXT_KEY,
+        _DEFERRED_RENDERS_CONTEXT_KEY,
+        _ASYNC_RENDERS_CONTEXT_KEY,
+    ):
+        root_render_ctx.pop(key, None)
+
+
+def get_pure_renders_memo(context: Context) -> Dict[Any, str]:
+    """
+    Get the memo of outputs of "pure" components (see `Component.pure`).
+
+    The memo is stored at the root of the `render_context`, so it is shared by all templates
+    rendered with the same `Context`, i.e. it lasts for a single top-level render.
+    """
+    root_render_ctx = context.render_context.dicts[0]
+    memo = root_render_ctx.get(_PURE_RENDERS_CONTEXT_KEY, None)
+    if memo is None:
+        memo = root_render_ctx[_PURE_RENDERS_CONTEXT_KEY] = {}
+    return memo
+
+
+def init_deferred_renders(context: Context) -> DeferredRenders:
+    """
+    Start collecting the components rendered with the `defer` flag (see `Component.render_to_stream()`).
+
+    Same as with pure components, the list is stored at the root of the `render_context`.
+    """
+    root_render_ctx = context.render_context.dicts[0]
+    deferred = root_render_ctx.get(_DEFERRED_RENDERS_CONTEXT_KEY, None)
+    if deferred is None:
+        deferred = root_render_ctx[_DEFERRED_RENDERS_CONTEXT_KEY] = []
+    return deferred
+
+
+def get_deferred_renders(context: Context) -> Optional[DeferredRenders]:
+    """
+    Get the list of deferred components, or `None` if the components are NOT rendered as a stream,
+    in which case the `defer` flag has no effect.
+    """
+    return context.render_context.dicts[0].get(_DEFERRED_RENDERS_CONTEXT_KEY, None)
+
+
+def init_async_renders(context: Context) -> AsyncRenders:
+    """
+    Start collecting the components with async `get_context_data()` (see `Component.arender()`).
+    """
+    root_render_ctx = context.render_context.dicts[0]
+    async_renders = root_render_ctx.get(_ASYNC_RENDERS_CONTEXT_KEY, None)
+    if async_renders is None:
+        async_renders = root_render_ctx[_ASYNC_RENDERS_CONTEXT_KEY] = []
+    return async_renders
+
+
+def get_async_renders(context: Context) -> Optional[AsyncRenders]:
+    """
+    Get the list of components with async `get_context_data()`, or `None` if the components
+    are NOT rendered with `Component.arender()`, in which case their data is fetched synchronously.
+    """
+    return context.render_context.dicts[0].get(_ASYNC_RENDERS_CONTEXT_KEY, None)
+
+
+def start_batched_renders(context: Context) -> bool:
+    """
+    Start collecting the components that wait for data from `Component.load()`.
+
+    Returns `False` if the components are already being collected by an outer template.
+    """
+    root_render_ctx = context.render_context.dicts[0]
+    if _BATCHED_RENDERS_CONTEXT_KEY in root_render_ctx:
+        return False
+    root_render_ctx[_BATCHED_RENDERS_CONTEXT_KEY] = []
+    return True
+
+
+def end_batched_renders(context: Context) -> None:
+    context.render_context.dicts[0].pop(_BATCHED_RENDERS_CONTEXT_KEY, None)
+
+
+def get_batched_renders(context: Context) -> Optional[BatchedRenders]:
+    """
+    Get the list of components that wait for data from `Component.load()`, or `None` if rendering
+    outside of a template, in which case the data is fetched right away.
+    """
+    return context.render_context.dicts[0].get(_BATCHED_RENDERS_CONTEXT_KEY, None)
+
+
+def gen_render_id(context: Context) -> str:
+    """
+    Generate an ID during the render, e.g. for placeholders.
+
+    With `COMPONENTS.deterministic_ids`, the ID is derived from the number of IDs
+    that were generated so far within the same render.
+    """
+    if not app_settings.DETERMINISTIC_IDS:
+        return gen_id()
+
+    root_render_ctx = context.render_context.dicts[0]
+    sequence = root_render_ctx.get(_ID_SEQUENCE_CONTEXT_KEY, 0) + 1
+    root_render_ctx[_ID_SEQUENCE_CONTEXT_KEY] = sequence
+    return gen_deterministic_id("render", sequence)
@@ -0,0 +1,146 @@
+"""
+Batched data loading for components, see `Component.load()`.
+
+The keys requested with `Component.load()` are collected per loader, and fetched with a single
+call to the loader. The collected keys and the fetched values live at the root of the `render_context`,
+so they are shared by all components rendered with the same `Context`.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+from django.template import Context
+
+_DATA_LOADS_CONTEXT_KEY = "_DJANGO_COMPONENTS_DATA_LOADS"
+
+LoaderFn = Callable[[List[Any]], Union[Mapping[Any, Any], Sequence[Any]]]
+
+
+class LoadedValue:
+    """
+    Value returned by [`Component.load()`](../api#django_components.Component.load).
+
+    The value is fetched only when needed, together with all other keys that were requested
+    from the same loader by then. Access it with `LoadedValue.value`.
+
+    When `LoadedValue` is returned from `get_context_data()`, it is replaced with the actual value
+    before the template is rendered. This works also for `LoadedValue` nested in lists, tuples, or dicts.
+    """
+
+    __slots__ = ("_batch", "_key")
+
+    def __init__(self, batch: "_LoaderBatch", key: Any) -> None:
+        self._batch = batch
+        self._key = key
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the value was already fetched."""
+        return self._key in self._batch.results
+
+    @property
+    def value(self) -> Any:
+        """The loaded value. If not fetched yet, the loader is called right away."""
+        if not self.loaded:
+            self._batch.dispatch()
+        return self._batch.results[self._key]
+
+    def __repr__(self) -> str:
+        return f"<LoadedValue: {self._batch.name}[{self._key!r}]>"
+
+
+class _LoaderBatch:
+    def __init__(self, loader: LoaderFn) -> None:
+        self.loader = loader
+        self.name = getattr(loader, "__qualname__", repr(loader))
+        # NOTE: Dict is used as an ordered set
+        self.pending: Dict[Any, None] = {}
+        self.results: Dict[Any, Any] = {}
+
+    def dispatch(self) -> None:
+        if not self.pending:
+            return
+
+        keys = list(self.pending)
+        values = self.loader(keys)
+
+        if isinstance(values, Mapping):
+            for key in keys:
+                self.results[key] = values.get(key, None)
+        else:
+            values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"Loader '{self.name}' must return a value for each of the {len(keys)} keys, "
+                    f"got {len(values)} values instead"
+                )
+            self.results.update(zip(keys, values))
+
+        self.pending = {}
+
+
+class _DataLoads:
+    def __init__(self) -> None:
+        self.batches: Dict[LoaderFn, _LoaderBatch] = {}
+        # Incremented on each `load()`, so we can tell if `get_context_data()` loaded anything
+        self.count = 0
+
+
+def _get_data_loads(context: Context) -> Optional[_DataLoads]:
+    return context.render_context.dicts[0].get(_DATA_LOADS_CONTEXT_KEY, None)
+
+
+def load(context: Context, loader: LoaderFn, key: Any) -> LoadedValue:
+    root_render_ctx = context.render_context.dicts[0]
+    data_loads: Optional[_DataLoads] = root_render_ctx.get(_DATA_LOADS_CONTEXT_KEY, None)
+    if data_loads is None:
+        data_loads = root_render_ctx[_DATA_LOADS_CONTEXT_KEY] = _DataLoads()
+
+    batch = data_loads.batches.get(loader, None)
+    if batch is None:
+        batch = data_loads.batches[loader] = _LoaderBatch(loader)
+
+    if key not in batch.results:
+        batch.pending[key] = None
+
+    data_loads.count += 1
+    return LoadedValue(batch, key)
+
+
+def count_loads(context: Context) -> int:
+    """Number of times `load()` was called during the render."""
+    data_loads = _get_data_loads(context)
+    return data_loads.count if data_loads is not None else 0
+
+
+def dispatch_loads(context: Context) -> None:
+    """Fetch all keys that were requested so far, with one call per loader."""
+    data_loads = _get_data_loads(context)
+    if data_loads is None:
+        return
+
+    for batch in list(data_loads.batches.values()):
+        batch.dispatch()
+
+
+def has_pending_loads(data: Any) -> bool:
+    """Whether the data contains `LoadedValue` that was not fetched yet."""
+    if isinstance(data, LoadedValue):
+        return not data.loaded
+    elif type(data) is dict:
+        return any(has_pending_loads(value) for value in data.values())
+    elif type(data) in (list, tuple):
+        return any(has_pending_loads(item) for item in data)
+    return False
+
+
+def resolve_loads(data: Any) -> Any:
+    """Replace all `LoadedValue` in the data with the loaded values."""
+    if isinstance(data, LoadedValue):
+        return data.value
+    elif type(data) is dict:
+        return {key: resolve_loads(value) for key, value in data.items()}
+    elif type(data) is list:
+        return [resolve_loads(item) for item in data]
+    elif type(data) is tuple:
+        return tuple(resolve_loads(item) for item in data)
+    return data
@@ -1,17 +1,26 @@
 """All code related to management of component dependencies (JS and CSS scripts)"""
 
 import base64
+import gzip
 import json
+import os
 import re
 import sys
+import tempfile
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from functools import lru_cache
 from hashlib import md5
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
+    Generator,
     Iterable,
+    Iterator,
     List,
     Literal,
     NamedTuple,
@@ -26,17 +35,30 @@ from typing import (
 from weakref import WeakValueDictionary
 
 from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
 from django.forms import Media
 from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed, HttpResponseNotFound, StreamingHttpResponse
 from django.http.response import HttpResponseBase
+from django.template import Context, Node
 from django.templatetags.static import static
-from django.urls import path, reverse
+from django.urls import get_script_prefix, get_urlconf, path, reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from django.utils.decorators import sync_and_async_middleware
+from django.utils.module_loading import import_string
 from django.utils.safestring import SafeString, mark_safe
 
-from django_components.util.html import SoupNode
+from django_components.app_settings import app_settings
+from django_components.util.cache import LRUCache
+from django_components.util.html import SoupNode, scan_document
+from django_components.util.logger import logger
 from django_components.util.misc import get_import_path
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 if TYPE_CHECKING:
     from django_components.component import Component
 
@@ -52,33 +74,143 @@ RenderType = Literal["document", "fragment"]
 #########################################################
 
 
+# NOTE: Values are strings, except for the compressed variants of the scripts, which are bytes
 class ComponentMediaCacheABC(ABC):
     @abstractmethod
-    def get(self, key: str) -> Optional[str]: ...  # noqa: #704
+    def get(self, key: str) -> Optional[Union[str, bytes]]: ...  # noqa: #704
 
     @abstractmethod
     def has(self, key: str) -> bool: ...  # noqa: #704
 
     @abstractmethod
-    def set(self, key: str, value: str) -> None: ...  # noqa: #704
+    def set(self, key: str, value: Union[str, bytes]) -> None: ...  # noqa: #704
 
 
 class InMemoryComponentMediaCache(ComponentMediaCacheABC):
+    """
+    Keeps the JS and CSS in the memory of the current process.
+
+    This is the default. See [`COMPONENTS.media_cache`](../settings#django_components.app_settings.ComponentsSettings.media_cache).
+    """  # noqa: E501
+
     def __init__(self) -> None:
-        self._data: Dict[str, str] = {}
+        self._data: Dict[str, Union[str, bytes]] = {}
 
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
         return self._data.get(key, None)
 
     def has(self, key: str) -> bool:
         return key in self._data
 
-    def set(self, key: str, value: str) -> None:
+    def set(self, key: str, value: Union[str, bytes]) -> None:
         self._data[key] = value
 
 
+class DjangoCacheComponentMediaCache(ComponentMediaCacheABC):
+    """
+    Stores the JS and CSS in one of Django's [caches](https://docs.djangoproject.com/en/5.1/topics/cache/),
+    so it's shared by all processes that use the same cache, e.g. Redis or Memcached.
+
+    `alias` is the name of the cache in Django's `CACHES` setting. By default, the entries
+    never expire (`timeout=None`).
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        media_cache=DjangoCacheComponentMediaCache("default"),
+    )
+    ```
+    """
+
+    def __init__(self, alias: str = "default", timeout: Optional[float] = None) -> None:
+        self.alias = alias
+        self.timeout = timeout
+
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        return caches[self.alias].get(key, None)
+
+    def has(self, key: str) -> bool:
+        return caches[self.alias].has_key(key)
+
+    def set(self, key: str, value: Union[str, bytes]) -> None:
+        caches[self.alias].set(key, value, timeout=self.timeout)
+
+
+class FileSystemComponentMediaCache(ComponentMediaCacheABC):
+    """
+    Stores the JS and CSS as files in the given directory, so it's shared by all processes
+    that can access the directory, and it persists across server restarts.
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        media_cache=FileSystemComponentMediaCache(BASE_DIR / "components_cache"),
+    )
+    ```
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        self.directory = Path(directory)
+
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        try:
+            data = self._get_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        # The first byte marks whether the value was a string or bytes, see `set()`
+        if data[0:1] == b"b":
+            return data[1:]
+        return data[1:].decode()
+
+    def has(self, key: str) -> bool:
+        return self._get_path(key).is_file()
+
+    def set(self, key: str, value: Union[str, bytes]) -> None:
+        data = b"s" + value.encode() if isinstance(value, str) else b"b" + value
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so other processes never read a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self._get_path(key))
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+    def _get_path(self, key: str) -> Path:
+        # NOTE: The keys contain characters that are not allowed in file names on all systems, e.g. `:`
+        return self.directory / md5(key.encode()).hexdigest()
+
+
+# Default media cache, see `COMPONENTS.media_cache`
 comp_media_cache = InMemoryComponentMediaCache()
 
+# Media cache resolved from the settings, as `(setting_value, media_cache)`
+_media_cache: Optional[Tuple[Union[ComponentMediaCacheABC, str], ComponentMediaCacheABC]] = None
+
+# Scripts that this process stored in the media cache, as `{cache_key: script}`
+_cached_scripts: Dict[str, str] = {}
+
+
+def get_media_cache() -> ComponentMediaCacheABC:
+    """Returns the currently configured media cache. See `COMPONENTS.media_cache`."""
+    global _media_cache
+
+    media_cache_or_str = app_settings.MEDIA_CACHE
+    if _media_cache is None or _media_cache[0] is not media_cache_or_str:
+        if isinstance(media_cache_or_str, str):
+            media_cache: ComponentMediaCacheABC = import_string(media_cache_or_str)
+        else:
+            media_cache = media_cache_or_str
+
+        # The scripts need to be stored again if the media cache changed
+        if _media_cache is None or _media_cache[1] is not media_cache:
+            _cached_scripts.clear()
+        _media_cache = (media_cache_or_str, media_cache)
+
+    return _media_cache[1]
+
 
 # NOTE: Initially, we fetched components by their registered name, but that didn't work
 # for multiple registries and unregistered components.
@@ -119,10 +251,20 @@ def _gen_cache_key(
 def _is_script_in_cache(
     comp_cls: Type["Component"],
     script_type: ScriptType,
+    script: str,
 ) -> bool:
+    """
+    Check whether this process already stored the given JS / CSS in the media cache.
+
+    NOTE: We don't ask the media cache itself. The media cache may be shared by other processes,
+    and the existing entry may come from a different version of the component, e.g. before a deploy.
+    """
+    # NOTE: Forgets the stored scripts if the media cache changed
+    get_media_cache()
+
     comp_cls_hash = _hash_comp_cls(comp_cls)
     cache_key = _gen_cache_key(comp_cls_hash, script_type)
-    return comp_media_cache.has(cache_key)
+    return _cached_scripts.get(cache_key, None) == script
 
 
 def _cache_script(
@@ -144,7 +286,27 @@ def _cache_script(
 
     # NOTE: By setting the script in the cache, we will be able to retrieve it
     # via the endpoint, e.g. when we make a request to `/components/cache/MyComp_ab0c2d.js`.
-    comp_media_cache.set(cache_key, script.strip())
+    _cache_media_entry(cache_key, script.strip())
+    _cached_scripts[cache_key] = script
+    # The URLs of the component's JS / CSS contain the hash of the content,
+    # and the inlined JS / CSS may be part of the cached tags
+    comp_cls._media_tags = None
+    dep_tags_cache.clear()
+
+
+def _cache_media_entry(cache_key: str, content: str) -> None:
+    """
+    Store the JS / CSS in the cache, together with the hash of its content.
+
+    The hash is used in the script's URL and as its ETag.
+    """
+    media_cache = get_media_cache()
+    media_cache.set(cache_key, content)
+    media_cache.set(_gen_hash_cache_key(cache_key), md5(content.encode()).hexdigest())
+
+
+def _gen_hash_cache_key(cache_key: str) -> str:
+    return f"{cache_key}:hash"
 
 
 def cache_inlined_js(comp_cls: Type["Component"], content: str) -> None:
@@ -153,7 +315,7 @@ def cache_inlined_js(comp_cls: Type["Component"], content: str) -> None:
 
     # Prepare the script that's common to all instances of the same component
     # E.g. `my_table.js`
-    if not _is_script_in_cache(comp_cls, "js"):
+    if not _is_script_in_cache(comp_cls, "js", content):
         _cache_script(
             comp_cls=comp_cls,
             script=content,
@@ -166,7 +328,7 @@ def cache_inlined_css(comp_cls: Type["Component"], content: str) -> None:
         return
 
     # Prepare the script that's common to all instances of the same component
-    if not _is_script_in_cache(comp_cls, "css"):
+    if not _is_script_in_cache(comp_cls, "css", content):
         # E.g. `my_table.css`
         _cache_script(
             comp_cls=comp_cls,
@@ -190,6 +352,95 @@ class Dependencies(NamedTuple):
     component_id: str
 
 
+class DependencyCollector:
+    """
+    Records the components as they are rendered, so we know which JS / CSS scripts
+    to insert without having to mark the HTML, see `collect_dependencies()`.
+    """
+
+    def __init__(self) -> None:
+        # NOTE: Dict is used as an ordered set
+        self.comp_hashes: Dict[str, None] = {}
+
+
+_dependency_collector: ContextVar[Optional[DependencyCollector]] = ContextVar(
+    "django_components_dependency_collector",
+    default=None,
+)
+
+
+@contextmanager
+def collect_dependencies() -> Generator[DependencyCollector, None, None]:
+    """
+    Record the components rendered within this block into the yielded `DependencyCollector`,
+    instead of marking their HTML with `<!-- _RENDERED ... -->` comments.
+
+    Only use this when the rendered HTML is guaranteed to be passed to `render_dependencies()`
+    together with the collector, within the same block. HTML that may be used outside of the block,
+    e.g. when it's cached or rendered with `Component.render(render_dependencies=False)`,
+    is rendered inside `pause_dependency_collector()`.
+    """
+    collector = DependencyCollector()
+    token = _dependency_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _dependency_collector.reset(token)
+
+
+def get_dependency_collector() -> Optional[DependencyCollector]:
+    """
+    Returns the `DependencyCollector` of the current `collect_dependencies()` block,
+    or `None` if the components are marked with the `<!-- _RENDERED ... -->` comments.
+    """
+    return _dependency_collector.get()
+
+
+@contextmanager
+def pause_dependency_collector() -> Generator[None, None, None]:
+    """
+    Mark the HTML of components rendered within this block with the `<!-- _RENDERED ... -->` comments,
+    even if their dependencies are being collected with `collect_dependencies()`.
+    """
+    token = _dependency_collector.set(None)
+    try:
+        yield
+    finally:
+        _dependency_collector.reset(token)
+
+
+def monkeypatch_cache_node(cache_node_cls: Type[Node]) -> None:
+    """
+    The HTML rendered inside Django's `{% cache %}` tag is reused in other renders. So modify
+    `CacheNode.render` to mark the components inside of it with the `<!-- _RENDERED ... -->` comments,
+    even when the dependencies are collected with `collect_dependencies()`.
+    """
+    if hasattr(cache_node_cls, "_dc_patched"):
+        # Do not patch if done so already
+        return
+
+    orig_render = cache_node_cls.render
+
+    def _cache_node_render(self: Node, context: Context) -> str:
+        with pause_dependency_collector():
+            return orig_render(self, context)
+
+    cache_node_cls.render = _cache_node_render  # type: ignore[assignment]
+    cache_node_cls._dc_patched = True  # type: ignore[attr-defined]
+
+
+def record_component(comp_cls: Type["Component"]) -> None:
+    """
+    Record the component in the `DependencyCollector`, if the dependencies are being collected.
+
+    This is called before the component's template is rendered, so that the JS / CSS of a component
+    is inserted before the JS / CSS of its children, same as with the `<!-- _RENDERED ... -->` comments.
+    """
+    collector = _dependency_collector.get()
+    if collector is not None:
+        collector.comp_hashes[_hash_comp_cls(comp_cls)] = None
+
+
 def _insert_component_comment(
     content: str,
     deps: Dependencies,
@@ -198,11 +449,19 @@ def _insert_component_comment(
     Given some textual content, prepend it with a short string that
     will be used by the ComponentDependencyMiddleware to collect all
     declared JS / CSS scripts.
+
+    If the dependencies are being collected with `collect_dependencies()`,
+    the component is recorded there instead, and the content is returned as is.
     """
     # Add components to the cache
     comp_cls_hash = _hash_comp_cls(deps.component_cls)
     comp_hash_mapping[comp_cls_hash] = deps.component_cls
 
+    collector = _dependency_collector.get()
+    if collector is not None:
+        collector.comp_hashes[comp_cls_hash] = None
+        return content
+
     data = f"{comp_cls_hash},{deps.component_id}"
 
     # NOTE: It's important that we put the comment BEFORE the content, so we can
@@ -249,7 +508,8 @@ def postprocess_component_html(
     )
 
     if render_dependencies:
-        output = _render_dependencies(output, type)
+        # NOTE: When rendering the dependencies, `Component._render()` collects them with `collect_dependencies()`
+        output = _render_dependencies(output, type, _dependency_collector.get())
     return output
 
 
@@ -273,6 +533,7 @@ CSS_PLACEHOLDER_BYTES = bytes(CSS_DEPENDENCY_PLACEHOLDER, encoding="utf-8")
 JS_PLACEHOLDER_BYTES = bytes(JS_DEPENDENCY_PLACEHOLDER, encoding="utf-8")
 
 COMPONENT_DEPS_COMMENT = "<!-- _RENDERED {data} -->"
+COMPONENT_DEPS_COMMENT_START_BYTES = b"<!-- _RENDERED "
 # E.g. `<!-- _RENDERED table,123 -->`
 COMPONENT_COMMENT_REGEX = re.compile(rb"<!-- _RENDERED (?P<data>[\w\-,/]+?) -->")
 # E.g. `table,123`
@@ -285,7 +546,11 @@ PLACEHOLDER_REGEX = re.compile(
 )
 
 
-def render_dependencies(content: TContent, type: RenderType = "document") -> TContent:
+def render_dependencies(
+    content: TContent,
+    type: RenderType = "document",
+    collector: Optional[DependencyCollector] = None,
+) -> TContent:
     """
     Given a string that contains parts that were rendered by components,
     this function inserts all used JS and CSS.
@@ -323,6 +588,9 @@ def render_dependencies(content: TContent, type: RenderType = "document") -> TCo
 
         return HttpResponse(processed_html)
     ```
+
+    If the HTML was rendered inside `collect_dependencies()`, pass in the collector
+    with the `collector` argument.
     """
     if type not in ("document", "fragment"):
         raise ValueError(f"Invalid type '{type}'")
@@ -334,7 +602,7 @@ def render_dependencies(content: TContent, type: RenderType = "document") -> TCo
     else:
         content_ = cast(bytes, content)
 
-    content_, js_dependencies, css_dependencies = _process_dep_declarations(content_, type)
+    content_, js_dependencies, css_dependencies = _process_dep_declarations(content_, type, collector)
 
     # Replace the placeholders with the actual content
     # If type == `document`, we insert the JS and CSS directly into the HTML,
@@ -370,13 +638,13 @@ def render_dependencies(content: TContent, type: RenderType = "document") -> TCo
     # of <head>
     if type == "document" and (not did_find_js_placeholder or not did_find_css_placeholder):
         maybe_transformed = _insert_js_css_to_default_locations(
-            content_.decode(),
-            css_content=None if did_find_css_placeholder else css_dependencies.decode(),
-            js_content=None if did_find_js_placeholder else js_dependencies.decode(),
+            content_,
+            css_content=None if did_find_css_placeholder else css_dependencies,
+            js_content=None if did_find_js_placeholder else js_dependencies,
         )
 
         if maybe_transformed is not None:
-            content_ = maybe_transformed.encode()
+            content_ = maybe_transformed
 
     # In case of a fragment, we only append the JS (actually JSON) to trigger the call of dependency-manager
     if type == "fragment":
@@ -392,6 +660,109 @@ def render_dependencies(content: TContent, type: RenderType = "document") -> TCo
 _render_dependencies = render_dependencies
 
 
+HEAD_END_REGEX = re.compile(rb"</head\s*>", re.IGNORECASE)
+BODY_END_REGEX = re.compile(rb"</body\s*>", re.IGNORECASE)
+
+
+def render_dependencies_stream(chunks: Iterable[str], type: RenderType = "document") -> Iterator[str]:
+    """
+    Streaming counterpart of [`render_dependencies()`](../api#django_components.render_dependencies).
+
+    Given an iterable of HTML chunks that contain parts rendered by components,
+    yields the chunks with the components' JS and CSS inserted. Each chunk is
+    processed as soon as it is received, so the chunks can be sent to the client
+    before the rest of the HTML is rendered.
+
+    Same as with `render_dependencies()`, if you used `{% component_js_dependencies %}`
+    or `{% component_css_dependencies %}`, the JS and CSS is inserted at these locations.
+    Otherwise CSS is inserted before `</head>`, and JS before `</body>`.
+
+    Components rendered after these locations were already sent have their JS and CSS
+    inserted at the end of the chunk in which they were rendered.
+
+    ```python
+    def my_view(request):
+        template = Template(...)
+        chunks = (node.render(context) for node in template.nodelist)
+        return StreamingHttpResponse(render_dependencies_stream(chunks))
+    ```
+    """
+    if type not in ("document", "fragment"):
+        raise ValueError(f"Invalid type '{type}'")
+
+    # Hashes of components whose JS / CSS was already, or is about to be, sent
+    seen_comp_hashes: Set[str] = set()
+    pending_css: List[str] = []
+    pending_js: List[str] = []
+    is_css_location_sent = False
+    is_js_location_sent = False
+    is_core_script_sent = False
+
+    for chunk in chunks:
+        content, comp_hashes = _extract_dep_declarations(chunk.encode())
+
+        new_comp_hashes = [comp_hash for comp_hash in comp_hashes if comp_hash not in seen_comp_hashes]
+        seen_comp_hashes.update(new_comp_hashes)
+
+        # Fragments don't contain `<head>` or `<body>`. Instead, the client-side manager
+        # loads the JS and CSS, so we only remove the placeholders.
+        if type == "fragment":
+            content = PLACEHOLDER_REGEX.sub(b"", content)
+            if new_comp_hashes:
+                content += _gen_dep_tags(new_comp_hashes, "fragment")[0]
+            if content:
+                yield content.decode()
+            continue
+
+        pending_css.extend(new_comp_hashes)
+        pending_js.extend(new_comp_hashes)
+
+        # CSS
+        if CSS_PLACEHOLDER_BYTES in content:
+            css_tags = _gen_dep_tags(pending_css, "document", include_core_script=False)[1]
+            content = content.replace(CSS_PLACEHOLDER_BYTES, css_tags)
+            pending_css = []
+            is_css_location_sent = True
+        elif not is_css_location_sent:
+            head_end_match = HEAD_END_REGEX.search(content)
+            if head_end_match:
+                css_tags = _gen_dep_tags(pending_css, "document", include_core_script=False)[1]
+                index = head_end_match.start()
+                content = content[:index] + css_tags + content[index:]
+                pending_css = []
+                is_css_location_sent = True
+        elif pending_css:
+            content += _gen_dep_tags(pending_css, "document", include_core_script=False)[1]
+            pending_css = []
+
+        # JS
+        if JS_PLACEHOLDER_BYTES in content:
+            js_tags = _gen_dep_tags(pending_js, "document", include_core_script=not is_core_script_sent)[0]
+            content = content.replace(JS_PLACEHOLDER_BYTES, js_tags)
+            pending_js = []
+            is_js_location_sent = True
+            is_core_script_sent = True
+        elif not is_js_location_sent:
+            body_end_match = BODY_END_REGEX.search(content)
+            if body_end_match:
+                js_tags = _gen_dep_tags(pending_js, "document", include_core_script=not is_core_script_sent)[0]
+                index = body_end_match.start()
+                content = content[:index] + js_tags + content[index:]
+                pending_js = []
+                is_js_location_sent = True
+                is_core_script_sent = True
+        elif pending_js:
+            content += _gen_dep_tags(pending_js, "document", include_core_script=not is_core_script_sent)[0]
+            pending_js = []
+            is_core_script_sent = True
+
+        if content:
+            yield content.decode()
+
+    # NOTE: Same as with `render_dependencies()`, if the HTML had neither the placeholders
+    #       nor `</head>` / `</body>`, the remaining JS and CSS is NOT inserted.
+
+
 # Overview of this function:
 # 1. We extract all HTML comments like `<!-- _RENDERED table_10bac31,1234-->`.
 # 2. We look up the corresponding component classes
@@ -413,7 +784,11 @@ _render_dependencies = render_dependencies
 #      will be fetched and executed only once.
 # 6. And lastly, we generate a JS script that will load / mark as loaded the JS and CSS
 #    as categorized in previous step.
-def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes, bytes, bytes]:
+def _process_dep_declarations(
+    content: bytes,
+    type: RenderType,
+    collector: Optional[DependencyCollector] = None,
+) -> Tuple[bytes, bytes, bytes]:
     """
     Process a textual content that may include metadata on rendered components.
     The metadata has format like this
@@ -423,6 +798,27 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
     E.g.
 
     `<!-- _RENDERED table_10bac31,123 -->`
+
+    If given a `DependencyCollector`, the components recorded in it are used too.
+    In that case, we scan the content for the comments only if there are any.
+    """
+    if collector is None:
+        content, comp_hashes = _extract_dep_declarations(content)
+    else:
+        comp_hashes = list(collector.comp_hashes)
+        # Content rendered outside of the collector (e.g. cached HTML) may still contain the comments
+        if COMPONENT_DEPS_COMMENT_START_BYTES in content:
+            content, marked_comp_hashes = _extract_dep_declarations(content)
+            comp_hashes.extend(comp_hash for comp_hash in marked_comp_hashes if comp_hash not in collector.comp_hashes)
+
+    js_tags, css_tags = _gen_dep_tags(comp_hashes, type)
+    return (content, js_tags, css_tags)
+
+
+def _extract_dep_declarations(content: bytes) -> Tuple[bytes, List[str]]:
+    """
+    Remove the `<!-- _RENDERED ... -->` comments from the content,
+    and return the hashes of the rendered component classes, in order of appearance.
     """
     # Extract all matched instances of `<!-- _RENDERED ... -->` while also removing them from the text
     all_parts: List[bytes] = list()
@@ -453,41 +849,81 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
         comp_hashes.append(comp_cls_hash)
         seen_comp_hashes.add(comp_cls_hash)
 
+    return content, comp_hashes
+
+
+# Most pages render one of a few distinct sets of components, so the tags generated
+# for a set of components are cached. See `_gen_dep_tags()`.
+dep_tags_cache: LRUCache[Tuple[bytes, bytes]] = LRUCache(maxsize=256)
+
+
+def _gen_dep_tags(
+    comp_hashes: List[str],
+    type: RenderType,
+    include_core_script: bool = True,
+) -> Tuple[bytes, bytes]:
+    """
+    Generate the `<script>` and `<style>` / `<link>` tags for the given component classes.
+
+    Returns a tuple of `(js_tags, css_tags)`.
+
+    The result is cached by the ordered component classes and the render type.
+    The cache is cleared when the media of the components or their inlined JS / CSS change.
+    """
+    # NOTE: The key holds the classes instead of the hashes, so that a different class
+    # with the same import path (e.g. when a module is reloaded) doesn't get stale tags.
+    cache_key = (
+        tuple(comp_hash_mapping[comp_cls_hash] for comp_cls_hash in comp_hashes),
+        type,
+        include_core_script,
+        # The URLs depend on the script prefix and on the URL configuration of the current request
+        get_script_prefix(),
+        get_urlconf(),
+    )
+    dep_tags = dep_tags_cache.get(cache_key)
+    if dep_tags is None:
+        dep_tags = _render_dep_tags(comp_hashes, type, include_core_script)
+        dep_tags_cache.set(cache_key, dep_tags)
+    return dep_tags
+
+
+def _render_dep_tags(
+    comp_hashes: List[str],
+    type: RenderType,
+    include_core_script: bool,
+) -> Tuple[bytes, bytes]:
     (
-        to_load_component_js_urls,
-        to_load_component_css_urls,
+        to_load_component_js_tags,
+        to_load_component_css_tags,
         inlined_component_js_tags,
         inlined_component_css_tags,
         loaded_component_js_urls,
         loaded_component_css_urls,
     ) = _prepare_tags_and_urls(comp_hashes, type)
 
-    def get_component_media(comp_cls_hash: str) -> Media:
-        comp_cls = comp_hash_mapping[comp_cls_hash]
-        # NOTE: We instantiate the component classes so the `Media` are processed into `media`
-        comp = comp_cls()
-        return comp.media
-
-    all_medias = [
-        # JS / CSS files from Component.Media.js/css.
-        *[get_component_media(comp_cls_hash) for comp_cls_hash in comp_hashes],
-        # All the inlined scripts that we plan to fetch / load
-        Media(
-            js=to_load_component_js_urls,
-            css={"all": to_load_component_css_urls},
-        ),
-    ]
-
-    # Once we have ALL JS and CSS URLs that we want to fetch, we can convert them to
-    # <script> and <link> tags. Note that this is done by the user-provided Media classes.
-    to_load_css_tags = [tag for media in all_medias for tag in media.render_css()]
-    to_load_js_tags = [tag for media in all_medias for tag in media.render_js()]
+    # NOTE: The `<script>` and `<link>` tags of the component classes are rendered
+    # by the user-provided Media classes only once per component class.
+    all_media_tags = [_get_media_tags(comp_hash_mapping[comp_cls_hash]) for comp_cls_hash in comp_hashes]
 
-    # Postprocess all <script> and <link> tags to 1) dedupe, and 2) extract URLs.
-    # For the deduplication, if multiple components link to the same JS/CSS, but they
-    # render the <script> or <link> tag differently, we go with the first tag that we come across.
-    to_load_css_tags, to_load_css_urls = _postprocess_media_tags("css", to_load_css_tags)
-    to_load_js_tags, to_load_js_urls = _postprocess_media_tags("js", to_load_js_tags)
+    # Dedupe all <script> and <link> tags, and get their URLs.
+    # If multiple components link to the same JS/CSS, but they render the <script> or <link> tag
+    # differently, we go with the first tag that we come across.
+    to_load_css_tags, to_load_css_urls = _dedupe_media_tags(
+        [
+            # CSS files from Component.Media.css
+            *[tag for media_tags in all_media_tags for tag in media_tags.css],
+            # All the inlined styles that we plan to fetch / load
+            *to_load_component_css_tags,
+        ]
+    )
+    to_load_js_tags, to_load_js_urls = _dedupe_media_tags(
+        [
+            # JS files from Component.Media.js
+            *[tag for media_tags in all_media_tags for tag in media_tags.js],
+            # All the inlined scripts that we plan to fetch / load
+            *to_load_component_js_tags,
+        ]
+    )
 
     loaded_css_urls = sorted(
         [
@@ -516,9 +952,10 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
     )
 
     # Core scripts without which the rest wouldn't work
+    # NOTE: When rendering a document, the initial JS is inserted directly into the HTML
+    with_core_script = type == "document" and include_core_script
     core_script_tags = Media(
-        # NOTE: When rendering a document, the initial JS is inserted directly into the HTML
-        js=[static("django_components/django_components.min.js")] if type == "document" else [],
+        js=[static("django_components/django_components.min.js")] if with_core_script else [],
     ).render_js()
 
     final_script_tags = "".join(
@@ -551,20 +988,108 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
         ]
     )
 
-    return (content, final_script_tags.encode("utf-8"), final_css_tags.encode("utf-8"))
+    return (final_script_tags.encode("utf-8"), final_css_tags.encode("utf-8"))
 
 
 def _is_nonempty_str(txt: Optional[str]) -> bool:
     return txt is not None and bool(txt.strip())
 
 
-# Detect duplicates by URLs, extract URLs, and sort by URLs
-def _postprocess_media_tags(
+class MediaTags(NamedTuple):
+    """
+    The `<script>` and `<link>` tags of a component class, as `(tag, url)` pairs.
+
+    These are static for the component class, so they're rendered only once,
+    instead of on every call to `render_dependencies()`.
+    """
+
+    version: int
+    # The URLs depend on the script prefix and on the URL configuration of the current request
+    script_prefix: str
+    urlconf: Any
+    media_class: Optional[Type[Media]]
+    # Tags rendered from `Component.Media` with `Component.media_class`
+    js: List[Tuple[str, str]]
+    css: List[Tuple[str, str]]
+    # Tags that fetch `Component.js` / `Component.css` from the cache endpoint.
+    # `None` if the component doesn't define them.
+    js_endpoint: Optional[Tuple[str, str]]
+    css_endpoint: Optional[Tuple[str, str]]
+
+
+# Bumping this number invalidates the media tags of all component classes.
+_media_tags_version = 0
+
+
+def invalidate_media_tags() -> None:
+    """
+    Discard the `<script>` and `<link>` tags cached on the component classes,
+    and the tags cached for sets of components, so they are rendered again the next time they're needed.
+
+    This is called when the dev server detects a file change, when Django settings change,
+    or when the `collectcomponents` command exports the components' JS / CSS.
+    """
+    global _media_tags_version, _static_manifest
+    _media_tags_version += 1
+    dep_tags_cache.clear()
+    _static_manifest = None
+
+
+def _get_media_tags(comp_cls: Type["Component"]) -> MediaTags:
+    script_prefix = get_script_prefix()
+    urlconf = get_urlconf()
+    media_class = getattr(comp_cls, "media_class", None)
+
+    # NOTE: We read from `__dict__`, so that subclasses don't reuse the tags of their parent
+    media_tags: Optional[MediaTags] = comp_cls.__dict__.get("_media_tags", None)
+    if (
+        media_tags is None
+        or media_tags.version != _media_tags_version
+        or media_tags.script_prefix != script_prefix
+        or media_tags.urlconf != urlconf
+        or media_tags.media_class is not media_class
+    ):
+        media_tags = _gen_media_tags(comp_cls, script_prefix, urlconf, media_class)
+        comp_cls._media_tags = media_tags
+    return media_tags
+
+
+def _gen_media_tags(
+    comp_cls: Type["Component"],
+    script_prefix: str,
+    urlconf: Any,
+    media_class: Optional[Type[Media]],
+) -> MediaTags:
+    # NOTE: We instantiate the component class so the `Media` are processed into `media`
+    media: Media = comp_cls().media
+
+    js_endpoint: Optional[Tuple[str, str]] = None
+    if _is_nonempty_str(comp_cls.js):
+        js_url = get_script_url("js", comp_cls)
+        js_endpoint = (Media(js=[js_url]).render_js()[0], js_url)
+
+    css_endpoint: Optional[Tuple[str, str]] = None
+    if _is_nonempty_str(comp_cls.css):
+        css_url = get_script_url("css", comp_cls)
+        css_endpoint = (list(Media(css={"all": [css_url]}).render_css())[0], css_url)
+
+    return MediaTags(
+        version=_media_tags_version,
+        script_prefix=script_prefix,
+        urlconf=urlconf,
+        media_class=media_class,
+        js=_extract_media_tag_urls("js", media.render_js()),
+        css=_extract_media_tag_urls("css", media.render_css()),
+        js_endpoint=js_endpoint,
+        css_endpoint=css_endpoint,
+    )
+
+
+def _extract_media_tag_urls(
     script_type: ScriptType,
-    tags: List[str],
-) -> Tuple[List[str], List[str]]:
-    urls: List[str] = []
-    tags_by_url: Dict[str, str] = {}
+    tags: Iterable[str],
+) -> List[Tuple[str, str]]:
+    tags_with_urls: List[Tuple[str, str]] = []
 
     for tag in tags:
         node = SoupNode.from_fragment(tag.strip())[0]
@@ -579,8 +1104,17 @@ def _postprocess_media_tags(
                 f"you must move the content to a `.{script_type}` file and reference it via '{attr}'.\nGot:\n{tag}"
             )
 
-        url = cast(str, maybe_url)
+        tags_with_urls.append((tag, cast(str, maybe_url)))
+
+    return tags_with_urls
+
+
+# Detect duplicates by URLs, and split the tags and URLs
+def _dedupe_media_tags(tags_with_urls: Iterable[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+    urls: List[str] = []
+    tags_by_url: Dict[str, str] = {}
 
+    for tag, url in tags_with_urls:
         # Skip duplicates
         if url in tags_by_url:
             continue
@@ -597,13 +1131,17 @@ def _postprocess_media_tags(
 def _prepare_tags_and_urls(
     data: Iterable[str],
     type: RenderType,
-) -> Tuple[List[str], List[str], List[str], List[str], List[str], List[str]]:
-    to_load_js_urls: List[str] = []
-    to_load_css_urls: List[str] = []
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], List[str], List[str], List[str], List[str]]:
+    to_load_js_tags: List[Tuple[str, str]] = []
+    to_load_css_tags: List[Tuple[str, str]] = []
     inlined_js_tags: List[str] = []
     inlined_css_tags: List[str] = []
     loaded_js_urls: List[str] = []
     loaded_css_urls: List[str] = []
+    # With `COMPONENTS.bundle_dependencies`, the JS / CSS is not inlined, but loaded from a bundle
+    bundle = type == "document" and app_settings.BUNDLE_DEPENDENCIES
+    bundled_js_classes: List[Type["Component"]] = []
+    bundled_css_classes: List[Type["Component"]] = []
 
     # When `type="document"`, we insert the actual <script> and <style> tags into the HTML.
     # But even in that case we still need to call `Components.manager.markScriptLoaded`,
@@ -615,29 +1153,43 @@ def _prepare_tags_and_urls(
         # So, in that case we inline the style into the HTML (See `_link_dependencies_with_component_html`),
         # which means that we are NOT going to load / inline it again.
         comp_cls = comp_hash_mapping[comp_cls_hash]
+        media_tags = _get_media_tags(comp_cls)
 
+        # NOTE: Skip fetching of inlined JS/CSS if it's not defined or empty for given component
         if type == "document":
-            # NOTE: Skip fetching of inlined JS/CSS if it's not defined or empty for given component
-            if _is_nonempty_str(comp_cls.js):
-                inlined_js_tags.append(_get_script_tag("js", comp_cls))
-                loaded_js_urls.append(get_script_url("js", comp_cls))
-
-            if _is_nonempty_str(comp_cls.css):
-                inlined_css_tags.append(_get_script_tag("css", comp_cls))
-                loaded_css_urls.append(get_script_url("css", comp_cls))
+            # NOTE: The JS / CSS exported by `collectcomponents` is loaded from the static files, not from a bundle
+            if media_tags.js_endpoint is not None:
+                if bundle and _get_static_script_url("js", comp_cls) is None:
+                    bundled_js_classes.append(comp_cls)
+                else:
+                    inlined_js_tags.append(_get_script_tag("js", comp_cls))
+                loaded_js_urls.append(media_tags.js_endpoint[1])
+
+            if media_tags.css_endpoint is not None:
+                if bundle and _get_static_script_url("css", comp_cls) is None:
+                    bundled_css_classes.append(comp_cls)
+                else:
+                    inlined_css_tags.append(_get_script_tag("css", comp_cls))
+                loaded_css_urls.append(media_tags.css_endpoint[1])
 
         # When NOT a document (AKA is a fragment), then scripts are NOT inserted into
         # the HTML, and instead we fetch and load them all via our JS dependency manager.
         else:
-            if _is_nonempty_str(comp_cls.js):
-                to_load_js_urls.append(get_script_url("js", comp_cls))
+            if media_tags.js_endpoint is not None:
+                to_load_js_tags.append(media_tags.js_endpoint)
 
-            if _is_nonempty_str(comp_cls.css):
-                to_load_css_urls.append(get_script_url("css", comp_cls))
+            if media_tags.css_endpoint is not None:
+                to_load_css_tags.append(media_tags.css_endpoint)
+
+    # The bundles take the place of the inlined tags
+    if bundled_js_classes:
+        inlined_js_tags.append(_get_bundle_tag("js", bundled_js_classes))
+    if bundled_css_classes:
+        inlined_css_tags.append(_get_bundle_tag("css", bundled_css_classes))
 
     return (
-        to_load_js_urls,
-        to_load_css_urls,
+        to_load_js_tags,
+        to_load_css_tags,
         inlined_js_tags,
         inlined_css_tags,
         loaded_js_urls,
@@ -651,15 +1203,22 @@ def get_script_content(
 ) -> SafeString:
     comp_cls_hash = _hash_comp_cls(comp_cls)
     cache_key = _gen_cache_key(comp_cls_hash, script_type)
-    script = comp_media_cache.get(cache_key)
+    script = get_media_cache().get(cache_key)
 
-    return script
+    return cast(SafeString, script)
 
 
 def _get_script_tag(
     script_type: ScriptType,
     comp_cls: Type["Component"],
 ) -> SafeString:
+    # Reference the file exported by the `collectcomponents` command, instead of inlining the script
+    static_url = _get_static_script_url(script_type, comp_cls)
+    if static_url is not None:
+        if script_type == "js":
+            return Media(js=[static_url]).render_js()[0]
+        return list(Media(css={"all": [static_url]}).render_css())[0]
+
     script = get_script_content(script_type, comp_cls)
 
     if script_type == "js":
@@ -687,14 +1246,192 @@ def get_script_url(
     comp_cls: Type["Component"],
 ) -> str:
     comp_cls_hash = _hash_comp_cls(comp_cls)
+    content_hash = get_media_cache().get(_gen_hash_cache_key(_gen_cache_key(comp_cls_hash, script_type)))
+
+    # The script was exported as a static file by the `collectcomponents` command
+    static_path = _get_static_script_path(comp_cls_hash, script_type, cast(Optional[str], content_hash))
+    if static_path is not None:
+        return settings.STATIC_URL + static_path
+
+    # If we know the content, then its hash is part of the URL, e.g. `/components/cache/MyComp_ab0c2d.1c3e5a7b9d2f.js`,
+    # so the browser can cache the script until the content changes.
+    if content_hash is None:
+        return reverse(
+            CACHE_ENDPOINT_NAME,
+            kwargs={
+                "comp_cls_hash": comp_cls_hash,
+                "script_type": script_type,
+            },
+        )
 
     return reverse(
         CACHE_ENDPOINT_NAME,
         kwargs={
             "comp_cls_hash": comp_cls_hash,
+            "content_hash": cast(str, content_hash)[0:URL_HASH_LENGTH],
+            "script_type": script_type,
+        },
+    )
+
+
+# Paths, relative to `STATIC_ROOT`, where the `collectcomponents` command writes
+# the components' JS / CSS, and the manifest that lists them
+STATIC_DIR = "django_components/cache"
+STATIC_MANIFEST_PATH = "django_components/manifest.json"
+
+# Manifest loaded from `STATIC_ROOT`, as `(manifest_path, paths)`
+_static_manifest: Optional[Tuple[str, Dict[str, str]]] = None
+
+
+def _gen_static_path(comp_cls_hash: str, script_type: ScriptType, content_hash: str) -> str:
+    # E.g. `django_components/cache/MyTable_a91d03.1c3e5a7b9d2f.js`
+    return f"{STATIC_DIR}/{comp_cls_hash}.{content_hash[0:URL_HASH_LENGTH]}.{script_type}"
+
+
+def _get_static_manifest() -> Dict[str, str]:
+    """
+    Returns the paths of the JS / CSS files exported by the `collectcomponents` command, relative to `STATIC_ROOT`,
+    e.g. `{"MyTable_a91d03.js": "django_components/cache/MyTable_a91d03.1c3e5a7b9d2f.js"}`.
+
+    Returns an empty dict if there is no manifest, or if it's invalid.
+
+    NOTE: The manifest is read only once, so the server must be restarted to pick up
+    a manifest that was created or changed by another process.
+    """
+    global _static_manifest
+
+    if not getattr(settings, "STATIC_ROOT", None) or not getattr(settings, "STATIC_URL", None):
+        return {}
+
+    manifest_path = os.path.join(settings.STATIC_ROOT, STATIC_MANIFEST_PATH)
+    if _static_manifest is None or _static_manifest[0] != manifest_path:
+        try:
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                paths: Dict[str, str] = json.load(manifest_file)["paths"]
+        except FileNotFoundError:
+            paths = {}
+        except (ValueError, KeyError, TypeError) as err:
+            logger.warning(f"Ignoring invalid manifest '{manifest_path}': {err!r}")
+            paths = {}
+        _static_manifest = (manifest_path, paths)
+
+    return _static_manifest[1]
+
+
+def _get_static_script_path(
+    comp_cls_hash: str,
+    script_type: ScriptType,
+    content_hash: Optional[str],
+) -> Optional[str]:
+    static_path = _get_static_manifest().get(f"{comp_cls_hash}.{script_type}", None)
+
+    # Use the static file only if it has the same content as the component, e.g. it may be outdated
+    # if the JS / CSS was changed after running `collectcomponents`.
+    if static_path is None or content_hash is None:
+        return None
+    if static_path != _gen_static_path(comp_cls_hash, script_type, content_hash):
+        return None
+    return static_path
+
+
+def _get_static_script_url(
+    script_type: ScriptType,
+    comp_cls: Type["Component"],
+) -> Optional[str]:
+    manifest = _get_static_manifest()
+    if not manifest:
+        return None
+
+    comp_cls_hash = _hash_comp_cls(comp_cls)
+    content_hash = get_media_cache().get(_gen_hash_cache_key(_gen_cache_key(comp_cls_hash, script_type)))
+    static_path = _get_static_script_path(comp_cls_hash, script_type, cast(Optional[str], content_hash))
+    return settings.STATIC_URL + static_path if static_path is not None else None
+
+
+BUNDLE_PREFIX = "bundle_"
+# Scripts are separated with a semicolon, in case one of them doesn't end with it
+_BUNDLE_SEPARATORS = {"js": "\n;\n", "css": "\n"}
+
+
+def _gen_bundle(
+    script_type: ScriptType,
+    comp_classes: List[Type["Component"]],
+) -> Tuple[str, str]:
+    """
+    Concatenate the inlined JS or CSS of the given component classes.
+
+    Returns a tuple of `(bundle_name, content)`, where the name contains the hash of the content.
+    """
+    scripts = [get_script_content(script_type, comp_cls) for comp_cls in comp_classes]
+    content = _BUNDLE_SEPARATORS[script_type].join(script for script in scripts if script is not None)
+    bundle_name = BUNDLE_PREFIX + md5(content.encode()).hexdigest()[0:URL_HASH_LENGTH]
+    return bundle_name, content
+
+
+def _get_bundle_tag(
+    script_type: ScriptType,
+    comp_classes: List[Type["Component"]],
+) -> str:
+    bundle_name, content = _gen_bundle(script_type, comp_classes)
+    # NOTE: The bundle is served by the same endpoint as the components' JS / CSS.
+    _cache_media_entry(_gen_cache_key(bundle_name, script_type), content)
+
+    url = reverse(
+        CACHE_ENDPOINT_NAME,
+        kwargs={
+            "comp_cls_hash": bundle_name,
             "script_type": script_type,
         },
     )
+    # The URL lists the bundled components, so the bundle can be created again
+    # by a process that didn't render the page. See `cached_script_view()`.
+    # NOTE: The hashes contain only characters that are safe in URLs, e.g. `MyTable_a91d03`
+    url += "?components=" + ",".join(_hash_comp_cls(comp_cls) for comp_cls in comp_classes)
+
+    if script_type == "js":
+        return Media(js=[url]).render_js()[0]
+    else:
+        return list(Media(css={"all": [url]}).render_css())[0]
+
+
+def _recreate_bundle(
+    bundle_name: str,
+    script_type: ScriptType,
+    comp_cls_hashes: List[str],
+) -> Optional[str]:
+    comp_classes: List[Type["Component"]] = []
+    for comp_cls_hash in comp_cls_hashes:
+        comp_cls = comp_hash_mapping.get(comp_cls_hash, None)
+        if comp_cls is None:
+            return None
+        comp_classes.append(comp_cls)
+        cache_inlined_js(comp_cls, comp_cls.js or "")
+        cache_inlined_css(comp_cls, comp_cls.css or "")
+
+    # Serve the bundle only if it's the same as the one that was requested
+    new_bundle_name, content = _gen_bundle(script_type, comp_classes)
+    if new_bundle_name != bundle_name:
+        return None
+
+    _cache_media_entry(_gen_cache_key(bundle_name, script_type), content)
+    return content
+
+
+def _recreate_script(comp_cls_hash: str, script_type: ScriptType) -> Optional[str]:
+    # NOTE: The script type comes from the URL, so it may be anything, e.g. `.txt`
+    if script_type not in _CONTENT_TYPES:
+        return None
+
+    comp_cls = comp_hash_mapping.get(comp_cls_hash, None)
+    if comp_cls is None:
+        return None
+
+    script = comp_cls.js if script_type == "js" else comp_cls.css
+    if not _is_nonempty_str(script):
+        return None
+
+    _cache_script(comp_cls, cast(str, script), script_type)
+    return cast(str, script).strip()
 
 
 def _gen_exec_script(
@@ -733,48 +1470,48 @@ def _gen_exec_script(
 
 
 def _insert_js_css_to_default_locations(
-    html_content: str,
-    js_content: Optional[str],
-    css_content: Optional[str],
-) -> Optional[str]:
+    html_content: bytes,
+    js_content: Optional[bytes],
+    css_content: Optional[bytes],
+) -> Optional[bytes]:
     """
     This function tries to insert the JS and CSS content into the default locations.
 
     JS is inserted at the end of `<body>`, and CSS is inserted at the end of `<head>`.
+
+    The HTML is only scanned for the positions of these tags, so the rest of the HTML
+    is returned exactly as it was given.
     """
-    elems = SoupNode.from_fragment(html_content)
+    locations = scan_document(html_content)
+    insertions: List[Tuple[int, bytes]] = []
 
-    if not elems:
-        return None
+    # If the closing tag is omitted, the element ends where the next one starts
+    # (`<body>` for `<head>`), or at the end of the document.
+    if css_content is not None and locations.head_start is not None:
+        css_index = _first_not_none(locations.head_end, locations.body_start, locations.html_end, len(html_content))
+        insertions.append((css_index, css_content))
 
-    did_modify_html = False
-
-    if css_content is not None:
-        for elem in elems:
-            if not elem.is_element():
-                continue
-            head = elem.find_tag("head")
-            if head:
-                css_elems = SoupNode.from_fragment(css_content)
-                head.append_children(css_elems)
-                did_modify_html = True
-
-    if js_content is not None:
-        for elem in elems:
-            if not elem.is_element():
-                continue
-            body = elem.find_tag("body")
-            if body:
-                js_elems = SoupNode.from_fragment(js_content)
-                body.append_children(js_elems)
-                did_modify_html = True
-
-    if did_modify_html:
-        transformed = SoupNode.to_html_multiroot(elems)
-        return transformed
-    else:
+    if js_content is not None and locations.body_start is not None:
+        js_index = _first_not_none(locations.body_end, locations.html_end, len(html_content))
+        insertions.append((js_index, js_content))
+
+    if not insertions:
         return None  # No changes made
 
+    insertions.sort(key=lambda insertion: insertion[0])
+    parts: List[bytes] = []
+    prev_index = 0
+    for index, insert_content in insertions:
+        parts.append(html_content[prev_index:index])
+        parts.append(insert_content)
+        prev_index = index
+    parts.append(html_content[prev_index:])
+    return b"".join(parts)
+
+
+def _first_not_none(*values: Optional[int]) -> int:
+    return next(value for value in values if value is not None)
+
 
 #########################################################
 # 4. Endpoints for fetching the JS / CSS scripts from within
@@ -784,6 +1521,21 @@ def _insert_js_css_to_default_locations(
 
 CACHE_ENDPOINT_NAME = "components_cached_script"
 _CONTENT_TYPES = {"js": "text/javascript", "css": "text/css"}
+# Number of characters of the content hash that are used in the URLs
+URL_HASH_LENGTH = 12
+# URLs with the hash of the content never change their content, so they can be cached "forever"
+_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+# Compressed variants of the scripts are created on the first request that accepts them.
+# Brotli is used only if the `brotli` package is installed.
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda content: gzip.compress(content, compresslevel=9, mtime=0),
+}
+if brotli is not None:
+    _COMPRESSORS = {"br": lambda content: brotli.compress(content, quality=11), **_COMPRESSORS}
+_ACCEPT_ENCODING_REGEXES = {encoding: re.compile(rf"\b{encoding}\b") for encoding in _COMPRESSORS}
+# Same as Django's `GZipMiddleware`, small scripts are not compressed, as it's not worth it
+_MIN_COMPRESS_LENGTH = 200
 
 
 def _get_content_types(script_type: ScriptType) -> str:
@@ -793,27 +1545,95 @@ def _get_content_types(script_type: ScriptType) -> str:
     return _CONTENT_TYPES[script_type]
 
 
+def _select_encoding(req: HttpRequest, content: str) -> Optional[str]:
+    if len(content) < _MIN_COMPRESS_LENGTH:
+        return None
+
+    accept_encoding = req.headers.get("Accept-Encoding", "")
+    for encoding, regex in _ACCEPT_ENCODING_REGEXES.items():
+        if regex.search(accept_encoding):
+            return encoding
+    return None
+
+
+def _get_compressed(cache_key: str, content_hash: str, content: str, encoding: str) -> bytes:
+    # NOTE: The key contains the hash, so the compressed variant is never stale
+    compressed_cache_key = f"{cache_key}:{content_hash}:{encoding}"
+    media_cache = get_media_cache()
+    compressed = media_cache.get(compressed_cache_key)
+    if compressed is None:
+        compressed = _COMPRESSORS[encoding](content.encode())
+        media_cache.set(compressed_cache_key, compressed)
+    return cast(bytes, compressed)
+
+
 def cached_script_view(
     req: HttpRequest,
     comp_cls_hash: str,
     script_type: ScriptType,
+    content_hash: Optional[str] = None,
 ) -> HttpResponse:
     if req.method != "GET":
         return HttpResponseNotAllowed(["GET"])
 
     # Otherwise check if the file is among the dynamically generated files in the cache
     cache_key = _gen_cache_key(comp_cls_hash, script_type)
-    script = comp_media_cache.get(cache_key)
+    media_cache = get_media_cache()
+    script = cast(Optional[str], media_cache.get(cache_key))
+
+    # The script may have been created by another process, or removed from the media cache
+    if script is None and comp_cls_hash.startswith(BUNDLE_PREFIX):
+        if script_type in _BUNDLE_SEPARATORS and req.GET.get("components"):
+            script = _recreate_bundle(comp_cls_hash, script_type, req.GET["components"].split(","))
+    elif script is None:
+        script = _recreate_script(comp_cls_hash, script_type)
 
     if script is None:
         return HttpResponseNotFound()
 
     content_type = _get_content_types(script_type)
-    return HttpResponse(content=script, content_type=content_type)
+    script_hash = cast(Optional[str], media_cache.get(_gen_hash_cache_key(cache_key)))
+    if script_hash is None:
+        script_hash = md5(script.encode()).hexdigest()
+
+    # Each encoding of the script is a different representation, so it needs a different ETag
+    encoding = _select_encoding(req, script)
+    etag = f'"{script_hash}"' if encoding is None else f'"{script_hash}-{encoding}"'
+
+    response = get_conditional_response(req, etag=etag)
+    if response is None:
+        if encoding is None:
+            response = HttpResponse(content=script, content_type=content_type)
+        else:
+            compressed = _get_compressed(cache_key, script_hash, script, encoding)
+            response = HttpResponse(content=compressed, content_type=content_type)
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Accept-Encoding"])
+
+    # The content behind the URL changes only if the URL doesn't contain the hash of the content
+    # (or if the hash doesn't match, e.g. when the content changed after a deploy).
+    is_immutable = comp_cls_hash.startswith(BUNDLE_PREFIX) or (
+        content_hash is not None and script_hash[0:URL_HASH_LENGTH] == content_hash
+    )
+    if is_immutable:
+        patch_cache_control(response, public=True, max_age=_IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+
+    return response
 
 
 urlpatterns = [
-    # E.g. `/components/cache/table.js`
+    # E.g. `/components/cache/table_10bac31.1c3e5a7b9d2f.js`
+    # NOTE: Must be before the pattern without the hash, as that would match it too
+    path(
+        "cache/<str:comp_cls_hash>.<str:content_hash>.<str:script_type>",
+        cached_script_view,
+        name=CACHE_ENDPOINT_NAME,
+    ),
+    # E.g. `/components/cache/table_10bac31.js`
     path("cache/<str:comp_cls_hash>.<str:script_type>", cached_script_view, name=CACHE_ENDPOINT_NAME),
 ]
 
@@ -823,12 +1643,14 @@ urlpatterns = [
 #    aggregating logic on all HTML responses.
 #########################################################
 
+
 def decide_render_type_htmx(request: HttpRequest) -> Literal["fragment", "document"]:
     assert hasattr(request, "htmx"), "The htmx middleware is not installed"
     if request.htmx:
         return "fragment"
     return "document"
 
+
 @sync_and_async_middleware
 class ComponentDependencyMiddleware:
     """
@@ -847,6 +1669,8 @@ class ComponentDependencyMiddleware:
         if iscoroutinefunction(self):
             return self.__acall__(request)
 
+        # NOTE: The dependencies are NOT collected with `collect_dependencies()` here, because the view
+        #       may use the rendered HTML in other ways than in the response, e.g. in JSON.
         response = self._get_response(request)
         response = self._process_response(request, response)
         return response
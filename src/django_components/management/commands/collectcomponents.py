@@ -0,0 +1,80 @@
+import json
+import os
+from hashlib import md5
+from typing import Any, Dict, Optional, Set, Tuple, Type, cast
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_components.app_settings import app_settings
+from django_components.autodiscovery import autodiscover, import_libraries
+from django_components.component import Component
+from django_components.component_registry import all_registries
+from django_components.dependencies import (
+    STATIC_MANIFEST_PATH,
+    ScriptType,
+    _gen_static_path,
+    _hash_comp_cls,
+    _is_nonempty_str,
+    invalidate_media_tags,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the JS / CSS of all registered components to STATIC_ROOT, as files with the hash of their content"
+        " in their names, together with a manifest. The components then load their JS / CSS from the static files,"
+        " so it can be served by a web server or a CDN instead of Django."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not settings.STATIC_ROOT:
+            raise CommandError("The STATIC_ROOT setting must be set to collect the components' JS and CSS")
+
+        import_libraries()
+        if app_settings.AUTODISCOVER:
+            autodiscover()
+
+        # E.g. `{"MyTable_a91d03.js": "django_components/cache/MyTable_a91d03.1c3e5a7b9d2f.js"}`
+        paths: Dict[str, str] = {}
+        seen: Set[Type[Component]] = set()
+        for registry in all_registries:
+            for comp_cls in registry.all().values():
+                if comp_cls in seen:
+                    continue
+                seen.add(comp_cls)
+
+                scripts: Tuple[Tuple[ScriptType, Optional[str]], ...] = (("js", comp_cls.js), ("css", comp_cls.css))
+                for script_type, script in scripts:
+                    if not _is_nonempty_str(script):
+                        continue
+                    path = self._write_script(comp_cls, script_type, cast(str, script))
+                    paths[f"{_hash_comp_cls(comp_cls)}.{script_type}"] = path
+                    if options["verbosity"] >= 2:
+                        self.stdout.write(f"Written '{path}'")
+
+        manifest = {"version": 1, "paths": dict(sorted(paths.items()))}
+        self._write_file(STATIC_MANIFEST_PATH, json.dumps(manifest, indent=2).encode())
+
+        # Use the new manifest also in this process
+        invalidate_media_tags()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Collected {len(paths)} JS / CSS files of {len(seen)} components to '{settings.STATIC_ROOT}'"
+            )
+        )
+
+    def _write_script(self, comp_cls: Type[Component], script_type: ScriptType, script: str) -> str:
+        # NOTE: Same content and hash as when the script is stored in the media cache
+        content = script.strip()
+        content_hash = md5(content.encode()).hexdigest()
+        path = _gen_static_path(_hash_comp_cls(comp_cls), script_type, content_hash)
+        self._write_file(path, content.encode())
+        return path
+
+    def _write_file(self, path: str, content: bytes) -> None:
+        file_path = os.path.join(settings.STATIC_ROOT, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file:
+            file.write(content)
@@ -0,0 +1,36 @@
+from time import perf_counter
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from django_components.warmup import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the templates, and populate the JS / CSS caches of all registered components,"
+        " so it doesn't have to be done on their first render. Prints how long it took for each component."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--slowest",
+            type=int,
+            default=None,
+            help="Only list this many components that took the longest to warm up",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        start = perf_counter()
+        results = warmup()
+        total = perf_counter() - start
+
+        listed = sorted(results, key=lambda result: result.duration, reverse=True)
+        if options["slowest"] is not None:
+            listed = listed[: options["slowest"]]
+
+        if options["verbosity"] >= 1:
+            for result in listed:
+                self.stdout.write(f"{result.duration * 1000:8.2f} ms  {result.name}")
+
+        self.stdout.write(self.style.SUCCESS(f"Warmed up {len(results)} components in {total * 1000:.2f} ms"))
@@ -14,6 +14,7 @@ from typing import (
     Protocol,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -21,14 +22,17 @@ from typing import (
 )
 
 from django.template import Context
-from django.template.base import NodeList, TextNode
+from django.template.base import Node, NodeList, TextNode
+from django.template.defaulttags import CommentNode
 from django.template.exceptions import TemplateSyntaxError
+from django.template.loader_tags import BlockNode, IncludeNode
 from django.utils.safestring import SafeString, mark_safe
 
 from django_components.app_settings import ContextBehavior
 from django_components.context import (
     _COMPONENT_SLOT_CTX_CONTEXT_KEY,
-    _INJECT_CONTEXT_KEY_PREFIX,
+    _FILL_VARS_LAYER_CONTEXT_KEY,
+    _PROVIDED_CONTEXT_KEY,
     _REGISTRY_CONTEXT_KEY,
     _ROOT_CTX_CONTEXT_KEY,
 )
@@ -328,9 +332,8 @@ class SlotNode(BaseNode):
         # {% provide "abc" val=123 %}
         #   {% slot "content" %}{% endslot %}
         # {% endprovide %}
-        for key, value in context.flatten().items():
-            if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-                extra_context[key] = value
+        if _PROVIDED_CONTEXT_KEY in context:
+            extra_context[_PROVIDED_CONTEXT_KEY] = context[_PROVIDED_CONTEXT_KEY]
 
         slot_ref = SlotRef(self, context)
 
@@ -471,6 +474,9 @@ class FillNode(BaseNode):
         if collected_fills is None:
             return
 
+        collected_fills.append(self.resolve_fill(context))
+
+    def resolve_fill(self, context: Context) -> "FillWithData":
         # NOTE: It's important that we use the context given to the fill tag, so it accounts
         #       for any variables set via e.g. for-loops.
         data = self.resolve_kwargs(context)
@@ -492,11 +498,15 @@ class FillNode(BaseNode):
         # NOTE: We want to capture only variables that were defined WITHIN
         # `{% component %} ... {% endcomponent %}`. Hence we search for the last
         # index of `FILL_GEN_CONTEXT_KEY`.
+        #
+        # NOTE: When the fills were found at compile time (see `resolve_fills()`), there are no
+        # such variables, as the `{% fill %}` tags are direct children of the `{% component %}` tag.
         index_of_new_layers = get_last_index(context.dicts, lambda d: FILL_GEN_CONTEXT_KEY in d)
-        for dict_layer in context.dicts[index_of_new_layers:]:
-            for key, value in dict_layer.items():
-                if not key.startswith("_"):
-                    data.extra_context[key] = value
+        if index_of_new_layers is not None:
+            for dict_layer in context.dicts[index_of_new_layers:]:
+                for key, value in dict_layer.items():
+                    if not key.startswith("_"):
+                        data.extra_context[key] = value
 
         # To allow using the variables from the forloops inside the fill tags, we need to
         # capture those variables too.
@@ -528,7 +538,7 @@ class FillNode(BaseNode):
                 layer["forloop"] = layer["forloop"].copy()
                 data.extra_context.update(layer)
 
-        collected_fills.append(data)
+        return data
 
 
 #######################################
@@ -548,6 +558,7 @@ def resolve_fills(
     context: Context,
     nodelist: NodeList,
     component_name: str,
+    static_fills: Optional[List[FillNode]] = None,
 ) -> Dict[SlotName, Slot]:
     """
     Given a component body (`django.template.NodeList`), find all slot fills,
@@ -594,13 +605,24 @@ def resolve_fills(
         {% endfor %}
     {% endcomponent %}
     ```
+
+    To find the fills, the body is rendered once, and the `{% fill %}` tags that were
+    rendered are collected. This is skipped if the fills were already found
+    when the template was parsed (see `analyze_fills()`), which is passed as `static_fills`.
     """
     slots: Dict[SlotName, Slot] = {}
 
     if not nodelist:
         return slots
 
-    maybe_fills = _extract_fill_content(nodelist, context, component_name)
+    maybe_fills: Union[List[FillWithData], Literal[False]]
+    if static_fills is None:
+        maybe_fills = _extract_fill_content(nodelist, context, component_name)
+    elif static_fills:
+        maybe_fills = [fill.resolve_fill(context) for fill in static_fills]
+        _check_duplicate_fills(maybe_fills, component_name)
+    else:
+        maybe_fills = False
 
     # The content has no fills, so treat it as default slot, e.g.:
     # {% component "mycomponent" %}
@@ -660,9 +682,13 @@ def _extract_fill_content(
             "The component body rendered content: {content}"
         )
 
-    # Check for any duplicates
+    _check_duplicate_fills(captured_fills, component_name)
+    return captured_fills
+
+
+def _check_duplicate_fills(fills: List[FillWithData], component_name: str) -> None:
     seen_names: Set[str] = set()
-    for fill in captured_fills:
+    for fill in fills:
         if fill.name in seen_names:
             raise TemplateSyntaxError(
                 f"Multiple fill tags cannot target the same slot name in component '{component_name}': "
@@ -670,7 +696,47 @@ def _extract_fill_content(
             )
         seen_names.add(fill.name)
 
-    return captured_fills
+
+def analyze_fills(nodelist: NodeList, component_node_cls: Type[Node]) -> Optional[List[FillNode]]:
+    """
+    Find the `{% fill %}` tags of a component body when the template is parsed,
+    so `resolve_fills()` doesn't have to render the body to find them.
+
+    Returns:
+    - List of `FillNode`s, if the body consists only of `{% fill %}` tags (and whitespace).
+    - Empty list, if the body can NOT contain any `{% fill %}` tags, and so it's all default slot.
+    - `None`, if the fills may be generated only at render time, e.g. by `{% for %}` or `{% include %}`.
+
+    `{% fill %}` tags inside nested `{% component %}` tags (`component_node_cls`) belong
+    to the nested components, and so are ignored.
+    """
+    fills = [node for node in nodelist if isinstance(node, FillNode)]
+    if fills:
+        for node in nodelist:
+            is_whitespace = isinstance(node, TextNode) and not node.s.strip()
+            if not isinstance(node, (FillNode, CommentNode)) and not is_whitespace:
+                return None
+        return fills
+
+    return [] if not _may_contain_fills(nodelist, component_node_cls) else None
+
+
+def _may_contain_fills(nodelist: NodeList, component_node_cls: Type[Node]) -> bool:
+    for node in nodelist:
+        if isinstance(node, component_node_cls):
+            continue
+        # `{% include %}` and `{% block %}` render content from other templates, which may contain fills.
+        # The same may be true for tags from 3rd party libraries.
+        if isinstance(node, (FillNode, IncludeNode, BlockNode)):
+            return True
+        if not type(node).__module__.startswith(("django.", "django_components.")):
+            return True
+
+        for attr in node.child_nodelists:
+            child_nodelist = getattr(node, attr, None)
+            if child_nodelist and _may_contain_fills(child_nodelist, component_node_cls):
+                return True
+    return False
 
 
 #######################################
@@ -716,6 +782,39 @@ def _nodelist_to_slot_render_func(
                 f"Slot default alias in fill '{slot_name}' must be a valid identifier. Got '{default_var}'"
             )
 
+    # The same `{% fill %}` or `{% slot %}` tag is rendered on each render of the component,
+    # so we create the render function only once, and store it on the nodelist.
+    # This is NOT possible if the fill captured variables, e.g. from a for-loop.
+    if extra_context:
+        return _compile_slot(nodelist, data_var, default_var, extra_context)
+
+    slot_cache: Optional[Dict[Tuple[Optional[str], Optional[str]], Slot]] = getattr(nodelist, "_dc_slots", None)
+    if slot_cache is None:
+        slot_cache = {}
+        nodelist._dc_slots = slot_cache  # type: ignore[attr-defined]
+
+    cache_key = (data_var, default_var)
+    slot = slot_cache.get(cache_key, None)
+    if slot is None:
+        slot = slot_cache[cache_key] = _compile_slot(nodelist, data_var, default_var, None)
+    return slot
+
+
+def _compile_slot(
+    nodelist: NodeList,
+    data_var: Optional[str],
+    default_var: Optional[str],
+    extra_context: Optional[Dict[str, Any]],
+) -> Slot:
+    # Content made only of text renders always the same
+    if all(isinstance(node, TextNode) for node in nodelist):
+        text_content = mark_safe("".join(cast(TextNode, node).s for node in nodelist))
+
+        def render_text(ctx: Context, slot_data: Dict[str, Any], slot_ref: SlotRef) -> SlotResult:
+            return text_content
+
+        return Slot(content_func=cast(SlotFunc, render_text))
+
     def render_func(ctx: Context, slot_data: Dict[str, Any], slot_ref: SlotRef) -> SlotResult:
         # Expose the kwargs that were passed to the `{% slot %}` tag. These kwargs
         # are made available through a variable name that was set on the `{% fill %}`
@@ -728,48 +827,45 @@ def _nodelist_to_slot_render_func(
         if default_var:
             ctx[default_var] = slot_ref
 
-        # NOTE: If a `{% fill %}` tag inside a `{% component %}` tag is inside a forloop,
-        # the `extra_context` contains the forloop variables. We want to make these available
-        # to the slot fill content.
-        #
-        # However, we cannot simply append the `extra_context` to the Context as the latest stack layer
-        # because then the forloop variables override the slot fill variables. Instead, we have to put
-        # the `extra_context` into the correct layer.
-        #
-        # Currently the `extra_context` is set only in `FillNode._extract_fill()` method
-        # that is run when we render a `{% component %}` tag inside a template, and we need
-        # to extract the fills from the tag's body.
-        #
-        # Thus, when we get here and `extra_context` is not None, it means that the component
-        # is being rendered from within the template. And so we know that we're inside `Component._render()`.
-        # And that means that the context MUST contain our internal context keys like `_ROOT_CTX_CONTEXT_KEY`.
-        #
-        # And so we want to put the `extra_context` into the same layer that contains `_ROOT_CTX_CONTEXT_KEY`.
-        #
-        # HOWEVER, the layer with `_ROOT_CTX_CONTEXT_KEY` also contains user-defined data from `get_context_data()`.
-        # Data from `get_context_data()` should take precedence over `extra_context`. So we have to insert
-        # the forloop variables BEFORE that.
-        index_of_last_component_layer = get_last_index(ctx.dicts, lambda d: _ROOT_CTX_CONTEXT_KEY in d)
-        if index_of_last_component_layer is None:
-            index_of_last_component_layer = 0
-
-        # TODO: Currently there's one more layer before the `_ROOT_CTX_CONTEXT_KEY` layer, which is
-        #       pushed in `_prepare_template()` in `component.py`.
-        #       That layer should be removed when `Component.get_template()` is removed, after which
-        #       the following line can be removed.
-        index_of_last_component_layer -= 1
-
-        # Insert the `extra_context` into the correct layer of the context stack
-        ctx.dicts.insert(index_of_last_component_layer, extra_context or {})
-
-        rendered = nodelist.render(ctx)
+        return nodelist.render(ctx)
 
-        # After the rendering is done, remove the `extra_context` from the context stack
-        ctx.dicts.pop(index_of_last_component_layer)
+    if not extra_context:
+        return Slot(content_func=cast(SlotFunc, render_func))
 
-        return rendered
-
-    return Slot(content_func=cast(SlotFunc, render_func))
+    # NOTE: If a `{% fill %}` tag inside a `{% component %}` tag is inside a forloop,
+    # the `extra_context` contains the forloop variables. We want to make these available
+    # to the slot fill content.
+    #
+    # However, we cannot simply append the `extra_context` to the Context as the latest stack layer
+    # because then the forloop variables override the slot fill variables. Data from `get_context_data()`
+    # should take precedence over `extra_context` too.
+    #
+    # Instead, each component reserves an empty context layer below its data, see `Component._render()`.
+    # We temporarily set the `extra_context` to that layer, and then restore it.
+    #
+    # Currently the `extra_context` is set only in `FillNode.resolve_fill()` method
+    # that is run when we render a `{% component %}` tag inside a template, and we need
+    # to extract the fills from the tag's body.
+    def render_func_with_extra_context(ctx: Context, slot_data: Dict[str, Any], slot_ref: SlotRef) -> SlotResult:
+        fill_vars_layer: Optional[Dict[str, Any]] = ctx.get(_FILL_VARS_LAYER_CONTEXT_KEY, None)
+
+        # Rendering outside of a component
+        if fill_vars_layer is None:
+            with ctx.update(extra_context):
+                return render_func(ctx, slot_data, slot_ref)
+
+        prev_values = {key: fill_vars_layer[key] for key in extra_context if key in fill_vars_layer}
+        fill_vars_layer.update(extra_context)
+        try:
+            return render_func(ctx, slot_data, slot_ref)
+        finally:
+            for key in extra_context:
+                if key in prev_values:
+                    fill_vars_layer[key] = prev_values[key]
+                else:
+                    del fill_vars_layer[key]
+
+    return Slot(content_func=cast(SlotFunc, render_func_with_extra_context))
 
 
 def _is_extracting_fill(context: Context) -> bool:
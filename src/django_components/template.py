@@ -1,9 +1,24 @@
-from typing import Any, Optional, Type, TypeVar
+import hashlib
+import os
+import pickle
+import platform
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib.metadata import PackageNotFoundError, version
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Tuple, Type, TypeVar
 
-from django.template import Origin, Template
+import django
+from django.template import Engine, Library, Origin, Template
+from django.template.base import UNKNOWN_SOURCE, NodeList
+from django.template.smartif import OPERATORS
 
 from django_components.app_settings import app_settings
+from django_components.component_registry import ComponentRegistry, all_registries
 from django_components.util.cache import LRUCache
+from django_components.util.logger import logger
 from django_components.util.misc import get_import_path
 
 TTemplate = TypeVar("TTemplate", bound=Template)
@@ -12,6 +27,9 @@ TTemplate = TypeVar("TTemplate", bound=Template)
 # Lazily initialize the cache
 template_cache: Optional[LRUCache[Template]] = None
 
+# Import path of the component whose template is being created from a string, see `parsing_component_template()`
+parsing_component_path: ContextVar[Optional[str]] = ContextVar("parsing_component_path", default=None)
+
 
 # Central logic for creating Templates from string, so we can cache the results
 def cached_template(
@@ -61,7 +79,7 @@ def cached_template(
     template_cls = template_cls or Template
     template_cls_path = get_import_path(template_cls)
     engine_cls_path = get_import_path(engine.__class__) if engine else None
-    cache_key = (template_cls_path, template_string, engine_cls_path)
+    cache_key = (template_cls_path, template_string, engine_cls_path, parsing_component_path.get())
 
     maybe_cached_template = template_cache.get(cache_key)
     if maybe_cached_template is None:
@@ -71,3 +89,236 @@ def cached_template(
         template = maybe_cached_template
 
     return template
+
+
+@contextmanager
+def parsing_component_template(comp_cls: Type) -> Generator[None, None, None]:
+    """
+    Mark that the template of given component class is being created from a string.
+
+    Templates created from strings have no name. So with `COMPONENTS.deterministic_ids`,
+    the IDs of the template tags are derived also from the import path of the component.
+    Otherwise the same tags in the templates of different components would get the same IDs.
+    """
+    if not app_settings.DETERMINISTIC_IDS:
+        yield
+        return
+
+    token = parsing_component_path.set(get_import_path(comp_cls))
+    try:
+        yield
+    finally:
+        parsing_component_path.reset(token)
+
+
+#########################################################
+# Persistent (on-disk) cache of parsed templates
+#########################################################
+
+# Bump this when the format of the persisted entries changes
+PERSISTENT_CACHE_FORMAT = 2
+
+try:
+    _dc_version = version("django_components")
+except PackageNotFoundError:
+    _dc_version = "unknown"
+
+_env_fingerprint = "|".join(
+    [
+        f"format={PERSISTENT_CACHE_FORMAT}",
+        f"django_components={_dc_version}",
+        f"django={django.__version__}",
+        f"python={platform.python_implementation()}-{sys.version_info[0]}.{sys.version_info[1]}",
+        f"pickle={pickle.HIGHEST_PROTOCOL}",
+    ]
+)
+
+
+# The operators of the `{% if %}` tag are classes defined inside a function,
+# so they cannot be pickled by reference. Instead we pickle them by their operator key.
+_smartif_operator_keys = {op_cls: key for key, op_cls in OPERATORS.items()}
+
+
+def _new_smartif_operator(key: str) -> Any:
+    op_cls = OPERATORS[key]
+    return op_cls.__new__(op_cls)
+
+
+def _get_library_paths(engine: Engine) -> Dict[Library, str]:
+    # Import paths of the modules that define the template tag libraries available in given engine
+    library_paths = dict(zip(engine.template_builtins, engine.builtins))
+    for name, library in engine.template_libraries.items():
+        library_paths[library] = engine.libraries[name]
+    return library_paths
+
+
+def _get_registry_id(registry: ComponentRegistry, engine: Engine) -> str:
+    """
+    Identify the registry by the import path of its template tag library. Unlike the position
+    of the registry in `all_registries`, this is the same in all processes.
+
+    Raises `PicklingError` if the registry cannot be identified this way, e.g. if its library
+    was not loaded from a module, or if it's shared with other registries.
+    """
+    library = registry.library
+    library_path = _get_library_paths(engine).get(library, None)
+    if library_path is None or sum(1 for reg in all_registries if reg.library is library) != 1:
+        raise pickle.PicklingError("Component registry cannot be identified by its template tag library")
+    return library_path
+
+
+def _get_registry_by_id(registry_id: str, engine: Engine) -> ComponentRegistry:
+    """Inverse of `_get_registry_id()`"""
+    library_paths = _get_library_paths(engine)
+    matches = [reg for reg in all_registries if library_paths.get(reg.library, None) == registry_id]
+    if len(matches) != 1:
+        raise pickle.UnpicklingError(f"Component registry with template tag library '{registry_id}' not found")
+    return matches[0]
+
+
+class _TemplatePickler(pickle.Pickler):
+    """
+    Pickle the template nodes, but store references instead of objects that belong to the running process,
+    like the template engine, template origin (and its loader), or component registries.
+    """
+
+    def __init__(self, file: Any, template: Template, protocol: Optional[int] = None) -> None:
+        super().__init__(file, protocol=protocol)
+        self.template = template
+
+    def reducer_override(self, obj: Any) -> Any:
+        op_key = _smartif_operator_keys.get(type(obj)) if not isinstance(obj, type) else None
+        if op_key is not None:
+            return (_new_smartif_operator, (op_key,), obj.__dict__)
+        return NotImplemented
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, Any]]:
+        if isinstance(obj, Engine):
+            return ("engine", None)
+        elif isinstance(obj, Origin):
+            return ("origin", None)
+        elif isinstance(obj, ComponentRegistry):
+            return ("registry", _get_registry_id(obj, self.template.engine))
+        return None
+
+
+class _TemplateUnpickler(pickle.Unpickler):
+    def __init__(self, file: Any, template: Template) -> None:
+        super().__init__(file)
+        self.template = template
+
+    def persistent_load(self, pid: Tuple[str, Any]) -> Any:
+        kind, value = pid
+        if kind == "engine":
+            return self.template.engine
+        elif kind == "origin":
+            return self.template.origin
+        elif kind == "registry":
+            return _get_registry_by_id(value, self.template.engine)
+        raise pickle.UnpicklingError(f"Unknown persistent reference '{kind}'")
+
+
+def _get_engine_fingerprint(engine: Engine) -> str:
+    # Parsing depends on which tags and filters are available to the template.
+    # E.g. with `component_shorthand_formatter`, each registered component adds its own tag.
+    parts: List[str] = [f"debug={engine.debug}", f"multiline={app_settings.MULTILINE_TAGS}"]
+    # The IDs of the template tags are generated when parsing, see `COMPONENTS.deterministic_ids`
+    parts.append(f"deterministic_ids={app_settings.DETERMINISTIC_IDS}")
+    for library in engine.template_builtins:
+        parts.append(",".join(sorted(library.tags)) + ";" + ",".join(sorted(library.filters)))
+    for name, module_path in sorted(engine.libraries.items()):
+        parts.append(f"{name}={module_path}")
+    # NOTE: Sorted, as the order in which the registries are created may differ between processes
+    parts.extend(sorted(",".join(sorted(registry.library.tags)) for registry in all_registries))
+    return "|".join(parts)
+
+
+def _get_persistent_cache_path(cache_dir: Path, template: Template) -> Path:
+    hasher = hashlib.sha256()
+    hasher.update(_env_fingerprint.encode())
+    hasher.update(b"\0")
+    hasher.update(get_import_path(template.__class__).encode())
+    hasher.update(b"\0")
+    hasher.update(_get_engine_fingerprint(template.engine).encode())
+    hasher.update(b"\0")
+    hasher.update(template.source.encode())
+    hasher.update(b"\0")
+    hasher.update((parsing_component_path.get() or "").encode())
+    return cache_dir / f"{hasher.hexdigest()}.pickle"
+
+
+def load_persisted_nodelist(template: Template, cache_dir: Path) -> Optional[Tuple[NodeList, Dict]]:
+    """
+    Load the parsed nodelist of given template from the
+    [`COMPONENTS.template_cache_dir`](../settings#django_components.app_settings.ComponentsSettings.template_cache_dir)
+    directory.
+
+    Returns `None` if there is no (valid) entry for this template.
+    """  # noqa: E501
+    path = _get_persistent_cache_path(cache_dir, template)
+    try:
+        with path.open("rb") as f:
+            nodelist, extra_data = _TemplateUnpickler(f, template).load()
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        logger.debug(f"Failed to load persisted template '{template.name or UNKNOWN_SOURCE}' from '{path}': {err}")
+        return None
+    return nodelist, extra_data
+
+
+def persist_nodelist(template: Template, cache_dir: Path, nodelist: NodeList, extra_data: Dict) -> None:
+    """
+    Save the parsed nodelist of given template to the
+    [`COMPONENTS.template_cache_dir`](../settings#django_components.app_settings.ComponentsSettings.template_cache_dir)
+    directory.
+
+    If the nodes cannot be pickled, nothing is saved.
+    """  # noqa: E501
+    buffer = BytesIO()
+    try:
+        _TemplatePickler(buffer, template, protocol=pickle.HIGHEST_PROTOCOL).dump((nodelist, extra_data))
+    except Exception as err:
+        logger.debug(f"Template '{template.name or UNKNOWN_SOURCE}' cannot be persisted: {err}")
+        return
+
+    path = _get_persistent_cache_path(cache_dir, template)
+    # Write to a temporary file first, so other processes never read a partially-written entry
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(buffer.getvalue())
+        os.replace(tmp_path, path)
+    except OSError as err:
+        logger.debug(f"Failed to persist template '{template.name or UNKNOWN_SOURCE}' to '{path}': {err}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def monkeypatch_template_compile(template_cls: Type[Template]) -> None:
+    """
+    Modify `Template.compile_nodelist` so that the parsed nodelist is loaded from / saved to
+    the [`COMPONENTS.template_cache_dir`](../settings#django_components.app_settings.ComponentsSettings.template_cache_dir)
+    directory, if set.
+    """  # noqa: E501
+    if hasattr(template_cls, "_dc_compile_patched"):
+        # Do not patch if done so already
+        return
+
+    original_compile_nodelist = template_cls.compile_nodelist
+
+    def _compile_nodelist(self: Template) -> NodeList:
+        cache_dir = app_settings.TEMPLATE_CACHE_DIR
+        if cache_dir is None:
+            return original_compile_nodelist(self)
+
+        persisted = load_persisted_nodelist(self, cache_dir)
+        if persisted is not None:
+            nodelist, self.extra_data = persisted
+            return nodelist
+
+        nodelist = original_compile_nodelist(self)
+        persist_nodelist(self, cache_dir, nodelist, getattr(self, "extra_data", {}))
+        return nodelist
+
+    template_cls.compile_nodelist = _compile_nodelist  # type: ignore[method-assign]
+    template_cls._dc_compile_patched = True  # type: ignore[attr-defined]
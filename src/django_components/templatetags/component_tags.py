@@ -19,8 +19,9 @@ from django.template.base import FilterExpression, NodeList, Parser, TextNode, T
 from django.template.exceptions import TemplateSyntaxError
 from django.utils.safestring import SafeString, mark_safe
 
+from django_components.app_settings import app_settings
 from django_components.attributes import HTML_ATTRS_ATTRS_KEY, HTML_ATTRS_DEFAULTS_KEY, HtmlAttrsNode
-from django_components.component import COMP_ONLY_FLAG, ComponentNode
+from django_components.component import COMP_DEFER_FLAG, COMP_ONLY_FLAG, ComponentNode
 from django_components.component_registry import ComponentRegistry
 from django_components.dependencies import CSS_DEPENDENCY_PLACEHOLDER, JS_DEPENDENCY_PLACEHOLDER
 from django_components.expression import (
@@ -47,8 +48,9 @@ from django_components.slots import (
     SlotNode,
 )
 from django_components.tag_formatter import get_tag_formatter
+from django_components.template import parsing_component_path
 from django_components.util.logger import trace_msg
-from django_components.util.misc import gen_id
+from django_components.util.misc import gen_deterministic_id, gen_id
 from django_components.util.tag_parser import TagAttr, parse_tag_attrs
 
 # NOTE: Variable name `register` is required by Django to recognize this as a template tag library
@@ -156,7 +158,7 @@ def component_css_dependencies(parser: Parser, token: Token, tag_spec: TagSpec)
     If you insert this tag multiple times, ALL CSS links will be duplicately inserted into ALL these places.
     """
     # Parse to check that the syntax is valid
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
     _parse_tag(parser, token, tag_spec, tag_id)
     return _component_dependencies("css")
 
@@ -182,7 +184,7 @@ def component_js_dependencies(parser: Parser, token: Token, tag_spec: TagSpec) -
     If you insert this tag multiple times, ALL JS scripts will be duplicately inserted into ALL these places.
     """
     # Parse to check that the syntax is valid
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
     _parse_tag(parser, token, tag_spec, tag_id)
     return _component_dependencies("js")
 
@@ -322,7 +324,7 @@ def slot(parser: Parser, token: Token, tag_spec: TagSpec) -> SlotNode:
         \"\"\"
     ```
     """
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
     tag = _parse_tag(parser, token, tag_spec, tag_id=tag_id)
 
     slot_name_kwarg = tag.kwargs.kwargs.get(SLOT_NAME_KWARG, None)
@@ -444,7 +446,7 @@ def fill(parser: Parser, token: Token, tag_spec: TagSpec) -> FillNode:
     {% endcomponent %}
     ```
     """
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
     tag = _parse_tag(parser, token, tag_spec, tag_id=tag_id)
 
     fill_name_kwarg = tag.kwargs.kwargs.get(SLOT_NAME_KWARG, None)
@@ -472,7 +474,7 @@ def fill(parser: Parser, token: Token, tag_spec: TagSpec) -> FillNode:
         positional_args_allow_extra=True,  # Allow many args
         keywordonly_args=True,
         repeatable_kwargs=False,
-        flags=[COMP_ONLY_FLAG],
+        flags=[COMP_ONLY_FLAG, COMP_DEFER_FLAG],
     )
 )
 def component(
@@ -577,8 +579,25 @@ def component(
     ```django
     {% component "name" positional_arg keyword_arg=value ... only %}
     ```
+
+    ### Deferring slow components
+
+    When the page is rendered with
+    [`Component.render_to_stream()`](../api#django_components.Component.render_to_stream),
+    you can mark slow components with the `defer` flag:
+
+    ```django
+    {% component "recommendations" user=user defer / %}
+    ```
+
+    In place of the component, an empty placeholder is sent, and the rest of the page
+    is rendered without waiting for the component. The component is rendered after the rest
+    of the page was sent. Its HTML is then added to the end of the stream, and moved
+    to the placeholder by the client-side JS.
+
+    The `defer` flag has no effect when the page is NOT streamed.
     """
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
 
     _fix_nested_tags(parser, token)
     bits = token.split_contents()
@@ -607,6 +626,7 @@ def component(
 
     # Check for isolated context keyword
     isolated_context = tag.flags[COMP_ONLY_FLAG]
+    defer = tag.flags[COMP_DEFER_FLAG]
 
     trace_msg("PARSE", "COMP", result.component_name, tag.id)
 
@@ -620,6 +640,7 @@ def component(
         nodelist=body,
         node_id=tag.id,
         registry=registry,
+        defer=defer,
     )
 
     trace_msg("PARSE", "COMP", result.component_name, tag.id, "...Done!")
@@ -707,7 +728,7 @@ def provide(parser: Parser, token: Token, tag_spec: TagSpec) -> ProvideNode:
     user = self.inject("user_data")["user"]
     ```
     """
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
 
     # e.g. {% provide <name> key=val key2=val2 %}
     tag = _parse_tag(parser, token, tag_spec, tag_id)
@@ -794,7 +815,7 @@ def html_attrs(parser: Parser, token: Token, tag_spec: TagSpec) -> HtmlAttrsNode
     **See more usage examples in
     [HTML attributes](../../concepts/fundamentals/html_attributes#examples-for-html_attrs).**
     """
-    tag_id = gen_id()
+    tag_id = _gen_tag_id(parser, token)
     tag = _parse_tag(parser, token, tag_spec, tag_id)
 
     return HtmlAttrsNode(
@@ -803,6 +824,20 @@ def html_attrs(parser: Parser, token: Token, tag_spec: TagSpec) -> HtmlAttrsNode
     )
 
 
+def _gen_tag_id(parser: Parser, token: Token) -> str:
+    """Generate the ID of a template tag, see `COMPONENTS.deterministic_ids`."""
+    if not app_settings.DETERMINISTIC_IDS:
+        return gen_id()
+
+    # The ID is derived from the template and from the position of the tag within the template.
+    # NOTE: Templates created from strings have no name, so for components' templates
+    #       we use also the import path of the component.
+    tag_index = getattr(parser, "_djc_tag_index", 0) + 1
+    parser._djc_tag_index = tag_index  # type: ignore[attr-defined]
+    origin_name = parser.origin.name if parser.origin is not None else None
+    return gen_deterministic_id(origin_name, parsing_component_path.get(), tag_index, token.contents)
+
+
 class ParsedTag(NamedTuple):
     id: str
     name: str
@@ -1,35 +1,61 @@
+import threading
+from collections import OrderedDict
 from collections.abc import Hashable
-from typing import Dict, Generic, Optional, TypeVar, cast
+from typing import Callable, Generic, NamedTuple, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
 
-class CacheNode(Generic[T]):
-    """A node in the doubly linked list."""
+class CacheStats(NamedTuple):
+    """Snapshot of the counters of an `LRUCache`."""
 
-    def __init__(self, key: Hashable, value: T):
-        self.key = key
-        self.value = value
-        self.prev: Optional["CacheNode"] = None
-        self.next: Optional["CacheNode"] = None
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    """Number of items currently in the cache"""
+    nbytes: int
+    """Total size of the items currently in the cache, as measured by `sizeof`. Always 0 if `sizeof` is not set."""
 
 
 class LRUCache(Generic[T]):
-    """A simple LRU Cache implementation."""
-
-    def __init__(self, maxsize: Optional[int] = None):
+    """
+    A thread-safe LRU Cache implementation.
+
+    All operations are O(1) and guarded by a lock, so the cache can be shared between threads
+    (incl. free-threaded builds of CPython).
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        maxbytes: Optional[int] = None,
+        sizeof: Optional[Callable[[T], int]] = None,
+    ):
         """
         Initialize the LRU cache.
 
         :param maxsize: Maximum number of items the cache can hold. If None, the cache is unbounded.
+        :param maxbytes: Maximum total size of the items, as measured by `sizeof`. If None, the size is unbounded.
+        :param sizeof: Function that returns the size of an item in bytes. Required if `maxbytes` is set.
         """
+        if maxbytes is not None and sizeof is None:
+            raise ValueError("LRUCache: 'sizeof' must be set when 'maxbytes' is set")
+
         self.maxsize = maxsize
-        self.cache: Dict[Hashable, CacheNode[T]] = {}  # Maps keys to nodes in the doubly linked list
-        # Dummy head and tail nodes to simplify operations
-        self.head = CacheNode[T]("", cast(T, None))  # Most recently used
-        self.tail = CacheNode[T]("", cast(T, None))  # Least recently used
-        self.head.next = self.tail
-        self.tail.prev = self.head
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        # Ordered from least recently used to most recently used. Values are `(value, nbytes)`
+        self._data: "OrderedDict[Hashable, Tuple[T, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
 
     def get(self, key: Hashable) -> Optional[T]:
         """
@@ -38,14 +64,16 @@ class LRUCache(Generic[T]):
         :param key: Key to look up in the cache.
         :return: Value associated with the key, or None if not found.
         """
-        if key in self.cache:
-            node = self.cache[key]
-            # Move the accessed node to the front (most recently used)
-            self._remove(node)
-            self._add_to_front(node)
-            return node.value
-        else:
-            return None  # Key not found
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            # Mark the accessed item as most recently used
+            self._data.move_to_end(key)
+            self._hits += 1
+            return entry[0]
 
     def has(self, key: Hashable) -> bool:
         """
@@ -54,58 +82,56 @@ class LRUCache(Generic[T]):
         :param key: Key to check.
         :return: True if the key is in the cache, False otherwise.
         """
-        return key in self.cache
+        with self._lock:
+            return key in self._data
 
     def set(self, key: Hashable, value: T) -> None:
         """
         Insert or update the value associated with the key.
 
+        If the item alone is bigger than `maxbytes`, it is not stored.
+
         :param key: Key to insert or update.
         :param value: Value to associate with the key.
         """
-        if key in self.cache:
-            node = self.cache[key]
-            # Update the value
-            node.value = value
-            # Move the node to the front (most recently used)
-            self._remove(node)
-            self._add_to_front(node)
-        else:
-            if self.maxsize is not None and len(self.cache) >= self.maxsize:
-                # Cache is full; remove the least recently used item
-                lru_node = self.tail.prev
-                if lru_node is None:
-                    raise RuntimeError("LRUCache: Tail node is None")
-                self._remove(lru_node)
-                del self.cache[lru_node.key]
-
-            # Add the new node to the front
-            new_node = CacheNode[T](key, value)
-            self.cache[key] = new_node
-            self._add_to_front(new_node)
+        nbytes = self.sizeof(value) if self.sizeof is not None else 0
+
+        with self._lock:
+            old_entry = self._data.pop(key, None)
+            if old_entry is not None:
+                self._nbytes -= old_entry[1]
+
+            if self.maxbytes is not None and nbytes > self.maxbytes:
+                return
+
+            self._data[key] = (value, nbytes)
+            self._nbytes += nbytes
+
+            # Remove the least recently used items until we're within the limits
+            while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+                self.maxbytes is not None and self._nbytes > self.maxbytes
+            ):
+                _, (_, evicted_nbytes) = self._data.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._evictions += 1
 
     def clear(self) -> None:
-        """Clear the cache."""
-        self.cache.clear()
-        self.head.next = self.tail
-        self.tail.prev = self.head
-
-    def _remove(self, node: CacheNode) -> None:
-        """Remove a node from the doubly linked list."""
-        prev_node = node.prev
-        next_node = node.next
-
-        if prev_node is not None:
-            prev_node.next = next_node
-
-        if next_node is not None:
-            next_node.prev = prev_node
-
-    def _add_to_front(self, node: CacheNode) -> None:
-        """Add a node right after the head (mark it as most recently used)."""
-        node.next = self.head.next
-        node.prev = self.head
-
-        if self.head.next:
-            self.head.next.prev = node
-            self.head.next = node
+        """Clear the cache. The hit / miss / eviction counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Get the hit / miss / eviction counters, and the current size of the cache.
+
+        :return: `CacheStats` tuple.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                nbytes=self._nbytes,
+            )
@@ -1,5 +1,6 @@
+import re
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Sequence
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 
 from bs4 import BeautifulSoup, CData, Comment, Doctype, Tag
 
@@ -106,3 +107,87 @@ class SoupNode(HTMLNode):
 
     def is_element(self) -> bool:
         return isinstance(self.node, Tag)
+
+
+class DocumentLocations(NamedTuple):
+    """
+    Byte offsets of the tags found by `scan_document()`.
+
+    Each offset points to the `<` of the tag, or is `None` if the tag was not found.
+    """
+
+    head_start: Optional[int]
+    head_end: Optional[int]
+    body_start: Optional[int]
+    body_end: Optional[int]
+    html_end: Optional[int]
+
+
+# Matches either the start of a comment, or a whole tag. Quoted attribute values are consumed
+# as a whole, so that e.g. `<div title="</body>">` is not mistaken for the end of `<body>`.
+_HTML_TOKEN_REGEX = re.compile(rb"<!--|<(/?)([a-zA-Z][^\s/>]*)(?:[^>\"']|\"[^\"]*\"|'[^']*')*>")
+_COMMENT_END = b"-->"
+# The content of these elements is not HTML, so it's skipped until the element's end tag
+_RAW_TEXT_END_REGEXES: Dict[bytes, "re.Pattern[bytes]"] = {
+    name: re.compile(rb"</" + name + rb"[\s/>]", re.IGNORECASE)
+    for name in (b"script", b"style", b"textarea", b"title")
+}
+
+
+def scan_document(html: bytes) -> DocumentLocations:
+    """
+    Find the positions of `<head>`, `</head>`, `<body>`, `</body>` and `</html>` in an HTML document,
+    in a single pass and without building a DOM.
+
+    Tag names are case-insensitive. Tags inside comments, inside the content of `<script>`, `<style>`,
+    `<textarea>` and `<title>`, or inside attribute values are ignored. If a tag occurs several times,
+    the first occurrence is used.
+    """
+    head_start: Optional[int] = None
+    head_end: Optional[int] = None
+    body_start: Optional[int] = None
+    body_end: Optional[int] = None
+    html_end: Optional[int] = None
+
+    pos = 0
+    while True:
+        match = _HTML_TOKEN_REGEX.search(html, pos)
+        if match is None:
+            break
+
+        start = match.start()
+        name = match[2]
+        # Comment
+        if name is None:
+            # NOTE: `<!-->` and `<!--->` are also valid (empty) comments
+            comment_end = html.find(_COMMENT_END, start + 2)
+            if comment_end == -1:
+                break
+            pos = comment_end + len(_COMMENT_END)
+            continue
+
+        pos = match.end()
+        name = name.lower()
+        is_end_tag = bool(match[1])
+
+        if not is_end_tag:
+            raw_text_end_regex = _RAW_TEXT_END_REGEXES.get(name, None)
+            if raw_text_end_regex is not None:
+                raw_text_end = raw_text_end_regex.search(html, pos)
+                if raw_text_end is None:
+                    break
+                pos = raw_text_end.start()
+            elif name == b"head" and head_start is None:
+                head_start = start
+            elif name == b"body" and body_start is None:
+                body_start = start
+        elif name == b"head" and head_end is None:
+            head_end = start
+        elif name == b"body" and body_end is None:
+            body_end = start
+            # Nothing after `</body>` changes where the head and body end
+            break
+        elif name == b"html" and html_end is None:
+            html_end = start
+
+    return DocumentLocations(head_start, head_end, body_start, body_end, html_end)
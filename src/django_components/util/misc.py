@@ -1,3 +1,4 @@
+import hashlib
 import re
 from typing import Any, Callable, List, Optional, Type, TypeVar
 
@@ -6,18 +7,34 @@ from django_components.util.nanoid import generate
 T = TypeVar("T")
 
 
+# Alphabet is only alphanumeric. Compared to the default alphabet used by nanoid,
+# we've omitted `-` and `_`.
+ID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ID_SIZE = 6
+
+
 # Based on nanoid implementation from
 # https://github.com/puyuan/py-nanoid/tree/99e5b478c450f42d713b6111175886dccf16f156/nanoid
 def gen_id() -> str:
     """Generate a unique ID that can be associated with a Node"""
-    # Alphabet is only alphanumeric. Compared to the default alphabet used by nanoid,
-    # we've omitted `-` and `_`.
     # With this alphabet, at 6 chars, the chance of collision is 1 in 3.3M.
     # See https://zelark.github.io/nano-id-cc/
-    return generate(
-        "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
-        size=6,
-    )
+    return generate(ID_ALPHABET, size=ID_SIZE)
+
+
+def gen_deterministic_id(*parts: Any) -> str:
+    """
+    Generate an ID that looks like the ones from `gen_id()`, but is derived from the given parts.
+    So the same parts always give the same ID, also across processes.
+    """
+    key = "\x00".join(str(part) for part in parts).encode("utf-8")
+    num = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+    chars = []
+    for _ in range(ID_SIZE):
+        num, index = divmod(num, len(ID_ALPHABET))
+        chars.append(ID_ALPHABET[index])
+    return "".join(chars)
 
 
 def find_last_index(lst: List, predicate: Callable[[Any], bool]) -> Any:
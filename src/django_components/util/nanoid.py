@@ -1,5 +1,68 @@
+import os
+import threading
 from math import ceil, log
-from os import urandom
+from typing import Dict, List
+
+# Random bytes are read from the OS in larger chunks, as one `os.urandom()` call costs
+# about as much as generating several IDs.
+_BUFFER_SIZE = 4096
+
+
+def _get_mask(alphabet_len: int) -> int:
+    mask = 1
+    if alphabet_len > 1:
+        mask = (2 << int(log(alphabet_len - 1) / log(2))) - 1
+    return mask
+
+
+class _IdCharsBuffer:
+    """
+    Random characters of the given alphabet, generated in bulk.
+
+    The random bytes are mapped to the alphabet with `bytes.translate()`, which discards
+    the bytes that fall outside of the alphabet. This is the same as what `generate()`
+    does byte by byte, but much faster.
+    """
+
+    def __init__(self, alphabet: str) -> None:
+        alphabet_bytes = alphabet.encode("ascii")
+        alphabet_len = len(alphabet_bytes)
+        mask = _get_mask(alphabet_len)
+
+        self.table = bytes(alphabet_bytes[byte & mask] if byte & mask < alphabet_len else 0 for byte in range(256))
+        self.discarded = bytes(byte for byte in range(256) if byte & mask >= alphabet_len)
+        self.lock = threading.Lock()
+        self.chars = ""
+        self.pos = 0
+
+    def take(self, size: int) -> str:
+        with self.lock:
+            while self.pos + size > len(self.chars):
+                random_bytes = os.urandom(max(_BUFFER_SIZE, size * 2))
+                new_chars = random_bytes.translate(self.table, self.discarded).decode("ascii")
+                pos = self.pos
+                self.chars = self.chars[pos:] + new_chars
+                self.pos = 0
+            start = self.pos
+            end = self.pos = start + size
+            return self.chars[start:end]
+
+    def reset(self) -> None:
+        self.chars = ""
+        self.pos = 0
+
+
+_buffers: Dict[str, _IdCharsBuffer] = {}
+
+
+def _reset_buffers() -> None:
+    for buffer in _buffers.values():
+        buffer.reset()
+
+
+# Forked processes (e.g. gunicorn workers) must not reuse the characters buffered by the parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_buffers)
 
 
 # Based on nanoid implementation from
@@ -8,22 +71,22 @@ from os import urandom
 # NOTE: This function is defined in a separate file so we can mock the import
 #       of this function in a singular place.
 def generate(alphabet: str, size: int) -> str:
-    alphabet_len = len(alphabet)
+    buffer = _buffers.get(alphabet, None)
+    if buffer is None and alphabet.isascii():
+        buffer = _buffers.setdefault(alphabet, _IdCharsBuffer(alphabet))
+    if buffer is not None:
+        return buffer.take(size)
 
-    mask = 1
-    if alphabet_len > 1:
-        mask = (2 << int(log(alphabet_len - 1) / log(2))) - 1
+    alphabet_len = len(alphabet)
+    mask = _get_mask(alphabet_len)
     step = int(ceil(1.6 * mask * size / alphabet_len))
 
-    id = ""
+    id: List[str] = []
     while True:
-        random_bytes = bytearray(urandom(step))
-
-        for i in range(step):
-            random_byte = random_bytes[i] & mask
+        for random_byte in os.urandom(step):
+            random_byte &= mask
             if random_byte < alphabet_len:
-                if alphabet[random_byte]:
-                    id += alphabet[random_byte]
+                id.append(alphabet[random_byte])
 
-                    if len(id) == size:
-                        return id
+                if len(id) == size:
+                    return "".join(id)
@@ -1,6 +1,6 @@
 import sys
 import typing
-from typing import Any, Mapping, Tuple, get_type_hints
+from typing import Any, Callable, Mapping, Optional, Tuple, get_type_hints
 
 # Get all types that users may use from the `typing` module.
 #
@@ -45,37 +45,52 @@ def _prepare_type_for_validation(the_type: Any) -> Any:
         return the_type
 
 
+# Validates the given value, raising `TypeError` if it doesn't match the type.
+# The second argument is the prefix for the error messages, e.g. `Component 'my_comp'`.
+TypeValidator = Callable[[Any, str], None]
+
+
 # NOTE: tuple_type is a _GenericAlias - See https://stackoverflow.com/questions/74412803
-def validate_typed_tuple(
-    value: Tuple[Any, ...],
-    tuple_type: Any,
-    prefix: str,
-    kind: str,
-) -> None:
+def compile_tuple_validator(tuple_type: Any, kind: str) -> Optional[TypeValidator]:
+    """
+    Prepare a validator for the given Tuple type, so the type is inspected only once,
+    and not each time a value is validated.
+
+    Returns `None` if there is nothing to validate.
+    """
     # `Any` type is the signal that we should skip validation
     if tuple_type == Any:
-        return
+        return None
 
     # We do two kinds of validation with the given Tuple type:
     # 1. We check whether there are any extra / missing positional args
     # 2. We look at the members of the Tuple (which are types themselves),
     #    and check if our concrete list / tuple has correct types under correct indices.
     expected_pos_args = len(tuple_type.__args__)
-    actual_pos_args = len(value)
-    if expected_pos_args > actual_pos_args:
-        # Generate errors like below (listed for searchability)
-        # `Component 'name' expected 3 positional arguments, got 2`
-        raise TypeError(f"{prefix} expected {expected_pos_args} {kind}s, got {actual_pos_args}")
-
-    for index, arg_type in enumerate(tuple_type.__args__):
-        arg = value[index]
-        arg_type = _prepare_type_for_validation(arg_type)
-        if sys.version_info >= (3, 11) and not isinstance(arg, arg_type):
+    # NOTE: `isinstance()` cannot be used with the version of TypedDict prior to 3.11.
+    check_types = sys.version_info >= (3, 11)
+    arg_types = [_prepare_type_for_validation(arg_type) for arg_type in tuple_type.__args__]
+
+    def validator(value: Tuple[Any, ...], prefix: str) -> None:
+        actual_pos_args = len(value)
+        if expected_pos_args > actual_pos_args:
             # Generate errors like below (listed for searchability)
-            # `Component 'name' expected positional argument at index 0 to be <class 'int'>, got 123.5 of type <class 'float'>`  # noqa: E501
-            raise TypeError(
-                f"{prefix} expected {kind} at index {index} to be {arg_type}, got {arg} of type {type(arg)}"
-            )
+            # `Component 'name' expected 3 positional arguments, got 2`
+            raise TypeError(f"{prefix} expected {expected_pos_args} {kind}s, got {actual_pos_args}")
+
+        if not check_types:
+            return
+
+        for index, arg_type in enumerate(arg_types):
+            arg = value[index]
+            if not isinstance(arg, arg_type):
+                # Generate errors like below (listed for searchability)
+                # `Component 'name' expected positional argument at index 0 to be <class 'int'>, got 123.5 of type <class 'float'>`  # noqa: E501
+                raise TypeError(
+                    f"{prefix} expected {kind} at index {index} to be {arg_type}, got {arg} of type {type(arg)}"
+                )
+
+    return validator
 
 
 # NOTE:
@@ -83,48 +98,77 @@ def validate_typed_tuple(
 # - `value` is expected to be TypedDict, the base `TypedDict` type cannot be used
 #   in function signature (only its subclasses can), so we specify the type as Mapping.
 #   See https://stackoverflow.com/questions/74412803
-def validate_typed_dict(value: Mapping[str, Any], dict_type: Any, prefix: str, kind: str) -> None:
+def compile_dict_validator(dict_type: Any, kind: str) -> Optional[TypeValidator]:
+    """
+    Prepare a validator for the given TypedDict, so the type hints are resolved only once,
+    and not each time a value is validated.
+
+    Returns `None` if there is nothing to validate.
+    """
     # `Any` type is the signal that we should skip validation
     if dict_type == Any:
-        return
+        return None
 
     # See https://stackoverflow.com/a/76527675
     # And https://stackoverflow.com/a/71231688
     required_kwargs = dict_type.__required_keys__
-    unseen_keys = set(value.keys())
-
-    # For each entry in the TypedDict, we do two kinds of validation:
-    # 1. We check whether there are any extra / missing keys
-    # 2. We look at the values of TypedDict entries (which are types themselves),
-    #    and check if our concrete dict has correct types under correct keys.
-    for key, kwarg_type in get_type_hints(dict_type).items():
-        if key not in value:
-            if key in required_kwargs:
-                # Generate errors like below (listed for searchability)
-                # `Component 'name' is missing a required keyword argument 'key'`
-                # `Component 'name' is missing a required slot argument 'key'`
-                # `Component 'name' is missing a required data argument 'key'`
-                raise TypeError(f"{prefix} is missing a required {kind} '{key}'")
-        else:
-            unseen_keys.remove(key)
-            kwarg = value[key]
-            kwarg_type = _prepare_type_for_validation(kwarg_type)
+    # NOTE: `isinstance()` cannot be used with the version of TypedDict prior to 3.11.
+    # So we do type validation for TypedDicts only in 3.11 and later.
+    check_types = sys.version_info >= (3, 11)
+    kwarg_types = [
+        (key, key in required_kwargs, _prepare_type_for_validation(kwarg_type))
+        for key, kwarg_type in get_type_hints(dict_type).items()
+    ]
+    known_keys = frozenset(key for key, _, _ in kwarg_types)
+
+    def validator(value: Mapping[str, Any], prefix: str) -> None:
+        # For each entry in the TypedDict, we do two kinds of validation:
+        # 1. We check whether there are any extra / missing keys
+        # 2. We look at the values of TypedDict entries (which are types themselves),
+        #    and check if our concrete dict has correct types under correct keys.
+        for key, is_required, kwarg_type in kwarg_types:
+            if key not in value:
+                if is_required:
+                    # Generate errors like below (listed for searchability)
+                    # `Component 'name' is missing a required keyword argument 'key'`
+                    # `Component 'name' is missing a required slot argument 'key'`
+                    # `Component 'name' is missing a required data argument 'key'`
+                    raise TypeError(f"{prefix} is missing a required {kind} '{key}'")
+            elif check_types:
+                kwarg = value[key]
+                if not isinstance(kwarg, kwarg_type):
+                    # Generate errors like below (listed for searchability)
+                    # `Component 'name' expected keyword argument 'key' to be <class 'int'>, got 123.4 of type <class 'float'>`  # noqa: E501
+                    # `Component 'name' expected slot 'key' to be <class 'int'>, got 123.4 of type <class 'float'>`
+                    # `Component 'name' expected data 'key' to be <class 'int'>, got 123.4 of type <class 'float'>`
+                    raise TypeError(
+                        f"{prefix} expected {kind} '{key}' to be {kwarg_type}, got {kwarg} of type {type(kwarg)}"
+                    )
+
+        unseen_keys = [key for key in value.keys() if key not in known_keys]
+        if unseen_keys:
+            formatted_keys = ", ".join([f"'{key}'" for key in unseen_keys])
+            # Generate errors like below (listed for searchability)
+            # `Component 'name' got unexpected keyword argument keys 'invalid_key'`
+            # `Component 'name' got unexpected slot keys 'invalid_key'`
+            # `Component 'name' got unexpected data keys 'invalid_key'`
+            raise TypeError(f"{prefix} got unexpected {kind} keys {formatted_keys}")
+
+    return validator
 
-            # NOTE: `isinstance()` cannot be used with the version of TypedDict prior to 3.11.
-            # So we do type validation for TypedDicts only in 3.11 and later.
-            if sys.version_info >= (3, 11) and not isinstance(kwarg, kwarg_type):
-                # Generate errors like below (listed for searchability)
-                # `Component 'name' expected keyword argument 'key' to be <class 'int'>, got 123.4 of type <class 'float'>`  # noqa: E501
-                # `Component 'name' expected slot 'key' to be <class 'int'>, got 123.4 of type <class 'float'>`
-                # `Component 'name' expected data 'key' to be <class 'int'>, got 123.4 of type <class 'float'>`
-                raise TypeError(
-                    f"{prefix} expected {kind} '{key}' to be {kwarg_type}, got {kwarg} of type {type(kwarg)}"
-                )
 
-    if unseen_keys:
-        formatted_keys = ", ".join([f"'{key}'" for key in unseen_keys])
-        # Generate errors like below (listed for searchability)
-        # `Component 'name' got unexpected keyword argument keys 'invalid_key'`
-        # `Component 'name' got unexpected slot keys 'invalid_key'`
-        # `Component 'name' got unexpected data keys 'invalid_key'`
-        raise TypeError(f"{prefix} got unexpected {kind} keys {formatted_keys}")
+def validate_typed_tuple(
+    value: Tuple[Any, ...],
+    tuple_type: Any,
+    prefix: str,
+    kind: str,
+) -> None:
+    validator = compile_tuple_validator(tuple_type, kind)
+    if validator is not None:
+        validator(value, prefix)
+
+
+def validate_typed_dict(value: Mapping[str, Any], dict_type: Any, prefix: str, kind: str) -> None:
+    validator = compile_dict_validator(dict_type, kind)
+    if validator is not None:
+        validator(value, prefix)
@@ -0,0 +1,85 @@
+from time import perf_counter
+from typing import List, NamedTuple, Optional, Set, Type
+
+from django_components.component import Component, _bind_template
+from django_components.component_registry import ComponentRegistry, all_registries
+from django_components.dependencies import _hash_comp_cls, cache_inlined_css, cache_inlined_js, comp_hash_mapping
+
+
+class WarmupResult(NamedTuple):
+    """Result of warming up a single component class, see [`warmup()`](../api#django_components.warmup)."""
+
+    name: str
+    """Name under which the component was registered (first registry wins if it's registered multiple times)"""
+    component_cls: Type[Component]
+    registry: ComponentRegistry
+    duration: float
+    """Time it took to warm up the component, in seconds"""
+
+
+def warmup(registry: Optional[ComponentRegistry] = None) -> List[WarmupResult]:
+    """
+    Do upfront the work that django-components would otherwise do lazily
+    on the first render of each component:
+
+    - Compile the component's template (when it's defined statically on the class
+      with `template` or `template_name`) and bind it to the class.
+    - Populate the cache of the inlined JS / CSS, which is served
+      by the `components/cache/<hash>.<type>` endpoint.
+    - Compute the component's hash, and register it in the mapping used
+      to look up components when rendering JS / CSS dependencies.
+    - Process the component's `Media` class.
+
+    If `registry` is given, only the components registered in that registry
+    are warmed up. Otherwise, all components from all
+    [`ComponentRegistries`](../api#django_components.ComponentRegistry) are warmed up.
+
+    Returns a list of [`WarmupResult`](../api#django_components.WarmupResult),
+    one per component class.
+
+    This is useful with servers that load the application before forking the worker
+    processes, e.g. `gunicorn --preload`. The work is then done only once in the main process,
+    and the workers share the results:
+
+    ```python
+    # wsgi.py
+    from django.core.wsgi import get_wsgi_application
+    from django_components import warmup
+
+    application = get_wsgi_application()
+    warmup()
+    ```
+
+    See also the [`warmcomponents`](../commands#warmcomponents) command.
+    """
+    registries = [registry] if registry is not None else list(all_registries)
+
+    results: List[WarmupResult] = []
+    seen: Set[Type[Component]] = set()
+    for reg in registries:
+        for name, comp_cls in reg.all().items():
+            if comp_cls in seen:
+                continue
+            seen.add(comp_cls)
+
+            start = perf_counter()
+            _warmup_component(comp_cls, name, reg)
+            duration = perf_counter() - start
+
+            results.append(WarmupResult(name=name, component_cls=comp_cls, registry=reg, duration=duration))
+
+    return results
+
+
+def _warmup_component(comp_cls: Type[Component], name: str, registry: ComponentRegistry) -> None:
+    _bind_template(comp_cls)
+
+    cache_inlined_js(comp_cls, comp_cls.js or "")
+    cache_inlined_css(comp_cls, comp_cls.css or "")
+
+    comp_cls_hash = _hash_comp_cls(comp_cls)
+    comp_hash_mapping[comp_cls_hash] = comp_cls
+
+    # `media` is a property, so it needs an instance. Accessing it resolves
+    # the `Media` class (including the inherited one) and the `media_class`.
+    comp_cls(registered_name=name, registry=registry).media
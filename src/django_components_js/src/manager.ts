@@ -55,6 +55,10 @@ export type ScriptType = 'js' | 'css';
  * ```js
  * Components.markScriptLoaded("js", '/abc/def');
  * ```
+ *
+ * ```js
+ * Components.swapDeferred("a1b2c3");
+ * ```
  */
 export const createComponentsManager = () => {
   const loadedJs = new Set<string>();
@@ -228,6 +232,21 @@ export const createComponentsManager = () => {
     return result;
   };
 
+  /**
+   * Replace the placeholder of a deferred component (`{% component ... defer %}`)
+   * with the component's HTML, which is sent later in the stream.
+   */
+  const swapDeferred = (compId: string): void => {
+    const placeholder = document.querySelector(`template[data-djc-defer="${compId}"]`);
+    const content = document.querySelector<HTMLTemplateElement>(`template[data-djc-deferred="${compId}"]`);
+    if (!placeholder || !content) {
+      throw Error(`[Components] Cannot find the placeholder or the content of deferred component '${compId}'`);
+    }
+
+    placeholder.replaceWith(content.content);
+    content.remove();
+  };
+
   /** Internal API - We call this when we want to load / register all JS & CSS files rendered by component(s) */
   const _loadComponentScripts = async (inputs: {
     loadedCssUrls: string[];
@@ -271,5 +290,6 @@ export const createComponentsManager = () => {
     loadJs,
     loadCss,
     markScriptLoaded,
+    swapDeferred,
   };
 };
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from django.test import TestCase
 
 from django_components.util.cache import LRUCache
@@ -40,3 +42,88 @@ class CacheTests(TestCase):
         self.assertEqual(cache.get("d"), None)
         self.assertEqual(cache.get("e"), None)
         self.assertEqual(cache.get("f"), None)
+
+    def test_cache_unbounded(self):
+        cache = LRUCache[int]()
+
+        for i in range(1000):
+            cache.set(i, i)
+
+        self.assertEqual(len(cache), 1000)
+        self.assertEqual(cache.get(0), 0)
+
+    def test_cache_update_moves_to_front(self):
+        cache = LRUCache[int](maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        self.assertEqual(cache.get("a"), 3)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("c"), 4)
+
+    def test_cache_maxbytes(self):
+        cache = LRUCache[str](maxbytes=10, sizeof=len)
+
+        cache.set("a", "1234")
+        cache.set("b", "1234")
+        self.assertEqual(cache.stats().nbytes, 8)
+
+        cache.set("c", "1234")
+        self.assertEqual(cache.get("a"), None)
+        self.assertEqual(cache.get("b"), "1234")
+        self.assertEqual(cache.get("c"), "1234")
+        self.assertEqual(cache.stats().nbytes, 8)
+
+        # Items bigger than the whole budget are not stored
+        cache.set("d", "12345678901")
+        self.assertEqual(cache.has("d"), False)
+        self.assertEqual(cache.stats().nbytes, 8)
+
+        # Replacing an item updates the total size
+        cache.set("b", "12")
+        self.assertEqual(cache.stats().nbytes, 6)
+
+    def test_cache_maxbytes_requires_sizeof(self):
+        with self.assertRaisesMessage(ValueError, "'sizeof' must be set"):
+            LRUCache[str](maxbytes=10)
+
+    def test_cache_stats(self):
+        cache = LRUCache[int](maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("x")
+        cache.set("c", 3)
+
+        stats = cache.stats()
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.size, 2)
+
+        cache.clear()
+        self.assertEqual(cache.stats().size, 0)
+        self.assertEqual(cache.stats().hits, 2)
+
+    def test_cache_concurrent_access(self):
+        cache = LRUCache[int](maxsize=50)
+
+        def worker(offset: int) -> None:
+            for i in range(2000):
+                key = (offset + i) % 100
+                if cache.get(key) is None:
+                    cache.set(key, key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+        stats = cache.stats()
+        self.assertEqual(stats.size, 50)
+        self.assertEqual(stats.hits + stats.misses, 8 * 2000)
+        # Two threads may both miss the same key before either sets it
+        self.assertLessEqual(stats.size + stats.evictions, stats.misses)
@@ -0,0 +1,135 @@
+import json
+import os
+import re
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from django_components import Component, registry, types
+from django_components.dependencies import _hash_comp_cls, get_script_url
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
+
+setup_test_config({"autodiscover": False})
+
+
+class SimpleComponent(Component):
+    template: types.django_html = """
+        Variable: <strong>{{ variable }}</strong>
+    """
+    js: types.js = "console.log('simple');"
+    css: types.css = ".simple { color: red; }"
+
+    def get_context_data(self, variable=None):
+        return {"variable": variable}
+
+
+class Page(Component):
+    template: types.django_html = """
+        {% load component_tags %}
+        <html>
+            <head></head>
+            <body>
+                {% component "simple" variable="foo" / %}
+            </body>
+        </html>
+    """
+
+
+class CollectComponentsCommandTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.static_root = TemporaryDirectory()
+        self.settings_override = override_settings(STATIC_ROOT=self.static_root.name, STATIC_URL="/static/")
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.static_root.cleanup()
+        super().tearDown()
+
+    def _collect(self) -> str:
+        out = StringIO()
+        call_command("collectcomponents", stdout=out)
+        return out.getvalue()
+
+    def test_writes_files_and_manifest(self):
+        registry.register("simple", SimpleComponent)
+
+        output = self._collect()
+        self.assertIn("Collected 2 JS / CSS files of", output)
+
+        with open(os.path.join(self.static_root.name, "django_components/manifest.json")) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        comp_cls_hash = _hash_comp_cls(SimpleComponent)
+        js_path = manifest["paths"][f"{comp_cls_hash}.js"]
+        css_path = manifest["paths"][f"{comp_cls_hash}.css"]
+        self.assertRegex(js_path, rf"^django_components/cache/{comp_cls_hash}\.\w{{12}}\.js$")
+        self.assertRegex(css_path, rf"^django_components/cache/{comp_cls_hash}\.\w{{12}}\.css$")
+
+        with open(os.path.join(self.static_root.name, js_path)) as js_file:
+            self.assertEqual(js_file.read(), "console.log('simple');")
+        with open(os.path.join(self.static_root.name, css_path)) as css_file:
+            self.assertEqual(css_file.read(), ".simple { color: red; }")
+
+    def test_components_use_static_files(self):
+        registry.register("simple", SimpleComponent)
+        self._collect()
+
+        rendered = Page.render()
+
+        # The JS and CSS is not inlined, but loaded from the static files
+        self.assertNotIn("console.log('simple')", rendered)
+        self.assertNotIn(".simple { color: red; }", rendered)
+        self.assertRegex(
+            rendered,
+            r'<link href="/static/django_components/cache/SimpleComponent_\w{6}\.\w{12}\.css" media="all" rel="stylesheet">',  # noqa: E501
+        )
+        self.assertRegex(rendered, r'<script src="/static/django_components/cache/SimpleComponent_\w{6}\.\w{12}\.js">')
+
+        # HTML fragments load the JS and CSS from the static files too
+        self.assertRegex(
+            get_script_url("js", SimpleComponent),
+            r"^/static/django_components/cache/SimpleComponent_\w{6}\.\w{12}\.js$",
+        )
+
+    def test_outdated_static_files_not_used(self):
+        class ChangedComponent(SimpleComponent):
+            js: types.js = "console.log('before');"
+
+        registry.register("simple", ChangedComponent)
+        self._collect()
+
+        # E.g. the JS was changed without running `collectcomponents` again
+        ChangedComponent.js = "console.log('after');"
+
+        rendered = Page.render()
+
+        self.assertIn("<script>console.log('after');</script>", rendered)
+        self.assertFalse(re.search(r"/static/django_components/cache/\w+\.\w{12}\.js", rendered))
+        self.assertRegex(
+            get_script_url("js", ChangedComponent),
+            r"^/components/cache/ChangedComponent_\w{6}\.\w{12}\.js$",
+        )
+        # The CSS is still the same, so it's loaded from the static file
+        self.assertRegex(rendered, r'<link href="/static/django_components/cache/ChangedComponent_\w{6}\.\w{12}\.css"')
+
+    def test_invalid_manifest_ignored(self):
+        registry.register("simple", SimpleComponent)
+
+        manifest_path = os.path.join(self.static_root.name, "django_components/manifest.json")
+        os.makedirs(os.path.dirname(manifest_path))
+        with open(manifest_path, "w") as manifest_file:
+            manifest_file.write("{not json")
+
+        with self.assertLogs("django_components", level="WARNING") as logs:
+            rendered = Page.render()
+        self.assertIn("Ignoring invalid manifest", logs.output[0])
+
+        # The JS and CSS is inlined, as if there was no manifest
+        self.assertIn("<script>console.log('simple');</script>", rendered)
+        self.assertIn("<style>.simple { color: red; }</style>", rendered)
@@ -3,6 +3,7 @@ Tests focusing on the Component class.
 For tests focusing on the `component` tag, see `test_templatetags_component.py`
 """
 
+import asyncio
 import re
 import sys
 from typing import Any, Dict, List, Tuple, Union, no_type_check
@@ -17,10 +18,10 @@ from unittest import skipIf
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.template import Context, RequestContext, Template, TemplateSyntaxError
 from django.template.base import TextNode
-from django.test import Client
+from django.test import Client, RequestFactory, override_settings
 from django.urls import path
 from django.utils.safestring import SafeString
 
@@ -599,6 +600,53 @@ class ComponentValidationTest(BaseTestCase):
                 },
             )
 
+    @skipIf(sys.version_info < (3, 11), "Requires >= 3.11")
+    def test_validation_turned_off(self):
+        class TestComponent(Component[CompArgs, CompKwargs, Any, CompData, Any, Any]):
+            def get_context_data(self, var1, var2, variable, another, **attrs):
+                return {
+                    "variable": variable,
+                    "invalid_key": var1,
+                }
+
+            template = "Variable: <strong>{{ variable }}</strong>"
+
+        with override_settings(COMPONENTS={"type_validation": False}):
+            rendered = TestComponent.render(
+                kwargs={"variable": "test", "another": "1"},  # type: ignore
+                args=(123.5, "str"),  # type: ignore
+            )
+        self.assertHTMLEqual(rendered, "Variable: <strong>test</strong>")
+
+        with override_settings(COMPONENTS={"type_validation": 1}):
+            with self.assertRaisesMessage(TypeError, "Component 'TestComponent' expected positional argument"):
+                TestComponent.render(
+                    kwargs={"variable": "test", "another": "1"},  # type: ignore
+                    args=(123.5, "str"),  # type: ignore
+                )
+
+    def test_validators_prepared_once_per_class(self):
+        class TestComponent(Component[CompArgs, CompKwargs, Any, CompData, Any, Any]):
+            def get_context_data(self, var1, var2, variable, another, **attrs):
+                return {"variable": variable}
+
+            template = "Variable: <strong>{{ variable }}</strong>"
+
+        class ChildComponent(TestComponent):
+            pass
+
+        TestComponent.render(kwargs={"variable": "test", "another": 1}, args=(123, "str"))
+        validators = TestComponent._type_validators  # type: ignore[attr-defined]
+
+        TestComponent.render(kwargs={"variable": "test", "another": 1}, args=(123, "str"))
+        self.assertIs(TestComponent._type_validators, validators)  # type: ignore[attr-defined]
+        self.assertEqual(TestComponent()._get_types(), (CompArgs, CompKwargs, Any, CompData, Any, Any))
+
+        # Subclasses get their own validators, but for the same types
+        ChildComponent.render(kwargs={"variable": "test", "another": 1}, args=(123, "str"))
+        self.assertIsNot(ChildComponent._type_validators, validators)  # type: ignore[attr-defined]
+        self.assertEqual(ChildComponent()._get_types(), (CompArgs, CompKwargs, Any, CompData, Any, Any))
+
     def test_handles_components_in_typing(self):
         class InnerKwargs(TypedDict):
             one: str
@@ -1194,6 +1242,600 @@ class ComponentRenderTest(BaseTestCase):
             "Variable: <strong>123</strong>",
         )
 
+    def test_deterministic_ids(self):
+        @register("inner")
+        class Inner(Component):
+            template = "<span>{{ id }}</span>"
+
+            def get_context_data(self):
+                return {"id": self.component_id}
+
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{{ id }}</div>
+                {% component "inner" / %}
+                {% component "inner" / %}
+            """
+
+            def get_context_data(self):
+                return {"id": self.component_id}
+
+        def render_fresh():
+            # Parse the template anew each time, as if rendered in a new process
+            Outer._template_binding = None
+            Outer.template = Outer.template + " "
+            return Outer.render()
+
+        rendered_random = [render_fresh(), render_fresh()]
+        self.assertNotEqual(rendered_random[0].strip(), rendered_random[1].strip())
+
+        with override_settings(COMPONENTS={"deterministic_ids": True}):
+            rendered = [render_fresh(), render_fresh()]
+        self.assertEqual(rendered[0].strip(), rendered[1].strip())
+
+        # The IDs are still different for different tags
+        ids = re.findall(r"<(?:div|span)>(\w+)</", rendered[0])
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(len(set(ids)), 3)
+
+    @override_settings(COMPONENTS={"deterministic_ids": True})
+    def test_deterministic_ids_differ_between_components(self):
+        @register("inner")
+        class Inner(Component):
+            template = "<span>{{ id }}</span>"
+
+            def get_context_data(self):
+                return {"id": self.component_id}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "inner" / %}
+        """
+
+        class OuterA(Component):
+            template = template_str
+
+        class OuterB(Component):
+            template = template_str
+
+        # Templates created from strings have no name, but the same tags
+        # in different components still get different IDs
+        id_a = re.findall(r"<span>(\w+)</", OuterA.render())
+        id_b = re.findall(r"<span>(\w+)</", OuterB.render())
+        self.assertEqual(len(id_a), 1)
+        self.assertNotEqual(id_a, id_b)
+
+    def test_overriden_render_can_access_instance(self):
+        class TestComponent(Component):
+            template = "Variable: <strong>{{ id }}</strong>"
+
+            def get_context_data(self, **attrs):
+                return {
+                    "id": self.component_id,
+                }
+
+            @classmethod
+            def render(cls, *args, **kwargs):
+                return "OVERRIDEN " + super().render(*args, **kwargs)
+
+        rendered = TestComponent(component_id="123").render()
+        self.assertHTMLEqual(rendered, "OVERRIDEN Variable: <strong>123</strong>")
+
+        rendered = TestComponent.render()
+        self.assertIn("OVERRIDEN Variable:", rendered)
+
+    def test_instance_attributes_created_lazily(self):
+        class TestComponent(Component):
+            template = ""
+
+        comp = TestComponent()
+        self.assertIsNone(comp._component_id)
+        self.assertIsNone(comp._outer_context)
+
+        self.assertEqual(len(comp.component_id), 6)
+        self.assertIsInstance(comp.outer_context, Context)
+        self.assertIs(comp.outer_context, comp._outer_context)
+
+
+class ComponentStreamTest(BaseTestCase):
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_render_to_stream(self):
+        @register("inner")
+        class Inner(Component):
+            template = "<span>{{ name }}</span>"
+            css = "span { color: red; }"
+            js = "console.log('inner');"
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                <head><title>{{ title }}</title></head>
+                <body>
+                    {% component "inner" name="John" / %}
+                    {% slot "content" %}{% endslot %}
+                </body>
+                </html>
+            """
+
+            def get_context_data(self, title):
+                return {"title": title}
+
+        chunks = list(Page.render_to_stream(kwargs={"title": "Page"}, slots={"content": "CONTENT"}))
+        self.assertGreater(len(chunks), 1)
+
+        rendered = "".join(chunks)
+        self.assertNotIn("_RENDERED", rendered)
+        self.assertIn("<title>Page</title>", rendered)
+        self.assertIn("<span>John</span>", rendered)
+        self.assertIn("CONTENT", rendered)
+        self.assertIn("<style>span { color: red; }</style>", rendered)
+        self.assertIn("<script>console.log('inner');</script>", rendered)
+        self.assertLess(rendered.index("<span>John</span>"), rendered.index("</body>"))
+
+        # The head is sent before the rest of the page is rendered
+        head_index = next(index for index, chunk in enumerate(chunks) if "</head>" in chunk)
+        span_index = next(index for index, chunk in enumerate(chunks) if "<span>" in chunk)
+        self.assertLess(head_index, span_index)
+
+    def test_render_to_stream_is_lazy(self):
+        calls = []
+
+        @register("inner")
+        class Inner(Component):
+            template = "INNER"
+
+            def get_context_data(self):
+                calls.append("inner")
+                return {}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                HEAD
+                {% component "inner" / %}
+            """
+
+        stream = Page.render_to_stream(render_dependencies=False)
+        self.assertEqual(calls, [])
+
+        first_chunk = next(stream)
+        self.assertEqual(calls, [])
+
+        rest = "".join(stream)
+        self.assertEqual(calls, ["inner"])
+        self.assertIn("HEAD", first_chunk + rest)
+        self.assertIn("INNER", rest)
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_render_to_stream_extends(self):
+        calls = []
+
+        @register("inner")
+        class Inner(Component):
+            template = "<span>INNER</span>"
+
+            def get_context_data(self):
+                calls.append("inner")
+                return {}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% extends parent %}
+                {% load component_tags %}
+                {% block body %}{% component "inner" / %}{% endblock %}
+            """
+
+            def get_context_data(self):
+                parent = Template(
+                    "<html><head><title>Page</title></head><body>{% block body %}{% endblock %}</body></html>"
+                )
+                return {"parent": parent}
+
+        stream = Page.render_to_stream(render_dependencies=False)
+
+        # The parent template is streamed node by node too
+        head_chunks = []
+        for chunk in stream:
+            head_chunks.append(chunk)
+            if "</head>" in chunk:
+                break
+        self.assertEqual(calls, [])
+
+        rest = "".join(stream)
+        self.assertEqual(calls, ["inner"])
+        self.assertIn("<span>INNER</span></body></html>", rest)
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_render_to_stream_nested_component(self):
+        calls = []
+
+        @register("inner")
+        class Inner(Component):
+            template = "<span>INNER</span>"
+
+            def get_context_data(self):
+                calls.append("inner")
+                return {}
+
+        @register("layout")
+        class Layout(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html><head><title>{{ title }}</title></head>
+                <body>{% slot "body" default / %}</body></html>
+            """
+
+            def get_context_data(self, title):
+                return {"title": title}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "layout" title="Page" %}
+                    {% component "inner" / %}
+                {% endcomponent %}
+            """
+
+        stream = Page.render_to_stream(render_dependencies=False)
+
+        # The template of the component that wraps the page is streamed node by node too
+        head_chunks = []
+        for chunk in stream:
+            head_chunks.append(chunk)
+            if "</head>" in chunk:
+                break
+        self.assertEqual(calls, [])
+        self.assertIn("<title>Page</title>", "".join(head_chunks))
+
+        rest = "".join(stream)
+        self.assertEqual(calls, ["inner"])
+        self.assertIn("<span>INNER</span>", rest)
+
+    def test_render_to_stream_with_on_render_after(self):
+        captured = []
+
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+            def on_render_after(self, context, template, content):
+                captured.append(content)
+                return "IGNORED"
+
+        rendered = "".join(SimpleComponent.render_to_stream(kwargs={"name": "John"}))
+
+        self.assertEqual(rendered.strip(), "Hello John")
+        self.assertEqual(captured, ["Hello John"])
+
+    def test_render_to_stream_error_has_component_path(self):
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            def get_context_data(self):
+                raise ValueError("Oops")
+
+        stream = SimpleComponent.render_to_stream()
+        with self.assertRaisesMessage(ValueError, "rendering components SimpleComponent:\nOops"):
+            list(stream)
+
+    def test_render_to_stream_response(self):
+        class SimpleComponent(Component):
+            template = "<div>{{ name }}</div>"
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+        response = SimpleComponent.render_to_stream_response(kwargs={"name": "John"}, status=201)
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response.status_code, 201)
+        self.assertHTMLEqual(b"".join(response.streaming_content).decode(), "<div>John</div>")
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_defer(self):
+        calls = []
+
+        @register("slow")
+        class Slow(Component):
+            template = "<i>slow {{ num }}</i>"
+
+            def get_context_data(self, num):
+                calls.append(num)
+                return {"num": num}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <main>
+                    {% for num in nums %}
+                        {% component "slow" num=num defer / %}
+                    {% endfor %}
+                    <p>after</p>
+                </main>
+            """
+
+            def get_context_data(self):
+                return {"nums": [1, 2]}
+
+        stream = Page.render_to_stream(render_dependencies=False)
+
+        page_chunks = []
+        for chunk in stream:
+            page_chunks.append(chunk)
+            if "</main>" in chunk:
+                break
+
+        # The rest of the page is sent before the deferred components are rendered
+        page = "".join(page_chunks)
+        self.assertEqual(calls, [])
+        self.assertIn("<p>after</p>", page)
+        placeholder_ids = re.findall(r'<template data-djc-defer="(\w+)"></template>', page)
+        self.assertEqual(len(placeholder_ids), 2)
+
+        deferred = "".join(stream)
+        self.assertEqual(calls, [1, 2])
+        for placeholder_id, num in zip(placeholder_ids, [1, 2]):
+            self.assertRegex(
+                deferred,
+                (
+                    f'<template data-djc-deferred="{placeholder_id}">.*?<i>slow {num}</i></template>'
+                    f'<script>Components.manager.swapDeferred\\("{placeholder_id}"\\);</script>'
+                ),
+            )
+
+    def test_defer_in_loop_keeps_loop_variables(self):
+        @register("item")
+        class Item(Component):
+            template = "{{ idx }}-{{ name }}-{{ outer }}"
+
+            def get_context_data(self, idx, name, outer):
+                return {"idx": idx, "name": name, "outer": outer}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% for group in groups %}
+                    {% for name in group %}
+                        {% component "item" idx=forloop.counter name=name outer=forloop.parentloop.counter defer / %}
+                    {% endfor %}
+                {% endfor %}
+            """
+
+            def get_context_data(self):
+                return {"groups": [["a", "b", "c"], ["d"]]}
+
+        rendered = "".join(Page.render_to_stream(render_dependencies=False))
+
+        items = re.findall(r"\d-\w-\d", rendered)
+        self.assertEqual(items, ["1-a-1", "2-b-1", "3-c-1", "1-d-2"])
+
+    def test_defer_nested(self):
+        @register("inner")
+        class Inner(Component):
+            template = "INNER"
+
+        @register("outer")
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                OUTER {% component "inner" defer / %}
+            """
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                PAGE {% component "outer" defer / %}
+            """
+
+        rendered = "".join(Page.render_to_stream())
+
+        self.assertNotIn("_RENDERED", rendered)
+        self.assertLess(rendered.index("PAGE"), rendered.index("OUTER"))
+        self.assertLess(rendered.index("OUTER"), rendered.index("INNER"))
+        self.assertEqual(rendered.count("data-djc-defer="), 2)
+        self.assertEqual(rendered.count("data-djc-deferred="), 2)
+
+    def test_defer_without_streaming(self):
+        @register("slow")
+        class Slow(Component):
+            template = "<i>slow</i>"
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "slow" defer / %}
+            """
+
+        rendered = Page.render()
+
+        self.assertHTMLEqual(rendered, "<i>slow</i>")
+
+
+class ComponentAsyncTest(BaseTestCase):
+    async def test_arender_async_get_context_data(self):
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            async def get_context_data(self, name):
+                await asyncio.sleep(0)
+                return {"name": name}
+
+        rendered = await SimpleComponent.arender(kwargs={"name": "John"})
+
+        self.assertHTMLEqual(rendered, "Hello John")
+
+    async def test_arender_sync_get_context_data(self):
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+        rendered = await SimpleComponent.arender(kwargs={"name": "John"})
+
+        self.assertHTMLEqual(rendered, "Hello John")
+
+    async def test_arender_nested_fetched_concurrently(self):
+        started = []
+        all_started = asyncio.Event()
+
+        @register("child")
+        class Child(Component):
+            template = "<li>{{ num }}</li>"
+
+            async def get_context_data(self, num):
+                started.append(num)
+                if len(started) == 3:
+                    all_started.set()
+                # If the siblings were NOT fetched concurrently, this would time out
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+                return {"num": num}
+
+        class Parent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <ul>
+                    {% for num in nums %}
+                        {% component "child" num=num / %}
+                    {% endfor %}
+                </ul>
+            """
+
+            def get_context_data(self):
+                return {"nums": [1, 2, 3]}
+
+        rendered = await Parent.arender()
+
+        self.assertEqual(sorted(started), [1, 2, 3])
+        self.assertHTMLEqual(rendered, "<ul><li>1</li><li>2</li><li>3</li></ul>")
+
+    async def test_arender_nested_multiple_levels(self):
+        @register("inner")
+        class Inner(Component):
+            template = "<i>{{ text }}</i>"
+
+            async def get_context_data(self, text):
+                return {"text": text.upper()}
+
+        @register("outer")
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% component "inner" text=text / %}{% slot "content" default / %}</div>
+            """
+
+            async def get_context_data(self, text):
+                return {"text": text}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "outer" text="hello" %}
+                    {% component "inner" text=name / %}
+                {% endcomponent %}
+            """
+
+            def get_context_data(self):
+                return {"name": "john"}
+
+        rendered = await Page.arender()
+
+        self.assertNotIn("_ASYNC", rendered)
+        self.assertHTMLEqual(rendered, "<div><i>HELLO</i><i>JOHN</i></div>")
+
+    async def test_arender_in_loop_keeps_loop_variables(self):
+        @register("item")
+        class Item(Component):
+            # NOTE: With the "django" context behavior, the outer `forloop` is available in the template
+            template = "<li>{{ forloop.counter }}-{{ name }}</li>"
+
+            async def get_context_data(self, name):
+                return {"name": name}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <ul>{% for name in names %}{% component "item" name=name / %}{% endfor %}</ul>
+            """
+
+            def get_context_data(self):
+                return {"names": ["a", "b", "c"]}
+
+        rendered = await Page.arender()
+
+        self.assertHTMLEqual(rendered, "<ul><li>1-a</li><li>2-b</li><li>3-c</li></ul>")
+
+    def test_render_after_arender_with_same_context(self):
+        @register("item")
+        class Item(Component):
+            template = "<li>{{ name }}</li>"
+
+            async def get_context_data(self, name):
+                return {"name": name}
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <ul>{% component "item" name=name / %}</ul>
+            """
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+        context = Context({})
+        rendered_async = asyncio.run(Page.arender(context=context, kwargs={"name": "a"}))
+        rendered_sync = Page.render(context=context, kwargs={"name": "b"})
+
+        self.assertHTMLEqual(rendered_async, "<ul><li>a</li></ul>")
+        self.assertHTMLEqual(rendered_sync, "<ul><li>b</li></ul>")
+
+    def test_render_async_get_context_data(self):
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            async def get_context_data(self, name):
+                return {"name": name}
+
+        rendered = SimpleComponent.render(kwargs={"name": "John"})
+
+        self.assertHTMLEqual(rendered, "Hello John")
+
+    async def test_arender_to_response(self):
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            async def get_context_data(self, name):
+                return {"name": name}
+
+        response = await SimpleComponent.arender_to_response(kwargs={"name": "John"}, status=201)
+
+        self.assertIsInstance(response, HttpResponse)
+        self.assertEqual(response.status_code, 201)
+        self.assertHTMLEqual(response.content.decode(), "Hello John")
+
+    async def test_async_view_handler(self):
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            async def get_context_data(self, name):
+                return {"name": name}
+
+            async def get(self, request, *args, **kwargs):
+                return await self.arender_to_response(kwargs={"name": "John"})
+
+        view = SimpleComponent.as_view()
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+
+        response = await view(RequestFactory().get("/"))
+        self.assertHTMLEqual(response.content.decode(), "Hello John")
+
 
 class ComponentHookTest(BaseTestCase):
     def test_on_render_before(self):
@@ -0,0 +1,190 @@
+from django.core.cache import caches
+from django.template import Context, Template
+
+from django_components import Component, invalidate_cache_tags, register, registry, render_dependencies, types
+from django_components.dependencies import comp_hash_mapping
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
+
+setup_test_config({"autodiscover": False})
+
+
+class ComponentCacheTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+
+    def test_cache_disabled_by_default(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            def get_context_data(self, name):
+                calls.append(name)
+                return {"name": name}
+
+        SimpleComponent.render(kwargs={"name": "John"})
+        SimpleComponent.render(kwargs={"name": "John"})
+
+        self.assertEqual(calls, ["John", "John"])
+
+    def test_cached_per_input(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template = "Hello {{ name }}"
+
+            def get_context_data(self, name):
+                calls.append(name)
+                return {"name": name}
+
+            class Cache:
+                enabled = True
+
+        first = SimpleComponent.render(kwargs={"name": "John"}, render_dependencies=False)
+        second = SimpleComponent.render(kwargs={"name": "John"}, render_dependencies=False)
+        other = SimpleComponent.render(kwargs={"name": "Mary"}, render_dependencies=False)
+
+        self.assertEqual(calls, ["John", "Mary"])
+        self.assertIn("Hello John", second)
+        self.assertIn("Hello Mary", other)
+        # The dependency marker uses the ID of the new component instance
+        self.assertIn("<!-- _RENDERED SimpleComponent_", first)
+        self.assertIn("<!-- _RENDERED SimpleComponent_", second)
+        self.assertNotEqual(first, second)
+
+    def test_context_keys(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template = "Hello {{ name }} from {{ city }}"
+
+            def get_context_data(self, name):
+                calls.append(name)
+                return {"name": name}
+
+            class Cache:
+                enabled = True
+                context_keys = ["city"]
+
+        out_1 = SimpleComponent.render(context={"city": "Paris"}, kwargs={"name": "John"})
+        out_2 = SimpleComponent.render(context={"city": "Paris", "other": 1}, kwargs={"name": "John"})
+        out_3 = SimpleComponent.render(context={"city": "Rome"}, kwargs={"name": "John"})
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("Hello John from Paris", out_1)
+        self.assertIn("Hello John from Paris", out_2)
+        self.assertIn("Hello John from Rome", out_3)
+
+    def test_custom_key_and_tags(self):
+        calls = []
+
+        class Product:
+            def __init__(self, pk, name):
+                self.pk = pk
+                self.name = name
+
+        class ProductCard(Component):
+            template = "{{ product.name }}"
+
+            def get_context_data(self, product):
+                calls.append(product.pk)
+                return {"product": product}
+
+            class Cache:
+                enabled = True
+
+                def key(self, product):
+                    return str(product.pk)
+
+                def tags(self, product):
+                    return [f"product:{product.pk}"]
+
+        ProductCard.render(kwargs={"product": Product(1, "Chair")})
+        ProductCard.render(kwargs={"product": Product(2, "Table")})
+        out = ProductCard.render(kwargs={"product": Product(1, "Chair v2")})
+        self.assertEqual(calls, [1, 2])
+        self.assertIn("Chair", out)
+        self.assertNotIn("Chair v2", out)
+
+        invalidate_cache_tags("product:1")
+
+        out = ProductCard.render(kwargs={"product": Product(1, "Chair v2")})
+        ProductCard.render(kwargs={"product": Product(2, "Table")})
+        self.assertEqual(calls, [1, 2, 1])
+        self.assertIn("Chair v2", out)
+
+    def test_uncacheable_input_raises(self):
+        class SimpleComponent(Component):
+            template = "Hello"
+
+            class Cache:
+                enabled = True
+
+        with self.assertRaisesMessage(ValueError, "Define `Cache.key()`"):
+            SimpleComponent.render(kwargs={"obj": object()})
+
+    def test_not_cached_with_slots(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template = "{% load component_tags %}{% slot 'content' default %}{% endslot %}"
+
+            def get_context_data(self):
+                calls.append(1)
+                return {}
+
+            class Cache:
+                enabled = True
+
+        SimpleComponent.render(slots={"content": "A"})
+        out = SimpleComponent.render(slots={"content": "B"})
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("B", out)
+
+    def test_dependencies_of_nested_components(self):
+        calls = []
+
+        @register("inner")
+        class Inner(Component):
+            template = "<div>Inner</div>"
+            js = "console.log('inner');"
+
+        @register("outer")
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>Outer {% component "inner" / %}</div>
+            """
+
+            def get_context_data(self):
+                calls.append(1)
+                return {}
+
+            class Cache:
+                enabled = True
+
+        template = Template(
+            """
+            {% load component_tags %}
+            <html><head></head><body>{% component "outer" / %}</body></html>
+            """
+        )
+        template.render(Context({}))
+
+        # Simulate a fresh process, where the inner component was never rendered
+        for comp_hash, comp_cls in list(comp_hash_mapping.items()):
+            if comp_cls is Inner:
+                del comp_hash_mapping[comp_hash]
+
+        rendered = render_dependencies(template.render(Context({})))
+        self.assertEqual(len(calls), 1)
+
+        self.assertIn("Inner", rendered)
+        self.assertIn("console.log('inner');", rendered)
+        self.assertNotIn("_RENDERED", rendered)
+
+        registry.clear()
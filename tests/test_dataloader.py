@@ -0,0 +1,217 @@
+import asyncio
+from typing import Any, List
+
+from django.template import Context, Template
+
+from django_components import Component, LoadedValue, register, types
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase, parametrize_context_behavior
+
+setup_test_config({"autodiscover": False})
+
+
+USERS = {1: "John", 2: "Mary", 3: "Peter"}
+
+
+class DataLoaderTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls: List[List[Any]] = []
+
+        def load_users(user_ids):
+            self.calls.append(user_ids)
+            return {user_id: USERS[user_id] for user_id in user_ids if user_id in USERS}
+
+        self.load_users = load_users
+
+    def _register_user_card(self):
+        load_users = self.load_users
+
+        @register("user_card")
+        class UserCard(Component):
+            template = "<p>{{ user }}</p>"
+
+            def get_context_data(self, user_id):
+                return {"user": self.load(load_users, user_id)}
+
+        return UserCard
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_siblings_loaded_in_single_batch(self):
+        self.calls.clear()
+        self._register_user_card()
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% for user_id in user_ids %}{% component "user_card" user_id=user_id / %}{% endfor %}
+            """
+        )
+        rendered = template.render(Context({"user_ids": [1, 2, 1, 4]}))
+
+        self.assertEqual(self.calls, [[1, 2, 4]])
+        self.assertHTMLEqual(rendered, "<p>John</p><p>Mary</p><p>John</p><p>None</p>")
+
+    def test_nested_components_loaded_per_level(self):
+        load_users = self.load_users
+        self._register_user_card()
+
+        @register("team")
+        class Team(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>
+                    {{ lead }}:
+                    {% for user_id in members %}{% component "user_card" user_id=user_id / %}{% endfor %}
+                </div>
+            """
+
+            def get_context_data(self, lead_id, members):
+                return {"lead": self.load(load_users, lead_id), "members": members}
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% component "team" lead_id=1 members=members_1 / %}
+            {% component "team" lead_id=2 members=members_2 / %}
+            """
+        )
+        rendered = template.render(Context({"members_1": [2], "members_2": [3]}))
+
+        self.assertEqual(self.calls, [[1, 2], [3]])
+        self.assertHTMLEqual(
+            rendered,
+            "<div>John: <p>Mary</p></div><div>Mary: <p>Peter</p></div>",
+        )
+
+    def test_values_in_lists_and_loader_returning_list(self):
+        calls = []
+
+        def load_names(user_ids):
+            calls.append(user_ids)
+            return [USERS[user_id] for user_id in user_ids]
+
+        class UserList(Component):
+            template = "{% for user in users %}{{ user }},{% endfor %}"
+
+            def get_context_data(self, user_ids):
+                users = [self.load(load_names, user_id) for user_id in user_ids]
+                assert all(isinstance(user, LoadedValue) for user in users)
+                return {"users": users}
+
+        rendered = UserList.render(kwargs={"user_ids": [3, 1]}, render_dependencies=False)
+
+        self.assertEqual(calls, [[3, 1]])
+        self.assertIn("Peter,John,", rendered)
+
+    def test_loader_returning_wrong_number_of_values_raises(self):
+        def load_nothing(user_ids):
+            return []
+
+        class SimpleComponent(Component):
+            template = "{{ user }}"
+
+            def get_context_data(self):
+                return {"user": self.load(load_nothing, 1)}
+
+        with self.assertRaisesMessage(ValueError, "must return a value for each of the 1 keys"):
+            SimpleComponent.render()
+
+    def test_load_outside_get_context_data_raises(self):
+        class SimpleComponent(Component):
+            template = ""
+
+        with self.assertRaisesMessage(RuntimeError, "was called outside of 'get_context_data()'"):
+            SimpleComponent().load(self.load_users, 1)
+
+    def test_slots_of_postponed_component(self):
+        load_users = self.load_users
+
+        @register("user_card")
+        class UserCard(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <p>{{ user }} {% slot "extra" default / %}</p>
+            """
+
+            def get_context_data(self, user_id):
+                return {"user": self.load(load_users, user_id)}
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% for user_id in user_ids %}
+                {% component "user_card" user_id=user_id %}<b>{{ user_id }}</b>{% endcomponent %}
+            {% endfor %}
+            """
+        )
+        rendered = template.render(Context({"user_ids": [1, 2]}))
+
+        self.assertEqual(self.calls, [[1, 2]])
+        self.assertHTMLEqual(rendered, "<p>John <b>1</b></p><p>Mary <b>2</b></p>")
+
+    def test_async_components_loaded_in_single_batch(self):
+        load_users = self.load_users
+
+        @register("user_card")
+        class UserCard(Component):
+            template = "<p>{{ user }}</p>"
+
+            async def get_context_data(self, user_id):
+                return {"user": self.load(load_users, user_id)}
+
+        class UserList(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% for user_id in user_ids %}{% component "user_card" user_id=user_id / %}{% endfor %}
+            """
+
+            def get_context_data(self, user_ids):
+                return {"user_ids": user_ids}
+
+        rendered = asyncio.run(UserList.arender(kwargs={"user_ids": [1, 2, 3]}, render_dependencies=False))
+
+        self.assertEqual(self.calls, [[1, 2, 3]])
+        self.assertHTMLEqual(rendered, "<p>John</p><p>Mary</p><p>Peter</p>")
+
+    def test_streamed_chunks_loaded_in_single_batch(self):
+        self._register_user_card()
+
+        class UserList(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <header>Users</header>
+                <ul>{% for user_id in user_ids %}{% component "user_card" user_id=user_id / %}{% endfor %}</ul>
+            """
+
+            def get_context_data(self, user_ids):
+                return {"user_ids": user_ids}
+
+        chunks = list(UserList.render_to_stream(kwargs={"user_ids": [1, 2, 3]}, render_dependencies=False))
+
+        self.assertEqual(self.calls, [[1, 2, 3]])
+        self.assertNotIn("_BATCHED", "".join(chunks))
+        self.assertHTMLEqual("".join(chunks), "<header>Users</header><ul><p>John</p><p>Mary</p><p>Peter</p></ul>")
+
+    def test_postponed_component_in_loop_keeps_loop_variables(self):
+        load_users = self.load_users
+
+        @register("user_card")
+        class UserCard(Component):
+            # NOTE: With the "django" context behavior, the outer `forloop` is available in the template
+            template = "<p>{{ forloop.counter }}-{{ user }}</p>"
+
+            def get_context_data(self, user_id):
+                return {"user": self.load(load_users, user_id)}
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% for user_id in user_ids %}{% component "user_card" user_id=user_id / %}{% endfor %}
+            """
+        )
+        rendered = template.render(Context({"user_ids": [1, 2, 3]}))
+
+        self.assertEqual(self.calls, [[1, 2, 3]])
+        self.assertHTMLEqual(rendered, "<p>1-John</p><p>2-Mary</p><p>3-Peter</p>")
@@ -1,10 +1,31 @@
-from unittest.mock import Mock
+import gzip
+import re
+from tempfile import TemporaryDirectory
+from typing import cast
+from unittest.mock import Mock, patch
 
+from django.core.cache import caches
 from django.http import HttpResponseNotModified
 from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+from django.urls import resolve
 
-from django_components import Component, registry, render_dependencies, types
+from django_components import Component, dependencies, registry, render_dependencies, types
 from django_components.components.dynamic import DynamicComponent
+from django_components.dependencies import (
+    DjangoCacheComponentMediaCache,
+    FileSystemComponentMediaCache,
+    InMemoryComponentMediaCache,
+    ScriptType,
+    _gen_cache_key,
+    _get_media_tags,
+    _hash_comp_cls,
+    cache_inlined_js,
+    cached_script_view,
+    comp_hash_mapping,
+    comp_media_cache,
+    get_script_url,
+)
 from django_components.middleware import ComponentDependencyMiddleware
 from django_components.util.html import SoupNode
 
@@ -72,6 +93,28 @@ class RenderDependenciesTests(BaseTestCase):
 
         self.assertInHTML('<link href="style.css" media="all" rel="stylesheet">', rendered, count=1)  # Media.css
 
+    def test_render_dependencies_of_html_rendered_within_other_render(self):
+        registry.register(name="test", component=SimpleComponent)
+        captured = []
+
+        class Outer(Component):
+            template = "Outer"
+
+            def get_context_data(self):
+                # E.g. HTML that's sent in a JSON response
+                captured.append(SimpleComponent.render(kwargs={"variable": "foo"}, render_dependencies=False))
+                return {}
+
+        Outer.render()
+
+        rendered_raw = captured[0]
+        self.assertEqual(rendered_raw.count("_RENDERED"), 1)
+
+        rendered = render_dependencies(f"<html><head></head><body>{rendered_raw}</body></html>")
+
+        self.assertInHTML("<style>.xyz { color: red; }</style>", rendered, count=1)  # Inlined CSS
+        self.assertInHTML('<script>console.log("xyz");</script>', rendered, count=1)  # Inlined JS
+
     def test_middleware_renders_dependencies(self):
         registry.register(name="test", component=SimpleComponent)
 
@@ -184,6 +227,138 @@ class RenderDependenciesTests(BaseTestCase):
         self.assertEqual(rendered.count("<link"), 1)
         self.assertEqual(rendered.count("<style"), 1)
 
+    def test_media_tags_rendered_once_per_component_class(self):
+        class MediaComponent(SimpleComponent):
+            pass
+
+        with patch.object(SoupNode, "from_fragment", wraps=SoupNode.from_fragment) as from_fragment_mock:
+            rendered1 = MediaComponent.render(kwargs={"variable": "foo"}, type="fragment")
+            rendered2 = MediaComponent.render(kwargs={"variable": "bar"}, type="fragment")
+
+        # The `<script>` and `<link>` tags from `Media` are parsed only on the first render
+        self.assertEqual(from_fragment_mock.call_count, 2)
+        self.assertEqual(rendered1.replace("foo", "bar"), rendered2)
+
+        media_tags = _get_media_tags(MediaComponent)
+        self.assertEqual(media_tags.js, [('<script src="script.js"></script>', "script.js")])
+        self.assertEqual(media_tags.css, [('<link href="style.css" media="all" rel="stylesheet">', "style.css")])
+        js_url = media_tags.js_endpoint[1]  # type: ignore[index]
+        self.assertRegex(js_url, r"^/components/cache/MediaComponent_\w{6}\.\w{12}\.js$")
+        self.assertIs(_get_media_tags(MediaComponent), media_tags)
+
+    def test_media_tags_updated_when_settings_change(self):
+        class MediaComponent(SimpleComponent):
+            pass
+
+        self.assertEqual(_get_media_tags(MediaComponent).css[0][1], "style.css")
+        with self.settings(STATIC_URL="/assets/"):
+            self.assertEqual(_get_media_tags(MediaComponent).css[0][1], "/assets/style.css")
+        self.assertEqual(_get_media_tags(MediaComponent).css[0][1], "style.css")
+
+    def test_dependency_tags_cached_per_component_set(self):
+        class MediaComponent(SimpleComponent):
+            pass
+
+        class OtherMediaComponent(SimpleComponent):
+            class Media:
+                js = "other.js"
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component_js_dependencies %}
+                {% component_css_dependencies %}
+                {% component "media" variable=variable / %}
+                {% if other %}{% component "other" variable=variable / %}{% endif %}
+            """
+
+            def get_context_data(self, variable, other=False):
+                return {"variable": variable, "other": other}
+
+        registry.register(name="media", component=MediaComponent)
+        registry.register(name="other", component=OtherMediaComponent)
+
+        with patch.object(dependencies, "_render_dep_tags", wraps=dependencies._render_dep_tags) as render_mock:
+            rendered1 = Page.render(kwargs={"variable": "foo"})
+            rendered2 = Page.render(kwargs={"variable": "bar"})
+            self.assertEqual(render_mock.call_count, 1)
+            self.assertEqual(rendered1.replace("foo", "bar"), rendered2)
+
+            # Different set of components
+            rendered3 = Page.render(kwargs={"variable": "foo", "other": True})
+            self.assertEqual(render_mock.call_count, 2)
+            self.assertIn('<script src="other.js"></script>', rendered3)
+
+            # Different render type
+            Page.render(kwargs={"variable": "foo"}, type="fragment")
+            self.assertEqual(render_mock.call_count, 3)
+
+            # Settings changed
+            with self.settings(STATIC_URL="/assets/"):
+                rendered4 = Page.render(kwargs={"variable": "foo"})
+            self.assertEqual(render_mock.call_count, 4)
+            self.assertIn('<script src="/assets/script.js"></script>', rendered4)
+
+    def test_bundle_dependencies(self):
+        class FirstComponent(SimpleComponent):
+            js: types.js = 'console.log("first");'
+            css: types.css = ".first { color: red; }"
+
+        class SecondComponent(SimpleComponent):
+            js: types.js = 'console.log("second");'
+            css: types.css = ".second { color: blue; }"
+
+        class Page(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                    <head></head>
+                    <body>
+                        {% component "first" variable="foo" / %}
+                        {% component "second" variable="foo" / %}
+                    </body>
+                </html>
+            """
+
+        registry.register(name="first", component=FirstComponent)
+        registry.register(name="second", component=SecondComponent)
+
+        with override_settings(COMPONENTS={"bundle_dependencies": True}):
+            rendered = Page.render()
+
+        # JS and CSS of the components are not inlined
+        self.assertNotIn("console.log", rendered)
+        self.assertNotIn("<style", rendered)
+
+        css_urls = re.findall(r'<link href="(/components/cache/bundle_\w{12}\.css\?components=[^"]+)"', rendered)
+        js_urls = re.findall(r'<script src="(/components/cache/bundle_\w{12}\.js\?components=[^"]+)"', rendered)
+        self.assertEqual(len(css_urls), 1)
+        self.assertEqual(len(js_urls), 1)
+        css_url = css_urls[0]
+        js_url = js_urls[0]
+
+        def get(url: str):
+            bundle_name, script_type = url.split("?")[0].split("/")[-1].split(".")
+            return cached_script_view(RequestFactory().get(url), bundle_name, cast(ScriptType, script_type))
+
+        css_response = get(css_url)
+        self.assertEqual(css_response.status_code, 200)
+        self.assertEqual(css_response["Content-Type"], "text/css")
+        self.assertEqual(css_response.content.decode(), ".first { color: red; }\n.second { color: blue; }")
+
+        js_response = get(js_url)
+        self.assertEqual(js_response.status_code, 200)
+        self.assertEqual(js_response.content.decode(), 'console.log("first");\n;\nconsole.log("second");')
+
+        # The bundle can be created again, e.g. by a different process
+        bundle_name = js_url.split("/")[-1].split(".")[0]
+        del comp_media_cache._data[_gen_cache_key(bundle_name, "js")]
+        self.assertEqual(get(js_url).content, js_response.content)
+
+        # But only if it's the same bundle
+        del comp_media_cache._data[_gen_cache_key(bundle_name, "js")]
+        self.assertEqual(get(js_url.split(",")[0]).status_code, 404)
+
     def test_inserts_styles_and_script_to_default_places_if_not_overriden(self):
         registry.register(name="test", component=SimpleComponent)
 
@@ -231,6 +406,30 @@ class RenderDependenciesTests(BaseTestCase):
             count=1,
         )
 
+    def test_inserting_to_default_places_keeps_html_unchanged(self):
+        registry.register(name="test", component=SimpleComponent)
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            <!DOCTYPE html>
+            <HTML>
+                <HEAD><!-- </head> --></HEAD>
+                <BODY>
+                    <div class=abc data-x='"'>{% component "test" variable="foo" / %}</div><br/>
+                    <script>const html = "</body>";</script>
+                </BODY>
+            </HTML>
+        """
+        rendered_raw = Template(template_str).render(Context({}))
+        rendered = render_dependencies(rendered_raw)
+
+        self.assertIn("<HEAD><!-- </head> --><style>.xyz {", rendered)
+        self.assertIn('</style><link href="style.css" media="all" rel="stylesheet"></HEAD>', rendered)
+        self.assertIn("<div class=abc data-x='\"'>", rendered)
+        self.assertIn("</div><br/>", rendered)
+        self.assertRegex(rendered, r'<script>const html = "</body>";</script>\s*<script')
+        self.assertRegex(rendered, r'<script>console.log\("xyz"\);</script></BODY>')
+
     def test_does_not_insert_styles_and_script_to_default_places_if_overriden(self):
         registry.register(name="test", component=SimpleComponent)
 
@@ -395,9 +594,9 @@ class RenderDependenciesTests(BaseTestCase):
 
         # Base64 encodings:
         # `PGxpbmsgaHJlZj0ic3R5bGUuY3NzIiBtZWRpYT0iYWxsIiByZWw9InN0eWxlc2hlZXQiPg==` -> `<link href="style.css" media="all" rel="stylesheet">`  # noqa: E501
-        # `PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny5jc3MiIG1lZGlhPSJhbGwiIHJlbD0ic3R5bGVzaGVldCI+` -> `<link href="/components/cache/SimpleComponent_311097.css" media="all" rel="stylesheet">`  # noqa: E501
+        # `PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny42MDNmN2UyNjRhYTQuY3NzIiBtZWRpYT0iYWxsIiByZWw9InN0eWxlc2hlZXQiPg==` -> `<link href="/components/cache/SimpleComponent_311097.603f7e264aa4.css" media="all" rel="stylesheet">`  # noqa: E501
         # `PHNjcmlwdCBzcmM9InNjcmlwdC5qcyI+PC9zY3JpcHQ+` -> `<script src="script.js"></script>`
-        # `PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuanMiPjwvc2NyaXB0Pg==` -> `<script src="/components/cache/SimpleComponent_311097.js"></script>`  # noqa: E501
+        # `PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuOWViNzk0YmRmNDQ4LmpzIj48L3NjcmlwdD4=` -> `<script src="/components/cache/SimpleComponent_311097.9eb794bdf448.js"></script>`  # noqa: E501
         expected = """
             <table class="table-auto border-collapse divide-y divide-x divide-slate-300 w-full">
                 <!-- Table head -->
@@ -424,9 +623,9 @@ class RenderDependenciesTests(BaseTestCase):
                 {"loadedCssUrls": [],
                 "loadedJsUrls": [],
                 "toLoadCssTags": ["PGxpbmsgaHJlZj0ic3R5bGUuY3NzIiBtZWRpYT0iYWxsIiByZWw9InN0eWxlc2hlZXQiPg==",
-                    "PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny5jc3MiIG1lZGlhPSJhbGwiIHJlbD0ic3R5bGVzaGVldCI+"],
+                    "PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny42MDNmN2UyNjRhYTQuY3NzIiBtZWRpYT0iYWxsIiByZWw9InN0eWxlc2hlZXQiPg=="],
                 "toLoadJsTags": ["PHNjcmlwdCBzcmM9InNjcmlwdC5qcyI+PC9zY3JpcHQ+",
-                "PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuanMiPjwvc2NyaXB0Pg=="]}
+                "PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuOWViNzk0YmRmNDQ4LmpzIj48L3NjcmlwdD4="]}
             </script>
         """  # noqa: E501
 
@@ -505,3 +704,163 @@ class MiddlewareTests(BaseTestCase):
             self.assertInHTML('<link href="style.css" media="all" rel="stylesheet">', rendered, count=1)
 
             self.assertEqual(rendered.count("Variable: <strong>value</strong>"), 1)
+
+
+class CachedScriptViewTests(BaseTestCase):
+    def _get(self, url: str, **headers):
+        match = resolve(url)
+        return match.func(RequestFactory().get(url, headers=headers), **match.kwargs)
+
+    def test_url_contains_content_hash(self):
+        cache_inlined_js(SimpleComponent, SimpleComponent.js)
+
+        url = get_script_url("js", SimpleComponent)
+        self.assertRegex(url, r"^/components/cache/SimpleComponent_\w{6}\.\w{12}\.js$")
+
+        response = self._get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode(), 'console.log("xyz");')
+        self.assertEqual(response["Content-Type"], "text/javascript")
+        self.assertRegex(response["ETag"], r'^"\w{32}"$')
+        self.assertIn(url.split(".")[-2], response["ETag"])
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+
+    def test_url_without_content_hash(self):
+        cache_inlined_js(SimpleComponent, SimpleComponent.js)
+
+        name, content_hash, _ = get_script_url("js", SimpleComponent).split("/")[-1].split(".")
+
+        # Without the hash, or with a hash of a different content, the browser must revalidate the script
+        urls = [
+            f"/components/cache/{name}.js",
+            f"/components/cache/{name}.000000000000.js",
+            # Only a part of the hash
+            f"/components/cache/{name}.{content_hash[0]}.js",
+        ]
+        for url in urls:
+            response = self._get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content.decode(), 'console.log("xyz");')
+            self.assertEqual(response["Cache-Control"], "no-cache")
+
+    def test_unknown_script_type(self):
+        # The component is known, as it was rendered
+        SimpleComponent.render(kwargs={"variable": "foo"})
+
+        name = get_script_url("js", SimpleComponent).split("/")[-1].split(".")[0]
+
+        response = self._get(f"/components/cache/{name}.txt")
+        self.assertEqual(response.status_code, 404)
+
+    def test_conditional_get(self):
+        cache_inlined_js(SimpleComponent, SimpleComponent.js)
+        url = get_script_url("js", SimpleComponent)
+
+        etag = self._get(url)["ETag"]
+        response = self._get(url, if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+        response = self._get(url, if_none_match='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_compression(self):
+        class BigComponent(SimpleComponent):
+            js: types.js = "console.log('Hello world!');\n" * 100
+
+        cache_inlined_js(BigComponent, BigComponent.js)
+        url = get_script_url("js", BigComponent)
+
+        response = self._get(url, accept_encoding="gzip, deflate")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content).decode(), BigComponent.js.strip())
+        self.assertLess(len(response.content), len(BigComponent.js))
+        etag = response["ETag"]
+        self.assertRegex(etag, r'^"\w{32}-gzip"$')
+
+        # The compressed variant is cached
+        with patch("gzip.compress") as compress_mock:
+            response = self._get(url, accept_encoding="gzip")
+        compress_mock.assert_not_called()
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+        self.assertEqual(self._get(url, accept_encoding="gzip", if_none_match=etag).status_code, 304)
+
+        # Without accepting the encoding, the content is not compressed
+        response = self._get(url)
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.content.decode(), BigComponent.js.strip())
+        self.assertEqual(self._get(url, if_none_match=etag).status_code, 200)
+
+
+class MediaCacheTests(BaseTestCase):
+    def _get(self, url: str):
+        match = resolve(url)
+        return match.func(RequestFactory().get(url), **match.kwargs)
+
+    def test_filesystem_media_cache(self):
+        with TemporaryDirectory() as tmp_dir:
+            media_cache = FileSystemComponentMediaCache(f"{tmp_dir}/components")
+            self.assertIsNone(media_cache.get("__components:abc:js"))
+            self.assertFalse(media_cache.has("__components:abc:js"))
+
+            media_cache.set("__components:abc:js", "console.log('abc');")
+            media_cache.set("__components:abc:js:gzip", b"\x1f\x8b")
+
+            # The entries are shared by all instances that use the same directory
+            other_media_cache = FileSystemComponentMediaCache(f"{tmp_dir}/components")
+            self.assertTrue(other_media_cache.has("__components:abc:js"))
+            self.assertEqual(other_media_cache.get("__components:abc:js"), "console.log('abc');")
+            self.assertEqual(other_media_cache.get("__components:abc:js:gzip"), b"\x1f\x8b")
+
+    def test_django_cache_media_cache(self):
+        media_cache = DjangoCacheComponentMediaCache("default")
+
+        with override_settings(COMPONENTS={"media_cache": media_cache}):
+            cache_inlined_js(SimpleComponent, SimpleComponent.js)
+            url = get_script_url("js", SimpleComponent)
+
+            cache_key = _gen_cache_key(_hash_comp_cls(SimpleComponent), "js")
+            self.assertEqual(caches["default"].get(cache_key), 'console.log("xyz");')
+            self.assertTrue(media_cache.has(cache_key))
+
+            response = self._get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content.decode(), 'console.log("xyz");')
+            self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+
+    def test_script_cached_again_when_media_cache_changes(self):
+        cache_inlined_js(SimpleComponent, SimpleComponent.js)
+        cache_key = _gen_cache_key(_hash_comp_cls(SimpleComponent), "js")
+
+        media_cache = InMemoryComponentMediaCache()
+        with override_settings(COMPONENTS={"media_cache": media_cache}):
+            cache_inlined_js(SimpleComponent, SimpleComponent.js)
+            self.assertEqual(media_cache.get(cache_key), 'console.log("xyz");')
+
+    def test_script_cached_again_when_content_changes(self):
+        media_cache = InMemoryComponentMediaCache()
+        with override_settings(COMPONENTS={"media_cache": media_cache}):
+            cache_key = _gen_cache_key(_hash_comp_cls(SimpleComponent), "js")
+
+            # E.g. the entry was created by a previous version of the component
+            media_cache.set(cache_key, 'console.log("old");')
+
+            cache_inlined_js(SimpleComponent, SimpleComponent.js)
+            self.assertEqual(media_cache.get(cache_key), 'console.log("xyz");')
+
+    def test_view_caches_missing_script_of_known_component(self):
+        comp_cls_hash = _hash_comp_cls(SimpleComponent)
+        comp_hash_mapping[comp_cls_hash] = SimpleComponent
+
+        # E.g. the component was rendered only by another process
+        with override_settings(COMPONENTS={"media_cache": InMemoryComponentMediaCache()}):
+            response = self._get(f"/components/cache/{comp_cls_hash}.js")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content.decode(), 'console.log("xyz");')
+
+            response = self._get("/components/cache/UnknownComponent_abc123.js")
+            self.assertEqual(response.status_code, 404)
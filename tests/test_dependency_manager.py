@@ -69,6 +69,7 @@ class DependencyManagerTests(_BaseDepManagerTestCase):
                 "loadJs",
                 "loadCss",
                 "markScriptLoaded",
+                "swapDeferred",
             ],
         )
 
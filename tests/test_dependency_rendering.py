@@ -4,10 +4,11 @@ During actual rendering, the HTML is then picked up by the JS-side dependency ma
 """
 
 import re
+from unittest.mock import patch
 
-from django.template import Template
+from django.template import Context, Template
 
-from django_components import Component, registry, types
+from django_components import Component, dependencies, registry, render_dependencies_stream, types
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase, create_and_process_template_response
@@ -455,18 +456,18 @@ class DependencyRenderingTests(BaseTestCase):
         # `c3R5bGUuY3Nz` -> `style.css`
         # `c3R5bGUyLmNzcw==` -> `style2.css`
         # `eHl6MS5jc3M=` -> `xyz1.css`
-        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmNzcw==` -> `/components/cache/OtherComponent_6329ae.css`
-        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5jc3M=` -> `/components/cache/SimpleComponentNested_f02d32.css`
-        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmpz` -> `/components/cache/OtherComponent_6329ae.js`
-        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5qcw==` -> `/components/cache/SimpleComponentNested_f02d32.js`
+        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLjYwM2Y3ZTI2NGFhNC5jc3M=` -> `/components/cache/OtherComponent_6329ae.603f7e264aa4.css`
+        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi4xNjhkMWJhZWVmNmQuY3Nz` -> `/components/cache/SimpleComponentNested_f02d32.168d1baeef6d.css`
+        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLjllYjc5NGJkZjQ0OC5qcw==` -> `/components/cache/OtherComponent_6329ae.9eb794bdf448.js`
+        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi44MDg3MDE1ZjY2MTIuanM=` -> `/components/cache/SimpleComponentNested_f02d32.8087015f6612.js`
         # `c2NyaXB0Lmpz` -> `script.js`
         # `c2NyaXB0Mi5qcw==` -> `script2.js`
         # `eHl6MS5qcw==` -> `xyz1.js`
         self.assertInHTML(
             """
             <script type="application/json" data-djc>
-                {"loadedCssUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmNzcw==", "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5jc3M=", "c3R5bGUuY3Nz", "c3R5bGUyLmNzcw==", "eHl6MS5jc3M="],
-                "loadedJsUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmpz", "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5qcw==", "c2NyaXB0Lmpz", "c2NyaXB0Mi5qcw==", "eHl6MS5qcw=="],
+                {"loadedCssUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLjYwM2Y3ZTI2NGFhNC5jc3M=", "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi4xNjhkMWJhZWVmNmQuY3Nz", "c3R5bGUuY3Nz", "c3R5bGUyLmNzcw==", "eHl6MS5jc3M="],
+                "loadedJsUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLjllYjc5NGJkZjQ0OC5qcw==", "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi44MDg3MDE1ZjY2MTIuanM=", "c2NyaXB0Lmpz", "c2NyaXB0Mi5qcw==", "eHl6MS5qcw=="],
                 "toLoadCssTags": [],
                 "toLoadJsTags": []}
             </script>
@@ -491,3 +492,159 @@ class DependencyRenderingTests(BaseTestCase):
         template = Template(template_str)
         rendered = create_and_process_template_response(template)
         self.assertNotIn("_RENDERED", rendered)
+
+    def test_rendered_components_collected_without_scanning_html(self):
+        registry.register(name="inner", component=SimpleComponent)
+
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component_js_dependencies %}
+                {% component_css_dependencies %}
+                {% component 'inner' variable='variable' / %}
+            """
+
+        with patch(
+            "django_components.dependencies._extract_dep_declarations",
+            wraps=dependencies._extract_dep_declarations,
+        ) as extract_mock:
+            rendered = Outer.render()
+
+        extract_mock.assert_not_called()
+        self.assertNotIn("_RENDERED", rendered)
+        self.assertInHTML('<script src="script.js"></script>', rendered, count=1)
+        self.assertInHTML('<link href="style.css" media="all" rel="stylesheet">', rendered, count=1)
+
+    def test_dependencies_of_components_in_cache_tag(self):
+        registry.register(name="test", component=OtherComponent)
+
+        class Outer(Component):
+            template: types.django_html = """
+                {% load cache component_tags %}
+                {% component_js_dependencies %}
+                {% component_css_dependencies %}
+                {% cache 60 djc_test_cached_component %}
+                    {% component 'test' variable='foo' / %}
+                {% endcache %}
+            """
+
+        first = Outer.render()
+        second = Outer.render()
+
+        # The second render reads the component's HTML from the cache,
+        # and its dependencies are still rendered
+        for rendered in (first, second):
+            self.assertNotIn("_RENDERED", rendered)
+            self.assertEqual(rendered.count('<script>console.log("xyz");</script>'), 1)
+            self.assertEqual(rendered.count(".xyz {"), 1)
+
+    def test_dependencies_of_parent_before_child(self):
+        class Child(Component):
+            template = "Child"
+            js: types.js = "console.log('child');"
+            css: types.css = ".child {}"
+
+        class Parent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component_js_dependencies %}
+                {% component_css_dependencies %}
+                {% component 'child' / %}
+            """
+            js: types.js = "console.log('parent');"
+            css: types.css = ".parent {}"
+
+        registry.register(name="child", component=Child)
+
+        rendered = Parent.render()
+
+        self.assertLess(rendered.index("console.log('parent');"), rendered.index("console.log('child');"))
+        self.assertLess(rendered.index(".parent {}"), rendered.index(".child {}"))
+
+
+class DependencyStreamRenderingTests(BaseTestCase):
+    def _render_chunks(self, template: Template):
+        context = Context({})
+        return [node.render(context) for node in template.nodelist]
+
+    def test_css_before_head_end_and_js_before_body_end(self):
+        registry.register(name="test", component=OtherComponent)
+
+        template = Template(
+            """
+            {% load component_tags %}
+            <html><head>{% component 'test' variable='foo' / %}</head>
+            <body><main>content</main></body></html>
+            """
+        )
+        chunks = list(render_dependencies_stream(self._render_chunks(template)))
+        rendered = "".join(chunks)
+
+        self.assertNotIn("_RENDERED", rendered)
+        self.assertLess(rendered.index("<style>.xyz"), rendered.index("</head>"))
+        self.assertLess(rendered.index("<main>"), rendered.index('<script>console.log("xyz");</script>'))
+        self.assertRegex(rendered, r'<script>console.log\("xyz"\);</script>\s*</body>')
+        self.assertEqual(rendered.count("django_components.min.js"), 1)
+
+        # CSS is sent together with the chunk that closes the `<head>`, before the `<body>` is rendered
+        head_chunk = next(chunk for chunk in chunks if "</head>" in chunk)
+        self.assertIn(".xyz", head_chunk)
+
+    def test_component_after_head_end(self):
+        registry.register(name="test", component=OtherComponent)
+
+        template = Template(
+            """
+            {% load component_tags %}
+            <html><head></head><body>
+            {% component 'test' variable='foo' / %}
+            </body></html>
+            """
+        )
+        chunks = list(render_dependencies_stream(self._render_chunks(template)))
+        rendered = "".join(chunks)
+
+        # The `<head>` was already sent, so the CSS is sent with the component
+        component_chunk = next(chunk for chunk in chunks if "XYZ" in chunk)
+        self.assertIn("<style>", component_chunk)
+        self.assertRegex(rendered, r'<script>console.log\("xyz"\);</script>\s*</body>')
+
+    def test_placeholders(self):
+        registry.register(name="test", component=OtherComponent)
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% component_css_dependencies %}
+            {% component 'test' variable='foo' / %}
+            {% component 'test' variable='bar' / %}
+            {% component_js_dependencies %}
+            """
+        )
+        rendered = "".join(render_dependencies_stream(self._render_chunks(template)))
+
+        self.assertNotIn("_PLACEHOLDER", rendered)
+        self.assertEqual(rendered.count("<style>"), 1)
+        self.assertEqual(rendered.count('<script>console.log("xyz");</script>'), 1)
+        # The CSS placeholder was sent before the component was rendered,
+        # so the CSS is sent with the component
+        self.assertLess(rendered.index("XYZ"), rendered.index("<style>"))
+        self.assertLess(rendered.index("<style>"), rendered.index("console.log"))
+
+    def test_fragment(self):
+        registry.register(name="test", component=OtherComponent)
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% component_css_dependencies %}
+            {% component 'test' variable='foo' / %}
+            {% component 'test' variable='bar' / %}
+            """
+        )
+        rendered = "".join(render_dependencies_stream(self._render_chunks(template), type="fragment"))
+
+        self.assertNotIn("_PLACEHOLDER", rendered)
+        self.assertNotIn("<style>", rendered)
+        self.assertNotIn("django_components.min.js", rendered)
+        self.assertEqual(rendered.count("<script type=\"application/json\" data-djc>"), 1)
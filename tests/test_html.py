@@ -1,6 +1,6 @@
 from django.test import TestCase
 
-from django_components.util.html import SoupNode
+from django_components.util.html import DocumentLocations, SoupNode, scan_document
 
 from .django_test_setup import setup_test_config
 
@@ -125,3 +125,55 @@ class HtmlTests(TestCase):
             </li>
             """,
         )
+
+
+class ScanDocumentTests(TestCase):
+    def test_finds_tags(self):
+        html = b"<!DOCTYPE html><HTML><Head><title>Hi</title></HEAD ><body class='x'><p>Hi</p></Body></html>"
+        self.assertEqual(
+            scan_document(html),
+            DocumentLocations(
+                head_start=html.index(b"<Head>"),
+                head_end=html.index(b"</HEAD >"),
+                body_start=html.index(b"<body"),
+                body_end=html.index(b"</Body>"),
+                html_end=None,  # Scanning stops at `</body>`
+            ),
+        )
+
+    def test_ignores_tags_in_comments_raw_text_and_attributes(self):
+        html = b"""
+            <html>
+                <head>
+                    <!-- </head> -->
+                    <!--></head-->
+                    <title></head></title>
+                    <script>document.write("</head></body>");</script>
+                    <style>/* </head> */</style>
+                </head>
+                <body>
+                    <thead><tbody></tbody></thead>
+                    <div title="</body>" data-x='</body>'></div>
+                    <textarea></body></textarea>
+                    <iframe srcdoc="<html><head></head><body></body></html>"></iframe>
+                </body>
+            </html>
+        """
+        locations = scan_document(html)
+        self.assertEqual(locations.head_start, html.index(b"<head>"))
+        self.assertEqual(locations.head_end, html.index(b"</head>\n"))
+        self.assertEqual(locations.body_start, html.index(b"<body>"))
+        self.assertEqual(locations.body_end, html.index(b"</body>\n"))
+
+    def test_missing_tags(self):
+        self.assertEqual(scan_document(b"<div>Hi</div>"), DocumentLocations(None, None, None, None, None))
+        self.assertEqual(
+            scan_document(b"<html><head><body>Hi</html>"),
+            DocumentLocations(head_start=6, head_end=None, body_start=12, body_end=None, html_end=20),
+        )
+        # Unterminated comment or script
+        self.assertEqual(scan_document(b"<!-- <head>"), DocumentLocations(None, None, None, None, None))
+        self.assertEqual(
+            scan_document(b"<body><script></body>"),
+            DocumentLocations(head_start=None, head_end=None, body_start=0, body_end=None, html_end=None),
+        )
@@ -1,9 +1,11 @@
 from pathlib import Path
 
+from django.conf import settings
 from django.test import override_settings
 
-from django_components import ComponentsSettings
+from django_components import ComponentRegistry, ComponentsSettings
 from django_components.app_settings import app_settings
+from django_components.component_registry import all_registries
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase
@@ -21,6 +23,19 @@ class SettingsTestCase(BaseTestCase):
         with self.assertRaises(ValueError):
             app_settings.CONTEXT_BEHAVIOR
 
+    def test_type_validation(self):
+        with override_settings(COMPONENTS={}):
+            self.assertEqual(app_settings.TYPE_VALIDATION, 1.0)
+        with override_settings(COMPONENTS={"type_validation": False}):
+            self.assertEqual(app_settings.TYPE_VALIDATION, 0.0)
+        with override_settings(COMPONENTS={"type_validation": 0.25}):
+            self.assertEqual(app_settings.TYPE_VALIDATION, 0.25)
+
+    @override_settings(COMPONENTS={"type_validation": 2})
+    def test_raises_on_invalid_type_validation(self):
+        with self.assertRaises(ValueError):
+            app_settings.TYPE_VALIDATION
+
     @override_settings(BASE_DIR="base_dir")
     def test_works_when_base_dir_is_string(self):
         self.assertEqual(app_settings.DIRS, [Path("base_dir/components")])
@@ -36,3 +51,40 @@ class SettingsTestCase(BaseTestCase):
     @override_settings(COMPONENTS=ComponentsSettings(context_behavior="isolated"))
     def test_settings_as_instance(self):
         self.assertEqual(app_settings.CONTEXT_BEHAVIOR, "isolated")
+
+    def test_settings_resolved_once(self):
+        self.assertIs(app_settings.DIRS, app_settings.DIRS)
+
+        version = app_settings.version
+        with override_settings(COMPONENTS={"context_behavior": "isolated"}):
+            self.assertEqual(app_settings.CONTEXT_BEHAVIOR, "isolated")
+            self.assertGreater(app_settings.version, version)
+        self.assertEqual(app_settings.CONTEXT_BEHAVIOR, "django")
+
+    @override_settings(COMPONENTS={"libraries": []})
+    def test_libraries_modified_in_place(self):
+        self.assertEqual(app_settings.LIBRARIES, [])
+
+        settings.COMPONENTS["libraries"] = ["tests.components.single_file"]
+        self.assertEqual(app_settings.LIBRARIES, ["tests.components.single_file"])
+
+    @override_settings(COMPONENTS={"context_behavior": "django"})
+    def test_settings_modified_in_place_need_reset(self):
+        self.assertEqual(app_settings.CONTEXT_BEHAVIOR, "django")
+
+        settings.COMPONENTS["context_behavior"] = "isolated"
+        self.assertEqual(app_settings.CONTEXT_BEHAVIOR, "django")
+
+        app_settings.reset()
+        self.assertEqual(app_settings.CONTEXT_BEHAVIOR, "isolated")
+
+    def test_registry_settings_follow_django_settings(self):
+        registry = ComponentRegistry()
+        self.assertIs(registry.settings, registry.settings)
+        self.assertEqual(registry.settings.context_behavior, "django")
+
+        with override_settings(COMPONENTS={"context_behavior": "isolated"}):
+            self.assertEqual(registry.settings.context_behavior, "isolated")
+        self.assertEqual(registry.settings.context_behavior, "django")
+
+        all_registries.remove(registry)
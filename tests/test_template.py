@@ -1,6 +1,14 @@
-from django.template import Context, Template
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
 
-from django_components import Component, cached_template, types
+from django.template import Context, Engine, Library, Template
+from django.template.base import Parser
+from django.test import override_settings
+
+from django_components import Component, ComponentRegistry, cached_template, register, types
+from django_components.component_registry import all_registries
+from django_components.template import monkeypatch_template_compile
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase
@@ -43,3 +51,163 @@ class TemplateCacheTest(BaseTestCase):
 
         template_2 = comp._get_template(Context({}))
         self.assertEqual(template_2._test_id, "123")
+
+    def test_static_template_is_bound_to_class(self):
+        class SimpleComponent(Component):
+            template = "Variable: <strong>{{ variable }}</strong>"
+
+        template_1 = SimpleComponent()._get_template(Context({}))
+
+        with patch("django_components.component.cached_template") as mock_cached_template:
+            template_2 = SimpleComponent()._get_template(Context({}))
+            mock_cached_template.assert_not_called()
+
+        self.assertIs(template_1, template_2)
+
+    def test_static_template_name_is_bound_to_class(self):
+        class SimpleComponent(Component):
+            template_name = "simple_template.html"
+
+        template_1 = SimpleComponent()._get_template(Context({}))
+
+        with patch("django_components.component.get_template") as mock_get_template:
+            template_2 = SimpleComponent()._get_template(Context({}))
+            mock_get_template.assert_not_called()
+
+        self.assertIs(template_1, template_2)
+
+    def test_bound_template_is_invalidated_on_settings_change(self):
+        class SimpleComponent(Component):
+            template_name = "simple_template.html"
+
+        SimpleComponent()._get_template(Context({}))
+
+        with override_settings(COMPONENTS={"template_cache_size": 64}):
+            with patch("django_components.component.get_template") as mock_get_template:
+                SimpleComponent()._get_template(Context({}))
+                mock_get_template.assert_called_once_with("simple_template.html")
+
+    def test_instance_template_overrides_bound_template(self):
+        class SimpleComponent(Component):
+            template = "Variable: <strong>{{ variable }}</strong>"
+
+        SimpleComponent()._get_template(Context({}))
+
+        comp = SimpleComponent()
+        comp.template = "Overriden: {{ variable }}"
+        rendered = comp.render(kwargs={}, context={"variable": "abc"})
+        self.assertEqual(rendered.strip(), "Overriden: abc")
+
+
+class PersistentTemplateCacheTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        monkeypatch_template_compile(Template)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_dir = Path(tmp_dir.name)
+
+    def test_parsed_template_is_loaded_from_disk(self):
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% for item in items %}
+                {% if item.value > 1 and item.name != "b" %}{{ item.name|upper }}{% endif %}
+            {% endfor %}
+        """
+        context = Context({"items": [{"name": "a", "value": 2}, {"name": "b", "value": 3}]})
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            expected = Template(template_str).render(context)
+            self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+            with patch.object(Parser, "parse") as parse:
+                rendered = Template(template_str).render(context)
+                parse.assert_not_called()
+
+        self.assertEqual(rendered, expected)
+        self.assertEqual(rendered.strip(), "A")
+
+    def test_component_template_is_persisted(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" default %}Default{% endslot %}</div>
+            """
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            expected = SimpleComponent.render(slots={"content": "Hello"})
+            self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+            with patch.object(Parser, "parse") as parse:
+                Template(SimpleComponent.template)
+                parse.assert_not_called()
+
+        self.assertHTMLEqual(expected, "<div>Hello</div>")
+
+    def test_cache_entry_depends_on_source(self):
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            Template("Variable: {{ variable }}")
+            Template("Variable: {{ variable }}")
+            Template("Other: {{ variable }}")
+
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
+
+    def test_cache_entry_depends_on_deterministic_ids(self):
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            Template("Variable: {{ variable }}")
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir, "deterministic_ids": True}):
+            Template("Variable: {{ variable }}")
+
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
+
+    def test_registry_persisted_by_library(self):
+        @register("simple")
+        class SimpleComponent(Component):
+            template = "Hello"
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "simple" / %}
+        """
+
+        other_registry = ComponentRegistry(library=Library())
+        self.addCleanup(all_registries.remove, other_registry)
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            Template(template_str)
+
+            # Other processes may create the registries in a different order
+            all_registries.remove(other_registry)
+            all_registries.insert(0, other_registry)
+
+            with patch.object(Parser, "parse") as parse:
+                template = Template(template_str)
+                parse.assert_not_called()
+
+            rendered = template.render(Context({}))
+
+        self.assertIn("Hello", rendered)
+
+    def test_registry_without_library_module_not_persisted(self):
+        library = Library()
+        other_registry = ComponentRegistry(library=library)
+        self.addCleanup(all_registries.remove, other_registry)
+
+        engine = Engine.get_default()
+        engine.template_builtins.append(library)
+        self.addCleanup(engine.template_builtins.remove, library)
+
+        @register("simple", registry=other_registry)
+        class SimpleComponent(Component):
+            template = "Hello"
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            rendered = Template('{% component "simple" / %}').render(Context({}))
+
+        self.assertIn("Hello", rendered)
+        # Only the template of the component was persisted
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+    def test_disabled_by_default(self):
+        Template("Variable: {{ variable }}")
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
@@ -649,6 +649,155 @@ class AggregateInputTests(BaseTestCase):
         )
 
 
+class PureComponentTests(BaseTestCase):
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_pure_component_rendered_once_per_input(self):
+        calls = []
+
+        @register("icon")
+        class Icon(Component):
+            pure = True
+            template = "<i class='{{ name }}'></i>"
+
+            def get_context_data(self, name):
+                calls.append(name)
+                return {"name": name}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% for name in names %}
+                {% component "icon" name=name / %}
+            {% endfor %}
+            {% component "icon" name=names.0 / %}
+        """
+        template = Template(template_str)
+        rendered = template.render(Context({"names": ["check", "cross", "check", "check"]}))
+
+        self.assertEqual(calls, ["check", "cross"])
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <i class="check"></i>
+            <i class="cross"></i>
+            <i class="check"></i>
+            <i class="check"></i>
+            <i class="check"></i>
+            """,
+        )
+
+        # Memo lasts only for a single render
+        template.render(Context({"names": ["check"]}))
+        self.assertEqual(calls, ["check", "cross", "check"])
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_pure_component_keeps_dependency_markers(self):
+        @register("icon")
+        class Icon(Component):
+            pure = True
+            template = "<i></i>"
+            js = "console.log('icon');"
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "icon" / %}
+            {% component "icon" / %}
+        """
+        rendered = Template(template_str).render(Context({}))
+
+        self.assertEqual(rendered.count("<!-- _RENDERED Icon_"), 2)
+        # Each tag keeps its own component ID
+        self.assertIn(",a1bc3e -->", rendered)
+        self.assertIn(",a1bc3f -->", rendered)
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_pure_component_reused_in_cache_tag_keeps_dependencies(self):
+        @register("inner")
+        class Inner(Component):
+            template = "<b></b>"
+            js = "console.log('inner');"
+
+        @register("icon")
+        class Icon(Component):
+            pure = True
+            template: types.django_html = """
+                {% load component_tags %}
+                <i>{% component "inner" / %}</i>
+            """
+
+        class First(Component):
+            template: types.django_html = """
+                {% load cache component_tags %}
+                {% component_js_dependencies %}
+                {% component "icon" / %}
+                {% cache 60 djc_test_pure_in_cache %}
+                    {% component "icon" / %}
+                {% endcache %}
+            """
+
+        class Second(Component):
+            template: types.django_html = """
+                {% load cache component_tags %}
+                {% component_js_dependencies %}
+                {% cache 60 djc_test_pure_in_cache %}
+                    {% component "icon" / %}
+                {% endcache %}
+            """
+
+        First.render()
+
+        # The HTML is read from the cache, and it must be marked with the nested components too
+        rendered = Second.render()
+        self.assertIn("console.log('inner');", rendered)
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_pure_component_not_memoized_with_fills_or_unhashable_inputs(self):
+        calls = []
+
+        @register("test")
+        class PureComponent(Component):
+            pure = True
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" default %}{% endslot %}</div>
+            """
+
+            def get_context_data(self, *args, **kwargs):
+                calls.append(1)
+                return {}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "test" %}A{% endcomponent %}
+            {% component "test" %}B{% endcomponent %}
+            {% component "test" items=items / %}
+            {% component "test" items=items / %}
+        """
+        rendered = Template(template_str).render(Context({"items": [1, 2]}))
+
+        self.assertEqual(len(calls), 4)
+        self.assertHTMLEqual(rendered, "<div>A</div><div>B</div><div></div><div></div>")
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_pure_component_distinguishes_value_types(self):
+        @register("test")
+        class PureComponent(Component):
+            pure = True
+            template = "{{ value }}"
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "test" value=1 / %}
+            {% component "test" value=True / %}
+        """
+        rendered = Template(template_str).render(Context({}))
+
+        self.assertIn("-->1", rendered)
+        self.assertIn("-->True", rendered)
+
+
 class ComponentTemplateSyntaxErrorTests(BaseTestCase):
     def setUp(self):
         super().setUp()
@@ -867,3 +867,38 @@ class InjectTest(BaseTestCase):
             <main></main>
             """,
         )
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_inject_nested_provides(self):
+        injected = []
+
+        @register("injectee")
+        class InjectComponent(Component):
+            template = ""
+
+            def get_context_data(self):
+                injected.append((self.inject("outer"), self.inject("inner")))
+                return {}
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% provide "outer" key=1 %}
+                {% provide "inner" key=2 %}
+                    {% provide "outer" key=3 %}
+                        {% component "injectee" / %}
+                    {% endprovide %}
+                    {% component "injectee" / %}
+                {% endprovide %}
+            {% endprovide %}
+        """
+        template = Template(template_str)
+        template.render(Context({}))
+        template.render(Context({}))
+
+        self.assertEqual(
+            [(outer.key, inner.key) for outer, inner in injected],
+            [(3, 2), (1, 2), (3, 2), (1, 2)],
+        )
+        # The class of the provided data is created only once for given keys
+        self.assertIs(type(injected[0][0]), type(injected[2][0]))
+        injected.clear()
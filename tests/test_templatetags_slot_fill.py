@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from django.template import Context, Template, TemplateSyntaxError
 
 from django_components import Component, Slot, register, registry, types
+from django_components.component import ComponentNode
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase, parametrize_context_behavior
@@ -2339,3 +2340,173 @@ class SlotInputTests(BaseTestCase):
 
         self.assertIsInstance(slots["footer"], Slot)
         self.assertEqual(slots["footer"](Context(), None, None), "FOOTER_SLOT")  # type: ignore[arg-type]
+
+
+class StaticFillAnalysisTests(BaseTestCase):
+    def _get_component_node(self, template_str: str):
+        template = Template("{% load component_tags %}" + template_str)
+        return template.nodelist.get_nodes_by_type(ComponentNode)[0]
+
+    def test_analyze_fills(self):
+        registry.register(name="test", component=SlottedComponent)
+
+        fills_node = self._get_component_node(
+            """
+            {% component "test" %}
+                {% fill "header" %}Header{% endfill %}
+                {% comment %} Comment {% endcomment %}
+                {% fill name=slot_name %}Main{% endfill %}
+            {% endcomponent %}
+            """
+        )
+        self.assertEqual(len(fills_node.static_fills), 2)
+
+        default_node = self._get_component_node(
+            """
+            {% component "test" %}
+                {% for item in items %}
+                    {% if item %}{{ item }}{% endif %}
+                    {% component "test" %}{% fill "header" %}Nested{% endfill %}{% endcomponent %}
+                {% endfor %}
+            {% endcomponent %}
+            """
+        )
+        self.assertEqual(default_node.static_fills, [])
+
+        for_node = self._get_component_node(
+            """
+            {% component "test" %}
+                {% for slot_name in slots %}{% fill name=slot_name %}Fill{% endfill %}{% endfor %}
+            {% endcomponent %}
+            """
+        )
+        self.assertIsNone(for_node.static_fills)
+
+        include_node = self._get_component_node(
+            """
+            {% component "test" %}{% include "slotted_template.html" %}{% endcomponent %}
+            """
+        )
+        self.assertIsNone(include_node.static_fills)
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_default_slot_rendered_once(self):
+        calls = []
+
+        def counter():
+            calls.append(1)
+            return "Counted"
+
+        @register("test")
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" default / %}</div>
+            """
+
+        template: types.django_html = """
+            {% load component_tags %}
+            {% component "test" %}{{ counter }}{% endcomponent %}
+        """
+        rendered = Template(template).render(Context({"counter": counter}))
+
+        self.assertHTMLEqual(rendered, "<div>Counted</div>")
+        self.assertEqual(len(calls), 1)
+
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_static_fills_in_loop(self):
+        registry.register(name="test", component=SlottedComponent)
+
+        template: types.django_html = """
+            {% load component_tags %}
+            {% for slot_name in slot_names %}
+                {% component "test" %}
+                    {% fill name=slot_name %}{{ slot_name }}: {{ forloop.counter }}{% endfill %}
+                {% endcomponent %}
+            {% endfor %}
+        """
+        rendered = Template(template).render(Context({"slot_names": ["header", "footer"]}))
+
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <custom-template>
+                <header>header: 1</header>
+                <main>Default main</main>
+                <footer>Default footer</footer>
+            </custom-template>
+            <custom-template>
+                <header>Default header</header>
+                <main>Default main</main>
+                <footer>footer: 2</footer>
+            </custom-template>
+            """,
+        )
+
+
+class SlotRenderFuncTests(BaseTestCase):
+    def test_slots_reused_across_renders(self):
+        captured_slots = []
+
+        @register("test")
+        class SlotCapture(SlottedComponent):
+            def get_context_data(self):
+                captured_slots.append(self.input.slots)
+                return {}
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% component "test" %}
+                {% fill "header" %}Custom header{% endfill %}
+                {% fill "main" %}Main {{ variable }}{% endfill %}
+            {% endcomponent %}
+            """
+        )
+        template.render(Context({"variable": 1}))
+        rendered = template.render(Context({"variable": 2}))
+
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <custom-template>
+                <header>Custom header</header>
+                <main>Main 2</main>
+                <footer>Default footer</footer>
+            </custom-template>
+            """,
+        )
+        first_slots, second_slots = captured_slots
+        self.assertIs(first_slots["header"], second_slots["header"])
+        self.assertIs(first_slots["main"], second_slots["main"])
+
+        # Text-only content does not depend on the context
+        self.assertEqual(first_slots["header"](Context(), {}, None), "Custom header")
+
+    @parametrize_context_behavior(["django"])
+    def test_fill_vars_below_component_data(self):
+        @register("test")
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" / %}</div>
+            """
+
+            def get_context_data(self):
+                return {"label": "component"}
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% for item in items %}
+                {% component "test" %}
+                    {% with label=item %}{% fill "content" %}{{ item }} {{ label }}{% endfill %}{% endwith %}
+                {% endcomponent %}
+            {% endfor %}
+            """
+        )
+        rendered = template.render(Context({"items": ["a", "b"]}))
+
+        # The for-loop variable `item` is available in the fill, but the variable `label`
+        # from the `{% with %}` tag is overriden by the component's data
+        self.assertHTMLEqual(rendered, "<div>a component</div><div>b component</div>")
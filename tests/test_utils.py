@@ -1,4 +1,5 @@
-from django_components.util.misc import is_str_wrapped_in_quotes
+from django_components.util.misc import ID_ALPHABET, gen_deterministic_id, is_str_wrapped_in_quotes
+from django_components.util.nanoid import generate
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase
@@ -18,3 +19,18 @@ class UtilsTest(BaseTestCase):
         self.assertEqual(is_str_wrapped_in_quotes(""), False)
         self.assertEqual(is_str_wrapped_in_quotes('""'), True)
         self.assertEqual(is_str_wrapped_in_quotes("\"'"), False)
+
+    def test_generate(self):
+        ids = [generate(ID_ALPHABET, size=6) for _ in range(1000)]
+        self.assertEqual(len(set(ids)), 1000)
+        for id in ids:
+            self.assertEqual(len(id), 6)
+            self.assertTrue(all(char in ID_ALPHABET for char in id))
+
+    def test_gen_deterministic_id(self):
+        id = gen_deterministic_id("template.html", 1, "component 'abc'")
+        self.assertEqual(len(id), 6)
+        self.assertTrue(all(char in ID_ALPHABET for char in id))
+
+        self.assertEqual(id, gen_deterministic_id("template.html", 1, "component 'abc'"))
+        self.assertNotEqual(id, gen_deterministic_id("template.html", 2, "component 'abc'"))
@@ -0,0 +1,80 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from django_components import Component, ComponentRegistry, registry, types, warmup
+from django_components.dependencies import _gen_cache_key, _hash_comp_cls, comp_hash_mapping, comp_media_cache
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
+
+setup_test_config({"autodiscover": False})
+
+
+class WarmupTest(BaseTestCase):
+    def test_warmup_prepares_component(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+            js = "console.log('warm');"
+            css = ".warm { color: red; }"
+
+        registry.register("simple", SimpleComponent)
+        comp_hash = _hash_comp_cls(SimpleComponent)
+
+        results = warmup()
+
+        self.assertIn(SimpleComponent, [result.component_cls for result in results])
+        binding = SimpleComponent._template_binding
+        assert binding is not None
+        self.assertIsNotNone(binding.template)
+        self.assertIs(comp_hash_mapping[comp_hash], SimpleComponent)
+        self.assertEqual(comp_media_cache.get(_gen_cache_key(comp_hash, "js")), "console.log('warm');")
+
+        # The first render doesn't need to compile the template anymore
+        with patch("django_components.component.cached_template") as cached_template:
+            SimpleComponent.render(kwargs={"variable": "foo"})
+            cached_template.assert_not_called()
+
+    def test_warmup_single_registry(self):
+        class SimpleComponent(Component):
+            template = "Hello"
+
+        class OtherComponent(Component):
+            template = "World"
+
+        my_registry = ComponentRegistry()
+        my_registry.register("simple", SimpleComponent)
+        registry.register("other", OtherComponent)
+
+        results = warmup(registry=my_registry)
+
+        self.assertEqual([(result.name, result.component_cls) for result in results], [("simple", SimpleComponent)])
+        self.assertIs(results[0].registry, my_registry)
+        self.assertIsNone(OtherComponent._template_binding)
+
+    def test_warmup_same_class_once(self):
+        class SimpleComponent(Component):
+            template = "Hello"
+
+        registry.register("first", SimpleComponent)
+        registry.register("second", SimpleComponent)
+
+        results = warmup(registry=registry)
+
+        self.assertEqual([result.name for result in results], ["first"])
+
+    def test_command(self):
+        class SimpleComponent(Component):
+            template = "Hello"
+
+        registry.register("simple", SimpleComponent)
+
+        out = StringIO()
+        call_command("warmcomponents", stdout=out)
+        output = out.getvalue()
+
+        self.assertIn("ms  simple\n", output)
+        self.assertIn("Warmed up", output)